@@ -0,0 +1,46 @@
+"""Benchmark of the import time of tkintertools
+
+Run `python benchmarks/import_time.py`, it reports the cumulative import time of some common entry
+points, which is measured by `python -X importtime` in a new interpreter each time. The modules
+imported by the interpreter itself at startup are not counted.
+"""
+
+import statistics
+import subprocess
+import sys
+
+STATEMENTS = (
+    "import tkintertools",
+    "import tkintertools.color",
+    "import tkintertools.animation.controllers",
+    "import tkintertools; tkintertools.Tk",
+    "import tkintertools; tkintertools.Button",
+)
+
+REPEAT = 7
+
+
+def measure(statement: str) -> int:
+    """Return the cumulative import time (us) of all top-level imports of the statement"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True, text=True, check=True)
+    total = 0
+    for line in result.stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            _, cumulative, name = line.split("|")
+            if cumulative.strip().isdigit() and not name.startswith("  "):
+                total += int(cumulative)  # Only count top-level imports
+    return total
+
+
+def main() -> None:
+    """Run the benchmark"""
+    baseline = statistics.median(measure("pass") for _ in range(REPEAT))
+    for statement in STATEMENTS:
+        times = [measure(statement) - baseline for _ in range(REPEAT)]
+        print(f"{statement:<45} {statistics.median(times)/1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
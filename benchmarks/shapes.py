@@ -0,0 +1,72 @@
+"""Benchmark of the standard shapes and their polygon and raster variants
+
+Run `python benchmarks/shapes.py`, it creates a grid of 1,000 button-like widgets for each shape and
+reports the number of canvas items, and the time of creating the widgets, updating their states,
+moving them and resizing them.
+"""
+
+import time
+
+from tkintertools.core import containers, virtual
+from tkintertools.standard import shapes
+
+SHAPES = (
+    (shapes.RoundedRectangle, {}),
+    (shapes.PolygonRoundedRectangle, {}),
+    (shapes.RasterRoundedRectangle, {}),
+    (shapes.HalfRoundedRectangle, {}),
+    (shapes.PolygonHalfRoundedRectangle, {}),
+    (shapes.SemicircularRectangle, {}),
+    (shapes.PolygonSemicircularRectangle, {}),
+    (shapes.RasterSemicircularRectangle, {}),
+)
+
+COLUMNS, ROWS = 25, 40
+
+SIZE = (100, 30)
+
+
+class Button(virtual.Widget):
+    """A widget that only has a shape, it uses the styles of `Button`"""
+
+
+def measure(method, *args) -> float:
+    """Return the time (ms) of calling the method"""
+    start = time.perf_counter()
+    method(*args)
+    return (time.perf_counter() - start) * 1000
+
+
+def main() -> None:
+    """Run the benchmark"""
+    root = containers.Tk(title="Benchmark")
+    canvas = containers.Canvas(root)
+    canvas.place(width=1280, height=720)
+    root.update()
+    print(f"{'shape':>30} {'items':>6} {'create':>9} {'update':>9} {'move':>9} {'coords':>9}")
+    for shape, kwargs in SHAPES:
+        widgets: list[Button] = []
+
+        def create() -> None:
+            for i in range(COLUMNS*ROWS):
+                position = (i % COLUMNS) * (SIZE[0]+4), (i // COLUMNS) * (SIZE[1]+4)
+                widget = Button(canvas, position, SIZE, animation=False)
+                shape(widget, **kwargs)  # pylint: disable=cell-var-from-loop
+                widgets.append(widget)
+
+        create_time = measure(create)
+        items = len(canvas.find_all())
+        update_time = measure(lambda: [widget.update("hover", no_delay=True) for widget in widgets])
+        move_time = measure(lambda: [widget.move(1, 1) for widget in widgets])
+        coords_time = measure(
+            lambda: [widget.shapes[0].coords((SIZE[0]+10, SIZE[1])) for widget in widgets])
+        root.update()
+        print(f"{shape.__name__:>30} {items:>6} {create_time:>7.1f}ms {update_time:>7.1f}ms "
+              f"{move_time:>7.1f}ms {coords_time:>7.1f}ms")
+        for widget in widgets:
+            widget.destroy()
+    root.destroy()
+
+
+if __name__ == "__main__":
+    main()
@@ -5,6 +5,7 @@ import tkinter
 import unittest
 
 from tkintertools.animation import animations, controllers
+from tkintertools.toolbox import tools
 
 
 class TestAnimation(unittest.TestCase):
@@ -36,6 +37,23 @@ class TestAnimation(unittest.TestCase):
         an.stop()
         self.assertEqual(an.is_active, False)
 
+    @unittest.skipIf(platform.system() == "Linux", "No display name.")
+    def test_start_async(self) -> None:
+        ends = []
+        an = animations.Animation(60, controllers.flat, end=lambda: ends.append(1), repeat=1)
+        an2 = animations.Animation(1000, controllers.flat)
+
+        async def main() -> None:
+            await an.start_async()
+            self.assertEqual(ends, [1, 1])
+            future = an2.start_async()
+            an2.stop()
+            self.assertTrue(future.cancelled())
+            self.tk.after(10, self.tk.destroy)
+
+        tools.run_async(self.tk, main())
+        self.tk = tkinter.Tk()
+
 
 class TestMoveTkWidget(unittest.TestCase):
 
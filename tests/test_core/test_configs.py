@@ -0,0 +1,28 @@
+# pylint: disable=all
+
+import unittest
+
+from tkintertools.core import configs
+
+
+class TestEnv(unittest.TestCase):
+
+    def tearDown(self) -> None:
+        configs.reset_configs()
+
+    def test_lazy_is_dark(self) -> None:
+        configs.Env.reset()
+        self.assertIsInstance(vars(configs.Env)["is_dark"], configs._IsDarkDescriptor)
+        self.assertIsInstance(configs.Env.is_dark, bool)
+        self.assertIsInstance(vars(configs.Env)["is_dark"], bool)
+
+    def test_set_is_dark(self) -> None:
+        configs.Env.reset()
+        configs.Env.is_dark = True
+        self.assertTrue(configs.Env.is_dark)
+        configs.Env.reset()
+        self.assertIsInstance(vars(configs.Env)["is_dark"], configs._IsDarkDescriptor)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,177 @@
+# pylint: disable=all
+
+import platform
+import unittest
+
+from tkintertools.core import containers, virtual
+from tkintertools.standard import shapes, texts
+
+
+class TestFreeze(unittest.TestCase):
+
+    @unittest.skipIf(platform.system() == "Linux", "No display name.")
+    def setUp(self) -> None:
+        self.tk = containers.Tk()
+        self.canvas = containers.Canvas(self.tk)
+        self.widget = virtual.Widget(self.canvas, (10, 10), (100, 40), animation=False)
+        self.shape = shapes.Rectangle(self.widget, styles={"normal": {"fill": "#FF0000", "outline": "#000000"}})
+        self.text = texts.Information(self.widget, text="text")
+        self.child = virtual.Widget(self.widget, (10, 10), (20, 20), animation=False)
+        self.oval = shapes.Oval(self.child, styles={"normal": {"fill": "#00FF00", "outline": ""}})
+
+    def tearDown(self) -> None:
+        self.tk.destroy()
+
+    def test_freeze(self) -> None:
+        self.widget.freeze()
+        if getattr(virtual.enhanced, "ImageTk", None) is None:
+            self.assertFalse(self.widget.is_frozen)
+            return
+        self.assertTrue(self.widget.is_frozen)
+        self.assertTrue(self.child.is_frozen)
+        layer = self.widget.layer
+        self.assertEqual(layer.items, self.shape.items + self.oval.items)
+        self.assertEqual(self.canvas.itemcget(self.shape.items[0], "state"), "hidden")
+        self.assertEqual(self.canvas.itemcget(self.text.items[0], "state"), "")
+        x, y = self.canvas.coords(layer.item)
+        self.widget.move(5, 5)
+        self.assertEqual(self.canvas.coords(layer.item), [x+5, y+5])
+        self.child.freeze()
+        self.assertIsNone(self.child.layer)
+        self.widget.thaw()
+        self.assertFalse(self.child.is_frozen)
+        self.assertIsNone(layer.item)
+        self.assertEqual(self.canvas.itemcget(self.shape.items[0], "state"), "")
+
+    @unittest.skipIf(getattr(virtual.enhanced, "ImageTk", None) is None, "Pillow is not installed.")
+    def test_canvas(self) -> None:
+        self.widget.freeze()
+        self.canvas.freeze()
+        self.assertIsNone(self.widget.layer)
+        self.assertTrue(self.child.is_frozen)
+        self.canvas.thaw()
+        self.assertFalse(self.canvas.is_frozen)
+        self.assertFalse(self.widget.is_frozen)
+
+    @unittest.skipIf(getattr(virtual.enhanced, "ImageTk", None) is None, "Pillow is not installed.")
+    def test_created_after(self) -> None:
+        self.widget.freeze()
+        child = virtual.Widget(self.widget, (0, 0), (10, 10), animation=False)
+        shapes.Rectangle(child)
+        self.assertFalse(child.is_frozen)
+        self.canvas.freeze()
+        other = virtual.Widget(self.canvas, (0, 0), (10, 10), animation=False)
+        self.assertTrue(child.is_frozen)
+        self.assertFalse(other.is_frozen)
+
+    @unittest.skipIf(getattr(virtual.enhanced, "ImageTk", None) is None, "Pillow is not installed.")
+    def test_destroy(self) -> None:
+        self.widget.freeze()
+        layer = self.widget.layer
+        self.child.destroy()
+        self.assertNotIn(self.child, layer.widgets)
+        self.assertEqual(layer.items, self.shape.items)
+        self.canvas.freeze()
+        self.widget.destroy()
+        self.assertIsNone(self.canvas.layer.item)
+
+
+class TestTags(unittest.TestCase):
+
+    @unittest.skipIf(platform.system() == "Linux", "No display name.")
+    def setUp(self) -> None:
+        self.tk = containers.Tk()
+        self.canvas = containers.Canvas(self.tk)
+        self.widget = virtual.Widget(self.canvas, (10, 10), (100, 40), animation=False)
+        self.shape = shapes.Rectangle(self.widget, styles={"normal": {"fill": "#FF0000", "outline": "#000000"}})
+        self.child = virtual.Widget(self.widget, (10, 10), (20, 20), animation=False)
+        self.oval = shapes.Oval(self.child, styles={"normal": {"fill": "#00FF00", "outline": ""}})
+        self.other = virtual.Widget(self.canvas, (0, 0), (10, 10), animation=False)
+        shapes.Rectangle(self.other)
+
+    def tearDown(self) -> None:
+        self.tk.destroy()
+
+    def test_tags(self) -> None:
+        self.assertNotEqual(self.widget.tag, self.child.tag)
+        self.assertEqual(self.child.tags, (self.child.tag, self.widget.tag))
+        self.assertEqual(self.canvas.find_withtag(self.widget.tag), (*self.shape.items, *self.oval.items))
+        self.shape.configure({"fill": "#0000FF"})
+        self.assertEqual(self.canvas.itemcget(self.shape.items[0], "fill"), "#0000FF")
+
+    def test_move(self) -> None:
+        coords = self.canvas.coords(self.oval.items[0])
+        self.widget.move(5, 10)
+        self.assertEqual(self.canvas.coords(self.oval.items[0]), [coords[0]+5, coords[1]+10, coords[2]+5, coords[3]+10])
+        self.assertEqual(self.child.position, [25, 30])
+        self.assertEqual(self.oval.position, [25, 30])
+
+    def test_lift(self) -> None:
+        self.widget.lift()
+        self.assertEqual(self.canvas.find_all()[-1], self.oval.items[-1])
+        self.assertEqual(self.canvas.widgets, [self.other, self.widget, self.child])
+        self.widget.lower()
+        self.assertEqual(self.canvas.find_all()[0], self.shape.items[0])
+        self.assertEqual(self.canvas.widgets, [self.widget, self.child, self.other])
+
+
+class TestDisappear(unittest.TestCase):
+
+    @unittest.skipIf(platform.system() == "Linux", "No display name.")
+    def setUp(self) -> None:
+        self.tk = containers.Tk()
+        self.canvas = containers.Canvas(self.tk)
+        self.widget = virtual.Widget(self.canvas, (10, 10), (100, 40), animation=False)
+        self.shape = shapes.Rectangle(self.widget, styles={"normal": {"fill": "#FF0000", "outline": "#000000"}})
+        self.child = virtual.Widget(self.widget, (10, 10), (20, 20), animation=False)
+        self.oval = shapes.Oval(self.child, styles={"normal": {"fill": "#00FF00", "outline": ""}})
+        self.mark = shapes.Oval(self.child, styles={"normal": {"fill": "#0000FF", "outline": ""}})
+
+    def tearDown(self) -> None:
+        self.tk.destroy()
+
+    def test_disappear(self) -> None:
+        self.widget.disappear()
+        self.assertTrue(self.child.is_disappeared)
+        self.assertEqual(self.canvas.itemcget(self.oval.items[0], "state"), "hidden")
+        self.assertEqual(self.canvas.itemcget(self.oval.items[0], "fill"), "#00FF00")
+        self.assertTrue(self.oval.visible)
+        self.widget.disappear(False)
+        self.assertFalse(self.child.is_disappeared)
+        self.assertEqual(self.canvas.itemcget(self.oval.items[0], "state"), "")
+
+    def test_keep_hidden(self) -> None:
+        self.mark.disappear()
+        self.child.disappear(False)
+        self.widget.disappear()
+        self.widget.disappear(False)
+        self.assertEqual(self.canvas.itemcget(self.mark.items[0], "state"), "hidden")
+        self.assertFalse(self.mark.visible)
+        self.child.disappear()
+        self.widget.disappear()
+        self.widget.disappear(False)
+        self.assertTrue(self.child.is_disappeared)
+        self.assertEqual(self.canvas.itemcget(self.oval.items[0], "state"), "hidden")
+        self.assertEqual(self.canvas.itemcget(self.shape.items[0], "state"), "")
+
+    @unittest.skipIf(getattr(virtual.enhanced, "ImageTk", None) is None, "Pillow is not installed.")
+    def test_frozen(self) -> None:
+        self.widget.freeze()
+        self.child.disappear()
+        self.assertNotIn(self.oval.items[0], self.widget.layer.items)
+        self.widget.thaw()
+        self.assertEqual(self.canvas.itemcget(self.oval.items[0], "state"), "hidden")
+
+    @unittest.skipIf(getattr(virtual.enhanced, "ImageTk", None) is None, "Pillow is not installed.")
+    def test_frozen_component(self) -> None:
+        self.widget.freeze()
+        self.mark.disappear()
+        self.assertNotIn(self.mark.items[0], self.widget.layer.items)
+        self.assertIn(self.oval.items[0], self.widget.layer.items)
+        self.mark.disappear(False)
+        self.assertIn(self.mark.items[0], self.widget.layer.items)
+        self.assertEqual(self.canvas.itemcget(self.mark.items[0], "state"), "hidden")
+
+
+if __name__ == "__main__":
+    unittest.main()
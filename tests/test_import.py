@@ -0,0 +1,91 @@
+# pylint: disable=all
+
+import subprocess
+import sys
+import unittest
+
+
+def import_time(statement: str) -> dict[str, int]:
+    """Return the cumulative import time (us) of every module imported by the statement"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True, text=True, check=True)
+    times: dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            _, cumulative, name = line.split("|")
+            if cumulative.strip().isdigit():
+                times[name.strip()] = int(cumulative)
+    return times
+
+
+class TestLazyImport(unittest.TestCase):
+
+    HEAVY_MODULES = (
+        "tkintertools.core.containers",
+        "tkintertools.standard.widgets",
+        "tkintertools.theme.dark",
+        "tkintertools.theme.light",
+        "typing_extensions",
+        "PIL",
+        "darkdetect",
+    )
+
+    def assertLight(self, statement: str) -> None:
+        modules = import_time(statement)
+        for name in self.HEAVY_MODULES:
+            self.assertNotIn(name, modules, f"{statement!r} imports {name!r}")
+
+    def test_package(self) -> None:
+        self.assertLight("import tkintertools")
+
+    def test_color(self) -> None:
+        self.assertLight("import tkintertools.color")
+        self.assertNotIn("tkintertools.core", import_time("import tkintertools.color"))
+
+    def test_controllers(self) -> None:
+        self.assertLight("import tkintertools.animation.controllers")
+
+    def test_import_all(self) -> None:
+        modules = import_time("from tkintertools import *")
+        self.assertIn("tkintertools.standard.widgets", modules)
+        self.assertNotIn("tkintertools.animation.animations", modules)
+
+    def test_access(self) -> None:
+        modules = import_time("import tkintertools; tkintertools.Tk")
+        self.assertIn("tkintertools.core.containers", modules)
+        self.assertNotIn("tkintertools.standard.widgets", modules)
+
+    def test_public_api(self) -> None:
+        import tkintertools
+
+        for name in tkintertools.__all__:
+            self.assertIsNotNone(getattr(tkintertools, name))
+            self.assertIn(name, dir(tkintertools))
+
+        self.assertIs(tkintertools.Button, tkintertools.widgets.Button)
+        self.assertIs(tkintertools.Tk, tkintertools.core.Tk)
+        self.assertIs(tkintertools.PhotoImage, tkintertools.toolbox.PhotoImage)
+        self.assertRaises(AttributeError, getattr, tkintertools, "NotExist")
+        self.assertNotIn("widgets", tkintertools.__all__)
+        self.assertIn("widgets", dir(tkintertools))
+
+        import tkintertools.animation
+
+        for name in tkintertools.animation.__all__:
+            self.assertIsNotNone(getattr(tkintertools.animation, name))
+
+    def test_lazy_names(self) -> None:
+        import importlib
+
+        import tkintertools
+
+        expected = {name: module for module in (
+            ".core.configs", ".core.containers", ".standard.dialogs", ".standard.widgets",
+            ".toolbox.enhanced") for name in importlib.import_module(module, "tkintertools").__all__}
+        expected["run_async"] = ".toolbox.tools"
+        self.assertEqual(tkintertools._LAZY_NAMES, expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,126 @@
+# pylint: disable=all
+
+import os
+import platform
+import tempfile
+import unittest
+
+from tkintertools.core import containers, virtual
+from tkintertools.standard import images
+
+
+class TestMappedImageSource(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.data = b"".join(bytes((x, y, (x+y) % 256)) for y in range(6) for x in range(5))
+        fd, self.file = tempfile.mkstemp(suffix=".ppm")
+        with os.fdopen(fd, "wb") as f:
+            f.write(b"P6\n# comment\n5 6\n255\n" + self.data)
+
+    def tearDown(self) -> None:
+        os.remove(self.file)
+
+    def test_header(self) -> None:
+        source = images.MappedImageSource(self.file)
+        self.assertEqual((source.width, source.height), (5, 6))
+        self.assertEqual(source.read(0, 0, 5, 6), self.data)
+        source.close()
+
+    def test_raw(self) -> None:
+        source = images.MappedImageSource(self.file, (5, 6), offset=len(b"P6\n# comment\n5 6\n255\n"))
+        self.assertEqual(source.read(1, 2, 2, 1), bytes((1, 2, 3, 2, 2, 4)))
+        source.close()
+
+    def test_step(self) -> None:
+        source = images.MappedImageSource(self.file)
+        self.assertEqual(source.read(0, 0, 5, 6, 2), b"".join(
+            bytes((x, y, (x+y) % 256)) for y in range(0, 6, 2) for x in range(0, 5, 2)))
+        source.close()
+
+
+@unittest.skipIf(getattr(images, "Image", None) is None, "Pillow is not installed.")
+class TestPillowImageSource(unittest.TestCase):
+
+    def setUp(self) -> None:
+        fd, self.file = tempfile.mkstemp(suffix=".jpg")
+        os.close(fd)
+        images.Image.new("RGB", (100, 80), "#FF0000").save(self.file)
+
+    def tearDown(self) -> None:
+        os.remove(self.file)
+
+    def test_read(self) -> None:
+        source = images.PillowImageSource(self.file)
+        self.assertEqual(len(source.read(0, 0, 100, 80)), 100*80*3)
+        self.assertEqual(len(source.read(64, 32, 36, 48, 2)), 18*24*3)
+        self.assertEqual(len(source.read(64, 64, 36, 16, 8)), 5*2*3)
+        self.assertEqual(source._drafts[8][1], 8)
+        source.close()
+
+
+class TestTiledImage(unittest.TestCase):
+
+    @unittest.skipIf(platform.system() == "Linux", "No display name.")
+    def setUp(self) -> None:
+        self.tk = containers.Tk()
+        self.canvas = containers.Canvas(self.tk)
+        fd, self.file = tempfile.mkstemp(suffix=".ppm")
+        with os.fdopen(fd, "wb") as f:
+            f.write(b"P6 100 80 255\n" + bytes(100*80*3))
+
+    def tearDown(self) -> None:
+        self.tk.destroy()
+        os.remove(self.file)
+
+    def test_tiles(self) -> None:
+        source = images.MappedImageSource(self.file)
+        widget = virtual.Widget(self.canvas, (0, 0), (100, 80))
+        image = images.TiledImage(widget, source=source, tile_size=32)
+        self.assertEqual(image._get_level(), 0)
+        self.assertEqual(len(image.items), len(image._visible))
+        image.coords((50, 40))
+        self.assertEqual(image._get_level(), -1)
+        self.assertTrue(all(key[0] == -1 for key in image._visible))
+        source.close()
+
+    def test_small_cache(self) -> None:
+        source = images.MappedImageSource(self.file)
+        widget = virtual.Widget(self.canvas, (0, 0), (100, 80))
+        image = images.TiledImage(widget, source=source, tile_size=32, cache_size=1)
+        self.assertGreater(len(image._visible), 1)
+        self.assertTrue(all(key in image._tiles for key in image._visible))
+        source.close()
+
+
+class TestDoubleBufferedImage(unittest.TestCase):
+
+    @unittest.skipIf(platform.system() == "Linux", "No display name.")
+    def setUp(self) -> None:
+        self.tk = containers.Tk()
+        self.canvas = containers.Canvas(self.tk)
+
+    def tearDown(self) -> None:
+        self.tk.destroy()
+
+    def test_push(self) -> None:
+        widget = virtual.Widget(self.canvas, (0, 0), (0, 0))
+        image = images.DoubleBufferedImage(widget)
+        front = image.image
+        self.assertRaises(ValueError, image.push, bytes(12))
+        self.assertRaises(ValueError, image.push, bytes(11), (2, 2))
+        image.push(bytes(12), (2, 2))
+        image.push(memoryview(bytes(range(12))), (2, 2))
+        self.assertEqual(image.dropped, 1)
+        image._render()
+        self.assertIsNot(image.image, front)
+        self.assertEqual((image.image.width(), image.image.height()), (2, 2))
+        self.assertEqual(image.image.get(1, 0), (3, 4, 5))
+        self.assertEqual(image.fps, 1)
+        image._render()
+        self.assertEqual(image.fps, 1)
+        self.assertIsNone(image._after_id)
+        self.assertLessEqual(len(image._times), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,103 @@
+# pylint: disable=all
+
+import platform
+import tkinter
+import unittest
+
+from tkintertools.core import containers, virtual
+from tkintertools.standard import shapes
+
+
+class TestPolygonShapes(unittest.TestCase):
+
+    def test_points(self) -> None:
+        points = shapes._rounded_rectangle_points(100, 40, 10)
+        self.assertEqual(len(points) % 2, 0)
+        xs, ys = points[0::2], points[1::2]
+        self.assertAlmostEqual(min(xs), 0)
+        self.assertAlmostEqual(max(xs), 100)
+        self.assertAlmostEqual(min(ys), 0)
+        self.assertAlmostEqual(max(ys), 40)
+        self.assertAlmostEqual(points[0], 0)
+        self.assertAlmostEqual(points[1], 10)
+        self.assertIs(shapes._rounded_rectangle_points(100, 40, 10), points)
+
+    def test_corners(self) -> None:
+        points = shapes._rounded_rectangle_points(100, 40, 10, (False, True, True, False))
+        self.assertEqual(points[:2], (0, 0))
+        self.assertEqual(points[-2:], (0, 40))
+
+    def test_style_name(self) -> None:
+        self.assertIs(shapes._get_style_name(None, shapes.RoundedRectangle), shapes.RoundedRectangle)
+        self.assertEqual(shapes._get_style_name(".in", shapes.RoundedRectangle), "RoundedRectangle.in")
+        self.assertEqual(shapes._get_style_name("Oval", shapes.RoundedRectangle), "Oval")
+
+
+class TestTclProcs(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.tcl = tkinter.Tcl()
+        self.tcl.eval(shapes._TCL_PROCS)
+        self.tcl.eval("set log {}; set count 0; proc .canvas {args} {lappend ::log $args; incr ::count}")
+
+    def test_create_items(self) -> None:
+        result = self.tcl.call("::tkintertools::create_items", ".canvas", ("-width", 2), [
+            ("rectangle", 0, 0, 0, 0, "-outline", "", "-tags", ("fill", "fill")),
+            ("arc", 0, 0, 0, 0, "-start", -90)])
+        self.assertEqual([int(i) for i in self.tcl.splitlist(result)], [1, 2])
+        self.assertEqual(self.tcl.eval("set log"), "{create rectangle 0 0 0 0 -outline {} -tags {fill fill} -width 2} "
+                         "{create arc 0 0 0 0 -start -90 -width 2}")
+
+    def test_coords_items(self) -> None:
+        self.tcl.call("::tkintertools::coords_items", ".canvas", [1, 2], [1, 2.5, 3, 4, 5, 6, 7, 8])
+        self.assertEqual(self.tcl.eval("set log"), "{coords 1 1 2.5 3 4} {coords 2 5 6 7 8}")
+
+
+class TestRasterShapes(unittest.TestCase):
+
+    @unittest.skipIf(platform.system() == "Linux", "No display name.")
+    def setUp(self) -> None:
+        self.tk = containers.Tk()
+        self.canvas = containers.Canvas(self.tk)
+
+    def tearDown(self) -> None:
+        self.tk.destroy()
+        shapes._RasterCache.clear()
+
+    def test_cache(self) -> None:
+        widget = virtual.Widget(self.canvas, (0, 0), (100, 40), animation=False)
+        shape = shapes.RasterRoundedRectangle(widget, styles={"normal": {"fill": "#FF0000", "outline": "#00FF00"}})
+        shapes.RasterOval(widget, styles={"normal": {"fill": "#FF0000", "outline": ""}})
+        shapes.RasterSemicircularRectangle(widget, styles={"normal": {"fill": "#0000FF", "outline": ""}})
+        widget.update("normal", no_delay=True)
+        self.assertEqual(len(shape.items), 1)
+        image = shape._image
+        shape.configure({"fill": "#FFFFFF"})
+        self.assertIsNot(shape._image, image)
+        shape.configure({"fill": "#FF0000"})
+        self.assertIs(shape._image, image)
+        self.assertEqual(len(shapes._RasterCache._images), 4)
+
+    def test_destroyed_root(self) -> None:
+        widget = virtual.Widget(self.canvas, (0, 0), (100, 40), animation=False)
+        shapes.RasterOval(widget, styles={"normal": {"fill": "#FF0000", "outline": ""}})
+        widget.update("normal", no_delay=True)
+        self.assertEqual(len(shapes._RasterCache._images), 1)
+        self.tk.destroy()
+        self.assertEqual(len(shapes._RasterCache._images), 0)
+        self.assertEqual(shapes._RasterCache._bytes, 0)
+        self.tk = containers.Tk()
+
+    def test_limit(self) -> None:
+        maxsize, shapes._RasterCache.maxsize = shapes._RasterCache.maxsize, 2
+        try:
+            for i in range(3):
+                shapes._RasterCache.put((i,), tkinter.PhotoImage(width=10, height=10))
+            self.assertEqual(list(shapes._RasterCache._images), [(1,), (2,)])
+            self.assertEqual(shapes._RasterCache._bytes, 800)
+        finally:
+            shapes._RasterCache.maxsize = maxsize
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,113 @@
+# pylint: disable=all
+
+import platform
+import unittest
+
+from tkintertools.core import containers
+from tkintertools.standard import texts, widgets
+
+
+class TestCanvasTextProxy(unittest.TestCase):
+
+    def test_prefix(self) -> None:
+        proxy = texts._CanvasTextProxy(None, 1)
+        proxy._widths = [1, 2, 3]
+        self.assertEqual(proxy._get_prefix(), [0, 1, 3, 6])
+        proxy._widths[1:1] = [4]
+        del proxy._prefix[2:]
+        self.assertEqual(proxy._get_prefix(), [0, 1, 5, 7, 10])
+        proxy.invalidate()
+        self.assertIsNone(proxy._widths)
+        self.assertEqual(proxy._prefix, [0])
+
+
+class TestPieceTable(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.text = "tkinter\ntools\n\nend"
+        self.table = texts._PieceTable(self.text)
+
+    def test_get(self) -> None:
+        self.assertEqual(self.table.get(), self.text)
+        self.assertEqual(len(self.table), len(self.text))
+        self.assertEqual(self.table.substring(3, 10), self.text[3:10])
+
+    def test_lines(self) -> None:
+        self.assertEqual(self.table.line_count(), 4)
+        self.assertEqual([self.table.get_line(i) for i in range(4)], self.text.split("\n"))
+        self.assertEqual(self.table.line_start(1), 8)
+        self.assertEqual(self.table.line_end(1), 13)
+        self.assertEqual(self.table.position(10), (1, 2))
+        self.assertEqual(self.table.index(1, 2), 10)
+        self.assertEqual(self.table.index(2, 5), 14)
+        self.assertRaises(IndexError, self.table.line_start, 4)
+
+    def test_edit(self) -> None:
+        self.table.insert(7, "\n")
+        self.table.insert(len(self.table), "!")
+        self.table.insert(len(self.table), "!")
+        self.table.remove(0, 3)
+        self.text = ("tkinter\n" + self.text[7:] + "!!")[3:]
+        self.assertEqual(self.table.get(), self.text)
+        self.assertEqual(self.table.line_count(), self.text.count("\n") + 1)
+        self.assertEqual([self.table.get_line(i) for i in range(self.table.line_count())],
+                         self.text.split("\n"))
+
+    def test_typing(self) -> None:
+        for i, char in enumerate("piece\ntable" * 20):
+            self.table.insert(i, char)
+            self.text = self.text[:i] + char + self.text[i:]
+        self.assertEqual(self.table.get(), self.text)
+        self.assertEqual(len(self.table._buffers), 2)
+        self.assertEqual(len(self.table._pieces), 2)
+        self.assertEqual(self.table.get_line(20), self.text.split("\n")[20])
+        self.table.remove(0, len(self.table))
+        self.assertEqual(self.table.get(), "")
+        self.assertEqual(self.table.line_count(), 1)
+        self.assertRaises(IndexError, self.table.insert, 1, "")
+
+
+class Test(unittest.TestCase):
+
+    @unittest.skipIf(platform.system() == "Linux", "No display name.")
+    def setUp(self) -> None:
+        self.tk = containers.Tk()
+        self.canvas = containers.Canvas(self.tk)
+
+    def tearDown(self) -> None:
+        self.tk.destroy()
+
+    def test_cursor_find(self) -> None:
+        item = self.canvas.create_text(0, 0, text="tkintertools", anchor="w")
+        proxy = texts._CanvasTextProxy(self.canvas, item)
+        x1, _, x2, _ = self.canvas.bbox(item)
+        self.assertEqual(proxy.cursor_find(x1), 0)
+        self.assertEqual(proxy.cursor_find(x2), proxy.length())
+        proxy.insert(0, "_")
+        proxy.remove(0)
+        self.assertEqual(proxy.cursor_find(x2), proxy.length())
+
+    def test_single_line_text(self) -> None:
+        text = widgets.InputBox(self.canvas, (0, 0), (100, 40)).texts[0]
+        text.set("tkintertools" * 10)
+        self.assertEqual(text.right, len(text.get()))
+        self.assertGreater(text.left, 0)
+        self.assertEqual(text.text_proxy.get(), text.get()[text.left:text.right])
+        text.remove(0, text.right - text.left)
+        self.assertEqual(text.text_proxy.get(), text.get()[text.left:text.right])
+        text._move_right()
+        self.assertEqual(text.text_proxy.get(), text.get()[text.left:text.right])
+        text.append("_")
+        self.assertTrue(text.get().endswith("_"))
+        self.assertEqual(text.text_proxy.get(), text.get()[text.left:text.right])
+
+    def test_multi_line_text(self) -> None:
+        text_box = widgets.TextBox(self.canvas, (0, 0), (200, 100), text="\n".join(map(str, range(1000))))
+        text = text_box.texts[0]
+        self.assertLess(len(text.items), 1000)
+        text.cursor_set(len(text.table))
+        self.assertEqual(text.top + len(text.items), 1000)
+        text.append("\n1000")
+        self.assertEqual(text.top + len(text.items), 1001)
+        text.scroll(-2000)
+        self.assertEqual(text.top, 0)
@@ -0,0 +1,124 @@
+# pylint: disable=all
+
+import platform
+import tkinter
+import unittest
+
+from tkintertools.core import configs
+from tkintertools.style import manager
+
+
+class TestEvent(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.records: list[bool] = []
+
+    def tearDown(self) -> None:
+        manager.remove_event(self.callback)
+        configs.Theme.color_mode = "system"
+
+    def callback(self, dark: bool) -> None:
+        self.records.append(dark)
+
+    @unittest.skipIf(tkinter._default_root is not None, "A default root exists.")
+    def test_register_event(self) -> None:
+        manager.register_event(self.callback)
+        manager.set_color_mode("dark")
+        manager.set_color_mode("light")
+        self.assertEqual(self.records, [True, False])
+
+    @unittest.skipIf(tkinter._default_root is not None, "A default root exists.")
+    def test_remove_event(self) -> None:
+        manager.register_event(self.callback)
+        manager.remove_event(self.callback)
+        manager.set_color_mode("dark")
+        self.assertEqual(self.records, [])
+
+
+class TestListener(unittest.TestCase):
+
+    def setUp(self) -> None:
+        if manager._listener is not None:
+            self.skipTest("The listener has been started.")
+
+    def tearDown(self) -> None:
+        manager.remove_event(self.callback)
+        configs.Theme.color_mode = "system"
+
+    def callback(self, dark: bool) -> None:
+        pass
+
+    def test_not_started(self) -> None:
+        configs.Theme.color_mode = "light"
+        manager.register_event(self.callback)
+        self.assertIsNone(manager._listener)
+
+    @unittest.skipIf(tkinter._default_root is not None, "A default root exists.")
+    def test_start(self) -> None:
+        configs.Theme.color_mode = "light"
+        manager.register_event(self.callback)
+        manager.set_color_mode("system")
+        if getattr(manager, "darkdetect", None) is None:
+            self.assertIsNone(manager._listener)
+        else:
+            self.assertIsNotNone(manager._listener)
+
+
+class Target:
+
+    def __init__(self) -> None:
+        self.records: list[bool] = []
+
+    def callback(self, dark: bool) -> None:
+        self.records.append(dark)
+
+
+@unittest.skipIf(platform.system() == "Linux", "No display name.")
+class TestBroadcast(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.tk = tkinter.Tk()
+        self.records: list[bool] = []
+
+    def tearDown(self) -> None:
+        manager.remove_event(self.callback)
+        manager.remove_event(self.other_callback)
+        configs.Theme.color_mode = "system"
+        self.tk.destroy()
+
+    def callback(self, dark: bool) -> None:
+        self.records.append(dark)
+
+    def other_callback(self, dark: bool) -> None:
+        self.records.append(not dark)
+
+    def test_coalesce(self) -> None:
+        manager.register_event(self.callback)
+        manager.set_color_mode("dark")
+        manager.set_color_mode("light")
+        manager.set_color_mode("dark")
+        self.assertEqual(self.records, [])
+        self.tk.update()
+        self.assertEqual(self.records, [True])
+
+    def test_targets(self) -> None:
+        other = Target()
+        manager.register_event(self.callback)
+        manager.register_event(other.callback)
+        for mode in "dark", "light", "dark", "light":
+            manager.set_color_mode(mode)
+        self.tk.update()
+        self.assertEqual(self.records, [False])
+        self.assertEqual(other.records, [False])
+        manager.remove_event(other.callback)
+
+    def test_same_target(self) -> None:
+        manager.register_event(self.callback)
+        manager.register_event(self.other_callback)
+        manager.set_color_mode("dark")
+        self.tk.update()
+        self.assertEqual(self.records, [True, False])
+
+
+if __name__ == "__main__":
+    unittest.main()
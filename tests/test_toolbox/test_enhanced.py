@@ -1,13 +1,42 @@
 # pylint: disable=all
 
+import json
 import pathlib
 import platform
+import tempfile
 import tkinter
 import unittest
 
 from tkintertools.toolbox import enhanced
 
 
+class TestCodec(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.pixels = bytes(range(256))[:4*4*3]  # 4x3 RGBA
+
+    def test_png(self) -> None:
+        data = enhanced._png_encode(4, 3, self.pixels)
+        self.assertEqual(enhanced._png_decode(data), (4, 3, self.pixels))
+        self.assertRaises(ValueError, enhanced._png_decode, b"GIF89a")
+
+    def test_png_file(self) -> None:
+        with open(pathlib.Path(__file__).parent.parent/"assets/images/logo.png", "rb") as file:
+            try:
+                width, height, pixels = enhanced._png_decode(file.read())
+            except ValueError:
+                self.skipTest("Unsupported PNG format.")
+        self.assertEqual(len(pixels), width*height*4)
+
+    def test_ppm(self) -> None:
+        self.assertEqual(enhanced._ppm_encode(1, 1, b"\x01\x02\x03\x04"), b"P6 1 1 255\n\x01\x02\x03")
+
+    def test_resize_pixels(self) -> None:
+        self.assertEqual(enhanced._resize_pixels(4, 3, self.pixels, 4, 3), self.pixels)
+        self.assertEqual(enhanced._resize_pixels(4, 3, self.pixels, 2, 1), self.pixels[:4] + self.pixels[8:12])
+        self.assertEqual(len(enhanced._resize_pixels(4, 3, self.pixels, 7, 5)), 7*5*4)
+
+
 @unittest.skipIf(platform.system() == "Linux", "No display name.")
 class TestPhotoImage(unittest.TestCase):
 
@@ -21,6 +50,13 @@ class TestPhotoImage(unittest.TestCase):
     def tearDown(self) -> None:
         self.tk.destroy()
 
+    @unittest.skipIf(getattr(enhanced, "Image", None) is None, "Pillow is not installed.")
+    def test_source(self) -> None:
+        source = enhanced.Image.new("RGBA", (4, 3))
+        self.assertIsNot(enhanced.PhotoImage(source).source, source)
+        self.assertIs(enhanced.PhotoImage(source, keep_source=True).source, source)
+        self.assertEqual(enhanced.PhotoImage(source).source.size, (4, 3))
+
     def test_scale(self) -> None:
         large_image = self.image.scale(1.5, 1.5)
         small_image = self.image.scale(0.5, 0.5)
@@ -41,5 +77,84 @@ class TestPhotoImage(unittest.TestCase):
         self.assertEqual(new_height, 100)
 
 
+class TestImageAtlas(unittest.TestCase):
+
+    def test_read_manifest(self) -> None:
+        with tempfile.TemporaryDirectory() as path:
+            file = pathlib.Path(path, "icons.json")
+            file.write_text(json.dumps({"image": "icons.png", "regions": {"logo": [0, 0, 16, 16]}}))
+            image, regions = enhanced.ImageAtlas.read_manifest(file)
+        self.assertEqual(image, pathlib.Path(path, "icons.png"))
+        self.assertEqual(regions, {"logo": (0, 0, 16, 16)})
+
+    @unittest.skipIf(platform.system() == "Linux", "No display name.")
+    def test_crop(self) -> None:
+        tk = tkinter.Tk()
+        atlas = enhanced.ImageAtlas(
+            pathlib.Path(__file__).parent.parent/"assets/images/logo.png", {"corner": (0, 0, 8, 6)})
+        self.assertIn("corner", atlas)
+        self.assertIs(atlas["corner"], atlas.crop(0, 0, 8, 6))
+        self.assertEqual((atlas["corner"].width(), atlas["corner"].height()), (8, 6))
+        self.assertIsNone(atlas.get("missing"))
+        tk.destroy()
+
+
+class TestImageLoader(unittest.TestCase):
+
+    def test_decode(self) -> None:
+        file = pathlib.Path(__file__).parent.parent/"assets/images/logo.png"
+        data = enhanced._decode(file, (8, 6))
+        if getattr(enhanced, "Image", None) is None:
+            self.assertEqual(data, file.read_bytes())
+        else:
+            self.assertEqual(data.size, (8, 6))
+            self.assertEqual(data.mode, "RGBA")
+
+    def test_destroyed_root(self) -> None:
+        class Root:
+            def __init__(self) -> None:
+                self.alive, self.polls = True, []
+
+            def _root(self) -> "Root":
+                return self
+
+            def after(self, _, func) -> None:
+                self.polls.append(func)
+
+            def winfo_exists(self) -> int:
+                if not self.alive:
+                    raise tkinter.TclError("can't invoke \"winfo\" command: application has been destroyed")
+                return 1
+
+        old_root, new_root = Root(), Root()
+        loader = enhanced.ImageLoader(1)
+        loader._submit(lambda: None, callback=print, size=None, master=old_root)
+        old_root.alive = False  # Its after callbacks are dropped
+        loader._submit(lambda: None, callback=print, size=None, master=new_root)
+        self.assertEqual(len(new_root.polls), 1)
+        loader._executor.shutdown()
+
+    @unittest.skipIf(platform.system() == "Linux", "No display name.")
+    def test_load(self) -> None:
+        tk = tkinter.Tk()
+        images = []
+        loader = enhanced.ImageLoader(1)
+        loader.load(pathlib.Path(__file__).parent.parent/"assets/images/logo.png",
+                    (8, 6), callback=images.append)
+        cancelled = loader.load(pathlib.Path(__file__).parent.parent/"assets/images/logo.png",
+                                callback=images.append)
+        loader.cancel(cancelled)
+        while loader._pending or loader._polling:
+            tk.update()
+        self.assertEqual(len(images), 1)
+        self.assertEqual((images[0].width(), images[0].height()), (8, 6))
+        if hasattr(enhanced.PhotoImage, "source"):
+            loader.resize(images[0], (4, 3), callback=images.append)
+            while loader._pending or loader._polling:
+                tk.update()
+            self.assertEqual((images[1].width(), images[1].height()), (4, 3))
+        tk.destroy()
+
+
 if __name__ == "__main__":
     unittest.main()
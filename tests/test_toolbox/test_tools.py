@@ -1,11 +1,16 @@
 # pylint: disable=all
 
+import asyncio
 import pathlib
+import pickle
 import platform
+import tempfile
+import threading
 import tkinter
+import types
 import unittest
 
-from tkintertools.core import configs
+from tkintertools.core import configs, containers
 from tkintertools.toolbox import tools
 
 
@@ -83,5 +88,242 @@ class Test(unittest.TestCase):
             tools.get_text_size(":)", configs.Font.size, configs.Font.family))
 
 
+class TestTextMetrics(unittest.TestCase):
+
+    def setUp(self) -> None:
+        tools.TextMetrics.clear()
+        self.key = tools.TextMetrics.get_key("Fira Code", 20)
+
+    def tearDown(self) -> None:
+        tools.TextMetrics.clear()
+        tools.TextMetrics.maxsize = 8192
+
+    def test_get_key(self) -> None:
+        self.assertEqual(self.key, ("Fira Code", -20, "normal", "roman", False, False))
+        self.assertEqual(tools.TextMetrics.get_key("Fira Code", -20, "bold"), ("Fira Code", -20, "bold", "roman", False, False))
+        self.assertEqual(tools.TextMetrics.get_key("Fira Code", 20, underline=1), ("Fira Code", -20, "normal", "roman", True, False))
+        self.assertRaises(TypeError, tools.get_text_size, "text", 20, "Fira Code", underline=True, name="font")
+
+    def test_get_font_key(self) -> None:
+        font = types.SimpleNamespace(config=lambda: {"family": "Fira Code", "size": 20, "weight": "normal", "slant": "roman", "underline": 0, "overstrike": 0})
+        self.assertEqual(tools.TextMetrics.get_font_key(font), self.key)
+
+    def test_cache(self) -> None:
+        tools.TextMetrics._store(self.key, "a", 12)
+        tools.TextMetrics._linespaces[self.key] = 24
+        self.assertEqual(tools.TextMetrics.measure("a", self.key), 12)
+        self.assertEqual(tools.TextMetrics.char_widths("aa", self.key), [12, 12])
+        tools.TextMetrics._store(self.key, "", 0)
+        tools.TextMetrics._store(self.key, "aa", 24)
+        self.assertEqual(tools.TextMetrics.size("a\naa", self.key), (26, 48))
+        self.assertEqual(tools.TextMetrics.size("", self.key), (2, 24))
+
+    def test_lru(self) -> None:
+        tools.TextMetrics.maxsize = 2
+        tools.TextMetrics._store(self.key, "a", 1)
+        tools.TextMetrics._store(self.key, "b", 2)
+        tools.TextMetrics.measure("a", self.key)
+        tools.TextMetrics._store(self.key, "c", 3)
+        self.assertIn((self.key, "a"), tools.TextMetrics._widths)
+        self.assertNotIn((self.key, "b"), tools.TextMetrics._widths)
+
+    def test_layout(self) -> None:
+        for char in "abcdefghijklmnopqrstuvwxyz …":
+            tools.TextMetrics._store(self.key, char, 10)
+        self.assertEqual(tools.TextMetrics.layout("hello world foo bar", self.key, 60), "hello\nworld\nfoo\nbar")
+        self.assertEqual(tools.TextMetrics.layout("abcdefghijkl", self.key, 50), "abcde\nfghij\nkl")
+        self.assertEqual(tools.TextMetrics.layout(
+            "hello world foo bar", self.key, 60, max_lines=2, ellipsis="end"), "hello\nworld…")
+        self.assertEqual(tools.TextMetrics.layout(
+            "hello world foo bar", self.key, 100, max_lines=1, ellipsis="middle"), "hello… bar")
+        self.assertEqual(tools.TextMetrics.layout(
+            "abcdefghijkl", self.key, 50, wrap=False, ellipsis="middle"), "ab…kl")
+        self.assertEqual(tools.TextMetrics.layout("", self.key, 50), "")
+        self.assertIn((self.key, 50, "", True, None, None), tools.TextMetrics._layouts)
+        self.assertRaises(ValueError, tools.TextMetrics.layout, "hello", self.key, 50, max_lines=0, ellipsis="end")
+
+    def test_save_load(self) -> None:
+        tools.TextMetrics._store(self.key, "a", 12)
+        tools.TextMetrics._linespaces[self.key] = 24
+        with tempfile.TemporaryDirectory() as path:
+            file = pathlib.Path(path, "metrics.json")
+            tools.TextMetrics.save(file)
+            tools.TextMetrics.clear()
+            self.assertTrue(tools.TextMetrics.load(file))
+            self.assertFalse(tools.TextMetrics.load(pathlib.Path(path, "missing.json")))
+        self.assertEqual(tools.TextMetrics.measure("a", self.key), 12)
+        self.assertEqual(tools.TextMetrics.linespace(self.key), 24)
+
+
+class TestRunAsync(unittest.TestCase):
+
+    @unittest.skipIf(platform.system() == "Linux", "No display name.")
+    def setUp(self) -> None:
+        self.tk = tkinter.Tk()
+
+    def test_result(self) -> None:
+        async def main() -> int:
+            await asyncio.sleep(0.05)
+            self.tk.after(10, self.tk.destroy)
+            return 1
+
+        self.assertEqual(tools.run_async(self.tk, main()), 1)
+
+    def test_cancel(self) -> None:
+        async def main() -> None:
+            await asyncio.sleep(60)
+
+        self.tk.after(50, self.tk.destroy)
+        self.assertIsNone(tools.run_async(self.tk, main()))
+
+    def test_exception(self) -> None:
+        async def main() -> None:
+            raise ValueError
+
+        self.assertRaises(ValueError, tools.run_async, self.tk, main())
+        self.tk.destroy()
+
+
+class TestTkSelector(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.interp = tkinter.Tcl()
+        self.timeouts = []
+        timeouts = self.timeouts
+
+        class Selector(tools._TkSelector):
+
+            def select(self, timeout=None):
+                timeouts.append(timeout)
+                return super().select(timeout)
+
+        self.loop = asyncio.SelectorEventLoop(Selector(self.interp.tk))
+
+    def tearDown(self) -> None:
+        self.loop.close()
+
+    def test_idle(self) -> None:
+        self.loop.run_until_complete(asyncio.sleep(0.3))
+        self.assertLess(len(self.timeouts), 10)
+
+    def test_tk_event(self) -> None:
+        future = self.loop.create_future()
+        self.interp.after(50, lambda: future.set_result(1))
+        self.assertEqual(self.loop.run_until_complete(asyncio.wait_for(future, 1)), 1)
+        self.assertLess(len(self.timeouts), 10)
+
+    def test_thread(self) -> None:
+        future = self.loop.create_future()
+        thread = threading.Timer(0.05, self.loop.call_soon_threadsafe, (future.set_result, 2))
+        thread.start()
+        self.assertEqual(self.loop.run_until_complete(asyncio.wait_for(future, 1)), 2)
+        thread.join()
+
+
+class TestDispatchQueue(unittest.TestCase):
+
+    @unittest.skipIf(platform.system() == "Linux", "No display name.")
+    def setUp(self) -> None:
+        self.tk = tkinter.Tk()
+
+    def tearDown(self) -> None:
+        self.tk.destroy()
+
+    def test_merge(self) -> None:
+        queue = tools.DispatchQueue(self.tk, batch_size=3)
+        values = []
+        queue.put(values.append, 1)
+        queue.put(values.append, 2, key="key")
+        queue.put(values.append, 3)
+        queue.put(values.append, 4, key="key")
+        queue.put(values.append, 5, key="other")
+        self.assertEqual((queue.depth, queue.max_depth, queue.merged), (4, 4, 1))
+        queue._drain()
+        self.assertEqual(values, [1, 4, 3])
+        queue._drain()
+        self.assertEqual(values, [1, 4, 3, 5])
+        self.assertEqual(queue.dispatched, 4)
+        queue.close()
+
+    def test_thread(self) -> None:
+        queue = tools.DispatchQueue(self.tk)
+        values = []
+        thread = threading.Thread(target=lambda: [queue.put(values.append, i, key=0) for i in range(100)])
+        thread.start()
+        thread.join()
+        queue._drain()
+        self.assertEqual(values, [99])
+        queue.close()
+
+    def test_window(self) -> None:
+        window = containers.Tk()
+        queue = window.dispatcher
+        self.assertIsInstance(queue, tools.DispatchQueue)
+        self.assertIsNotNone(queue._after_id)
+        window.destroy()
+        self.assertIsNone(queue._after_id)
+
+
+class TestFrameLimiter(unittest.TestCase):
+
+    @unittest.skipIf(platform.system() == "Linux", "No display name.")
+    def setUp(self) -> None:
+        self.tk = tkinter.Tk()
+
+    def tearDown(self) -> None:
+        self.tk.destroy()
+
+    def test_call(self) -> None:
+        values = []
+        limiter = tools.FrameLimiter(self.tk, values.append, 10)
+        limiter(1)
+        limiter(2)
+        limiter(3)
+        self.assertEqual(values, [1])
+        self.assertEqual(limiter.pending, (3,))
+        limiter.flush()
+        self.assertEqual(values, [1, 3])
+        self.assertIsNone(limiter.pending)
+        limiter(4)
+        limiter.cancel()
+        self.tk.after(150, self.tk.quit)
+        self.tk.mainloop()
+        self.assertEqual(values, [1, 3])
+
+
+def _double(report: tools.ProgressReporter, value: int) -> int:
+    report(0.5)
+    return value*2
+
+
+class TestProgressReporter(unittest.TestCase):
+
+    def test_pickle(self) -> None:
+        reporter = pickle.loads(pickle.dumps(tools.ProgressReporter(None, 1)))
+        self.assertIsNone(reporter(0.5))
+        self.assertFalse(reporter.cancelled)
+
+
+class TestTaskRunner(unittest.TestCase):
+
+    @unittest.skipIf(platform.system() == "Linux", "No display name.")
+    def setUp(self) -> None:
+        self.tk = tkinter.Tk()
+
+    def tearDown(self) -> None:
+        self.tk.destroy()
+
+    def test_submit(self) -> None:
+        runner = tools.TaskRunner(self.tk, 1)
+        results = []
+        task = runner.submit(_double, 21, callback=results.append)
+        task.future.result(10)
+        while runner.tasks:
+            self.tk.update()
+        self.assertEqual(results, [42])
+        self.assertTrue(task.done())
+        runner.shutdown()
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -37,11 +37,74 @@ __version__ = "3.0.0rc4"
 __author__ = "Xiaokang2022 <2951256653@qq.com>"
 
 import ctypes
+import importlib
 import sys
+import typing
+
+if typing.TYPE_CHECKING:
+    from .core import *
+    from .standard import *
+    from .toolbox.enhanced import *
+
+_LAZY_MODULES: typing.Final[dict[str, str]] = {
+    "animation": ".animation",
+    "color": ".color",
+    "core": ".core",
+    "standard": ".standard",
+    "style": ".style",
+    "theme": ".theme",
+    "toolbox": ".toolbox",
+    "configs": ".core.configs",
+    "containers": ".core.containers",
+    "virtual": ".core.virtual",
+    "dialogs": ".standard.dialogs",
+    "features": ".standard.features",
+    "images": ".standard.images",
+    "shapes": ".standard.shapes",
+    "texts": ".standard.texts",
+    "widgets": ".standard.widgets",
+}
+"""Subpackages and modules that are imported on first access"""
+
+_LAZY_NAMES: typing.Final[dict[str, str]] = {
+    **dict.fromkeys(("Env", "Font", "Theme", "Constant", "reset_configs"), ".core.configs"),
+    **dict.fromkeys(("Tk", "Toplevel", "Canvas", "Frame"), ".core.containers"),
+    **dict.fromkeys(("TkMessage", "TkColorChooser", "TkFontChooser"), ".standard.dialogs"),
+    **dict.fromkeys((
+        "Text", "Image", "StreamImage", "Label", "Button", "Switch", "InputBox", "TextBox",
+        "ToggleButton", "CheckButton", "RadioButton", "ProgressBar", "UnderlineButton",
+        "HighlightButton", "IconButton", "Slider", "SegmentedButton", "SpinBox", "OptionButton",
+        "Tooltip"),
+        ".standard.widgets"),
+    **dict.fromkeys(
+        ("PhotoImage", "ImageAtlas", "ImageLoader", "load_async", "rasterize"),
+        ".toolbox.enhanced"),
+    "run_async": ".toolbox.tools",
+}
+"""Public names that are imported from their modules on first access, it must be kept in sync with
+`__all__` of these modules, which is checked by the tests"""
+
+__all__ = [*_LAZY_NAMES]
+"""The subpackages are left out, so `from tkintertools import *` only imports the modules of these
+names, which still makes it slower than `import tkintertools`"""
+
+
+def __getattr__(name: str) -> typing.Any:
+    """Import the subpackages and the public names only when they are accessed"""
+    if (module := _LAZY_MODULES.get(name)) is not None:
+        value = importlib.import_module(module, __name__)
+    elif (module := _LAZY_NAMES.get(name)) is not None:
+        value = getattr(importlib.import_module(module, __name__), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value  # Cache it, so this function will not be called again
+    return value
+
+
+def __dir__() -> list[str]:
+    """Return all attributes, including those that have not been imported yet"""
+    return sorted({*globals(), *_LAZY_NAMES, *_LAZY_MODULES})
 
-from .core import *
-from .standard import *
-from .toolbox.enhanced import *
 
 if sys.platform == "win32":
     ctypes.windll.shcore.SetProcessDpiAwareness(1)  # Set Windows DPI awareness
@@ -5,5 +5,34 @@ functions, which can be highly customized. In addition, the control function als
 related classes and functions of the `color` subpackage.
 """
 
-from .animations import *
+import importlib
+import typing
+
+from . import controllers
 from .controllers import *
+
+if typing.TYPE_CHECKING:
+    from .animations import *
+
+_LAZY_NAMES: typing.Final[tuple[str, ...]] = (
+    "Animation", "MoveTkWidget", "MoveWidget", "MoveComponent", "MoveItem", "GradientTkWidget",
+    "GradientItem", "ScaleFontSize")
+"""Names of `animations`, which imports the core of tkintertools and is imported on first access"""
+
+__all__ = [*controllers.__all__, *_LAZY_NAMES]
+
+
+def __getattr__(name: str) -> typing.Any:
+    """Import the module `animations` only when it is accessed"""
+    if name == "animations":
+        return importlib.import_module(".animations", __name__)
+    if name in _LAZY_NAMES:
+        value = getattr(importlib.import_module(".animations", __name__), name)
+        globals()[name] = value  # Cache it, so this function will not be called again
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    """Return all attributes, including those that have not been imported yet"""
+    return sorted({*globals(), *__all__})
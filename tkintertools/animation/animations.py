@@ -18,6 +18,7 @@ __all__ = [
     "ScaleFontSize",
 ]
 
+import asyncio
 import collections.abc
 import tkinter
 import traceback
@@ -62,6 +63,7 @@ class Animation:
         self.callback = callback if callback is not None else lambda _: None
 
         self._tasks: list[str] = []
+        self._futures: list[asyncio.Future] = []
         self._delay: int = 1000 // fps
         self._is_active: bool = False
 
@@ -97,6 +99,10 @@ class Animation:
                 self.start()
             else:
                 self._is_active = False
+                futures, self._futures = self._futures, []
+                for future in futures:
+                    if not future.done():
+                        future.set_result(None)
 
         return wrapper
 
@@ -123,12 +129,26 @@ class Animation:
             if self.derivation:
                 last_percentage = percentage
 
+    def start_async(self, *, delay: int = 0) -> asyncio.Future:
+        """Start the animation and return a future that is done when the animation ends, it must be
+        called in a running event loop, see `tools.run_async`
+
+        * `delay`: length of the delay before the animation starts, in milliseconds
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._futures.append(future)
+        self.start(delay=delay)
+        return future
+
     def stop(self) -> None:
-        """Stop the animation"""
+        """Stop the animation, the futures returned by `start_async` are cancelled"""
         default_root = configs.Env.default_root
         self._is_active = False
         for task in self._tasks[::-1]:
             tkinter.Misc.after_cancel(default_root, task)
+        futures, self._futures = self._futures, []
+        for future in futures:
+            future.cancel()
 
 
 class MoveTkWidget(Animation):
@@ -10,7 +10,6 @@ __all__ = [
 
 import tkinter
 
-from ..core import configs
 from . import rgb
 
 COLOR_MAP: dict[str, rgb.RGB] = {
@@ -782,7 +781,7 @@ def name_to_rgb(color_name: str) -> rgb.RGB:
     data = COLOR_MAP.get(color_name.lower())
 
     if data is None:
-        return tkinter.Misc.winfo_rgb(configs.Env.default_root, color_name)
+        return tkinter.Misc.winfo_rgb(tkinter._get_default_root(), color_name)
 
     return data
 
@@ -33,6 +33,20 @@ class _DefaultRootDescriptor:
         return tkinter._get_default_root()
 
 
+class _IsDarkDescriptor:
+    """A descriptor that detects whether the system is in dark mode on first access.
+
+    The detection may be slow (e.g. a subprocess is started on Linux), so it is only done when the
+    value is really needed, and then the result replaces the descriptor itself.
+    """
+
+    def __get__(self, obj: typing.Any, cls: typing.Any) -> bool:
+        """Detect the system theme and cache the result."""
+        is_dark = bool(darkdetect.isDark()) if globals().get("darkdetect") else False
+        cls.is_dark = is_dark
+        return is_dark
+
+
 class Env:
     """Configurations of environment."""
 
@@ -48,7 +62,7 @@ class Env:
     def reset(cls) -> None:
         """Reset all configs."""
         cls.system = cls.get_default_system()
-        cls.is_dark = bool(darkdetect.isDark()) if globals().get("darkdetect") else False
+        cls.is_dark = _IsDarkDescriptor()  # Detect it lazily
         cls.enable_animation = True
         cls.default_callback = lambda _: False
 
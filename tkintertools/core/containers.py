@@ -59,6 +59,8 @@ class Tk(tkinter.Tk):
 
         self._size = self._initial_size = tuple(size)
         self.canvases: list[Canvas] = []
+        self.dispatcher = tools.DispatchQueue(self)
+        """The queue through which other threads can call methods of widgets safely"""
 
         self.title(title)
         self.geometry(size=size, position=position)
@@ -229,6 +231,11 @@ class Tk(tkinter.Tk):
         result = self.attributes("-transparentcolor", value)
         return None if result == "" else result
 
+    @typing_extensions.override
+    def destroy(self) -> None:
+        self.dispatcher.close()
+        return tkinter.Tk.destroy(self)
+
     def shutdown(
         self,
         command: collections.abc.Callable | None,
@@ -299,6 +306,7 @@ class Toplevel(tkinter.Toplevel, Tk):
     @typing_extensions.override
     def destroy(self) -> None:
         manager.remove_event(self.theme)
+        self.dispatcher.close()
         return tkinter.Toplevel.destroy(self)
 
 
@@ -314,6 +322,7 @@ class Canvas(tkinter.Canvas):
         *,
         expand: typing.Literal["", "x", "y", "xy"] = "xy",
         zoom_item: bool = False,
+        parallel_zoom: bool = False,
         keep_ratio: typing.Literal["min", "max"] | None = None,
         free_anchor: bool = False,
         name: str | None = None,
@@ -323,6 +332,8 @@ class Canvas(tkinter.Canvas):
         * `master`: parent widget
         * `expand`: the mode of expand, `x` is horizontal, and `y` is vertical
         * `zoom_item`: whether or not to scale its items
+        * `parallel_zoom`: whether to rescale images in a thread pool when its items are scaled,
+        it only works when Pillow is installed
         * `keep_ratio`: the mode of aspect ratio, `min` follows the minimum value, `max` follows
         the maximum value
         * `free_anchor`: whether the anchor point is free-floating
@@ -347,9 +358,12 @@ class Canvas(tkinter.Canvas):
 
         self.name = name
         self.events: list[str] = []
+        self.layer: virtual.RasterLayer | None = None
+        """The raster layer of the `Canvas` when it is frozen"""
 
         self._expand: typing.Literal["", "x", "y", "xy"] = expand
         self._zoom_item = zoom_item
+        self.parallel_zoom = parallel_zoom
         self._free_anchor = free_anchor
         self._keep_ratio: typing.Literal["min", "max"] | None = keep_ratio
 
@@ -389,6 +403,32 @@ class Canvas(tkinter.Canvas):
         """Return the aspect zoom ratio of the widget"""
         return tuple(i/j for i, j in zip(self._size, self._initial_size))
 
+    @property
+    def is_frozen(self) -> bool:
+        """Whether the widgets of the `Canvas` are frozen"""
+        return self.layer is not None
+
+    def freeze(self) -> None:
+        """Replace the shapes of all widgets with one static image and stop the widgets from
+        receiving events, call it again to draw the image again after the widgets are changed
+
+        It does nothing if no shape can be drawn, for example when Pillow is not installed.
+        """
+        for widget in self.widgets:
+            widget.thaw()
+        if self.layer is None:
+            self.layer = virtual.RasterLayer(self, ())
+        self.layer.widgets = set(self.widgets)
+        self.layer.render()
+        if self.layer.item is None:
+            self.thaw()
+
+    def thaw(self) -> None:
+        """Restore the widgets frozen by method `freeze`"""
+        if self.layer is not None:
+            self.layer.remove()
+            self.layer = None
+
     def theme(self, dark: bool) -> None:
         """Change the color theme of the Canvas and its items
 
@@ -468,6 +508,8 @@ class Canvas(tkinter.Canvas):
             self._zoom_children(relative_ratio)
             for widget in self.widgets:
                 widget.zoom(relative_ratio)
+            if self.layer is not None:
+                self.layer.schedule()
 
         for canvas in self.canvases:
             canvas.re_place()
@@ -497,6 +539,9 @@ class Canvas(tkinter.Canvas):
         self.widgets.clear()
         self.items.clear()
         self.images.clear()
+        if self.layer is not None:
+            self.layer.cancel()
+            self.layer = None
         for child in self.children.values():
             child.destroy()
         self.delete(*self.find_all())
@@ -525,7 +570,7 @@ class Canvas(tkinter.Canvas):
         """Events to move the mouse"""
         self.trigger_config.reset()
         for widget in self.widgets[::-1]:
-            if hasattr(widget, "feature") and not widget.is_disappeared:
+            if hasattr(widget, "feature") and not widget.is_disappeared and not widget.is_frozen:
                 flag = widget.feature.get_method(name)(event)
                 if widget.through is None:
                     if flag:
@@ -539,7 +584,7 @@ class Canvas(tkinter.Canvas):
         self.focus_set()
         self.trigger_focus.reset()
         for widget in self.widgets[::-1]:
-            if hasattr(widget, "feature") and not widget.is_disappeared:
+            if hasattr(widget, "feature") and not widget.is_disappeared and not widget.is_frozen:
                 if widget.feature.get_method(name)(event) and not widget.through:
                     event.x = math.nan
         self.trigger_focus.update(True, "")
@@ -547,7 +592,7 @@ class Canvas(tkinter.Canvas):
     def _release(self, event: tkinter.Event, name: str) -> None:
         """Events to release the mouse"""
         for widget in self.widgets[::-1]:
-            if hasattr(widget, "feature") and not widget.is_disappeared:
+            if hasattr(widget, "feature") and not widget.is_disappeared and not widget.is_frozen:
                 if widget.feature.get_method(name)(event) and not widget.through:
                     event.x = math.nan
 
@@ -556,21 +601,21 @@ class Canvas(tkinter.Canvas):
         if type_ is not None:
             event.delta = 120 if type_ else -120
         for widget in self.widgets[::-1]:
-            if hasattr(widget, "feature") and not widget.is_disappeared:
+            if hasattr(widget, "feature") and not widget.is_disappeared and not widget.is_frozen:
                 if widget.feature.get_method("<MouseWheel>")(event) and not widget.through:
                     event.x = math.nan
 
     def _key_press(self, event: tkinter.Event) -> None:
         """Events for typing"""
         for widget in self.widgets[::-1]:
-            if hasattr(widget, "feature") and not widget.is_disappeared:
+            if hasattr(widget, "feature") and not widget.is_disappeared and not widget.is_frozen:
                 if widget.feature.get_method("<KeyPress>")(event) and not widget.through:
                     event.x = math.nan
 
     def _key_release(self, event: tkinter.Event) -> None:
         """Events for typing"""
         for widget in self.widgets[::-1]:
-            if hasattr(widget, "feature") and not widget.is_disappeared:
+            if hasattr(widget, "feature") and not widget.is_disappeared and not widget.is_frozen:
                 if widget.feature.get_method("<KeyRelease>")(event) and not widget.through:
                     event.x = math.nan
 
@@ -583,7 +628,8 @@ class Canvas(tkinter.Canvas):
         """Register a event to process"""
         def _handle_event(event: tkinter.Event) -> None:
             for widget in self.widgets[::-1]:
-                if hasattr(widget, "feature"):
+                if hasattr(widget, "feature") and not widget.is_disappeared \
+                        and not widget.is_frozen:
                     if widget.feature.get_method(name)(event) and not widget.through:
                         pass
         return self.bind(name, _handle_event, add)
@@ -598,6 +644,7 @@ class Frame(Canvas):
         *,
         expand: typing.Literal["", "x", "y", "xy"] = "xy",
         zoom_item: bool = False,
+        parallel_zoom: bool = False,
         keep_ratio: typing.Literal["min", "max"] | None = None,
         free_anchor: bool = False,
         name: str | None = None,
@@ -607,10 +654,13 @@ class Frame(Canvas):
         * `master`: parent widget
         * `expand`: the mode of expand, `x` is horizontal, and `y` is vertical
         * `zoom_item`: whether or not to scale its items
+        * `parallel_zoom`: whether to rescale images in a thread pool when its items are scaled,
+        it only works when Pillow is installed
         * `keep_ratio`: the mode of aspect ratio, `min` follows the minimum value, `max` follows
         the maximum value
         * `free_anchor`: whether the anchor point is free-floating
         * `kwargs`: compatible with other parameters of class `tkinter.Canvas`
         """
-        Canvas.__init__(self, master, expand=expand, zoom_item=zoom_item, keep_ratio=keep_ratio,
+        Canvas.__init__(self, master, expand=expand, zoom_item=zoom_item,
+                        parallel_zoom=parallel_zoom, keep_ratio=keep_ratio,
                         free_anchor=free_anchor, name=name, **kwargs)
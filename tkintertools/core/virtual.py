@@ -19,12 +19,16 @@ __all__ = [
     "Image",
     "Feature",
     "Widget",
+    "RasterLayer",
 ]
 
 import abc
 import collections.abc
+import concurrent.futures
 import copy
+import itertools
 import math
+import os
 import re
 import tkinter
 import tkinter.font
@@ -40,6 +44,9 @@ from ..style import parser
 from ..toolbox import enhanced
 from . import configs, containers
 
+_TAG_PREFIX: typing.Final[str] = "widget:"
+"""Prefix of the tags that widgets add to their items"""
+
 
 class Component(abc.ABC):
     """The basic part of a `Widget`"""
@@ -82,12 +89,16 @@ class Component(abc.ABC):
 
         widget.register(self)
 
-    def move(self, dx: float, dy: float) -> None:
-        """Move the `Component`"""
+    def move(self, dx: float, dy: float, *, by_tag: bool = False) -> None:
+        """Move the `Component`
+
+        * `by_tag`: whether its items have been moved with the tag of its widget
+        """
         self.position[0] += dx
         self.position[1] += dy
-        for item in self.items:
-            self.widget.master.move(item, dx, dy)
+        if not by_tag:
+            for item in self.items:
+                self.widget.master.move(item, dx, dy)
 
     def moveto(self, x: float, y: float) -> None:
         """Move the `Component` to a certain position"""
@@ -142,7 +153,8 @@ class Component(abc.ABC):
     def configure(self, style: dict[str, str], *, no_delay: bool = False) -> None:
         """Configure properties of `Component` and update them immediately"""
         for item in self.items:
-            tags = self.widget.master.itemcget(item, "tags").split()
+            tags = [tag for tag in self.widget.master.itemcget(item, "tags").split()
+                    if tag != "current" and not tag.startswith(_TAG_PREFIX)]
             kwargs = {key: value for key, param
                       in zip(tags[0:-1:2], tags[1:len(tags):2])
                       if (value := style.get(param)) is not None}
@@ -173,14 +185,15 @@ class Component(abc.ABC):
         """Let the component to disappear"""
         self.visible = not value
         if value:
-            temp_style = copy.deepcopy(self.styles.get(self.widget.state, None))
-            if temp_style is None:
-                return
-            for arg in temp_style:
-                temp_style[arg] = ""
-            self.configure(temp_style, no_delay=no_delay)
+            for item in self.items:
+                self.widget.master.itemconfigure(item, state="hidden")
         else:
             self.update(self.widget.state, no_delay=no_delay)
+            if not self.widget.is_disappeared:
+                for item in self.items:
+                    self.widget.master.itemconfigure(item, state="")
+        if (layer := self.widget._get_layer()) is not None:  # pylint: disable=protected-access
+            layer.render()
 
     def __getitem__(self, key: str) -> dict[str, str]:
         """Easy to get style data"""
@@ -362,9 +375,64 @@ class Image(Component):
         """
         self.image = image
         self.initail_image = image
+        self._loading: concurrent.futures.Future | None = None
+        self._rescaling: concurrent.futures.Future | None = None
         Component.__init__(self, widget, relative_position, size, name=name,
                            animation=animation, styles=styles, **kwargs)
 
+    @typing_extensions.override
+    def destroy(self) -> None:
+        """Destroy the `Component` and cancel the loading of its image"""
+        self.cancel_load()
+        Component.destroy(self)
+
+    def set(self, image: enhanced.PhotoImage | None) -> None:
+        """Set the image of the `Image`, it is scaled according to the `Canvas`"""
+        if self._rescaling is not None:  # The result is stale now
+            enhanced.loader.cancel(self._rescaling)
+            self._rescaling = None
+        self.initail_image = image
+        if image is not None and hasattr(self.widget.master, "_size"):  # Canvas is initialized
+            if (ratios := self.widget.master.ratios) != (1, 1):
+                image = image.scale(*ratios)
+        self.image = image
+        for item in self.items:
+            self.widget.master.itemconfigure(item, image=image)
+
+    def load(
+        self,
+        file: str | os.PathLike,
+        size: tuple[int, int] | None = None,
+        *,
+        placeholder: enhanced.PhotoImage | None = None,
+    ) -> concurrent.futures.Future:
+        """Load an image asynchronously, and display it when it is ready
+
+        * `file`: path of the image
+        * `size`: size that the image is resized to, `None` means the original size
+        * `placeholder`: image displayed until the image is ready
+        """
+        self.cancel_load()
+        if placeholder is not None:
+            self.set(placeholder)
+        self._loading = enhanced.load_async(
+            file, size, callback=self._load_callback, master=self.widget.master)
+        return self._loading
+
+    def cancel_load(self) -> None:
+        """Cancel the loading and the rescaling of the image if they are not finished"""
+        if self._loading is not None:
+            enhanced.loader.cancel(self._loading)
+            self._loading = None
+        if self._rescaling is not None:
+            enhanced.loader.cancel(self._rescaling)
+            self._rescaling = None
+
+    def _load_callback(self, image: enhanced.PhotoImage) -> None:
+        """Display the loaded image"""
+        self._loading = None
+        self.set(image)
+
     @typing_extensions.override
     def zoom(
         self,
@@ -376,8 +444,27 @@ class Image(Component):
         """Scale the image"""
         Component.zoom(self, ratios, zoom_position=zoom_position, zoom_size=zoom_size)
         if self.initail_image is None:
+            if self._loading is not None:  # It is scaled when it is loaded
+                return
             raise RuntimeError("Image is empty.")
-        self.image = self.initail_image.scale(*self.widget.master.ratios)
+        ratios = self.widget.master.ratios
+        if self.widget.master.parallel_zoom and hasattr(type(self.initail_image), "source"):
+            if self._rescaling is not None:  # The result is stale now
+                enhanced.loader.cancel(self._rescaling)
+            self._rescaling = enhanced.loader.resize(
+                self.initail_image,
+                (round(ratios[0]*self.initail_image.width()),
+                 round(ratios[1]*self.initail_image.height())),
+                callback=self._rescale_callback, master=self.widget.master)
+            return
+        self.image = self.initail_image.scale(*ratios)
+        for item in self.items:
+            self.widget.master.itemconfigure(item, image=self.image)
+
+    def _rescale_callback(self, image: enhanced.PhotoImage) -> None:
+        """Display the image rescaled in the thread pool"""
+        self._rescaling = None
+        self.image = image
         for item in self.items:
             self.widget.master.itemconfigure(item, image=self.image)
 
@@ -425,6 +512,8 @@ class Widget:
     `Widget` = `Shape` + `Text` + `Image` + `Feature` + `Widget`
     """
 
+    _counter: typing.ClassVar[itertools.count] = itertools.count()
+
     def __init__(
         self,
         master: containers.Canvas | Widget,
@@ -458,6 +547,9 @@ class Widget:
             self.position: list[int | float] = list(position)
             self.size: list[int | float] = [0, 0] if size is None else list(size)
 
+        self.tag = f"{_TAG_PREFIX}{next(Widget._counter)}"
+        self.tags: tuple[str, ...] = (self.tag,) if self.widget is None \
+            else (self.tag, *self.widget.tags)
         self.name = name
         self.state = state
         self.anchor = anchor
@@ -474,6 +566,8 @@ class Widget:
         self.state_before_disabled: str = ""
         self._update_hooks: list[collections.abc.Callable[[str, bool], typing.Any]] = []
         self._is_disappeared: bool = False
+        self.layer: RasterLayer | None = None
+        """The raster layer of the widget when it is frozen"""
 
         self.master.widgets.append(self)
 
@@ -484,8 +578,15 @@ class Widget:
 
     @property
     def is_disappeared(self) -> bool:
-        """Whether the widget is forgoted"""
-        return self._is_disappeared
+        """Whether the widget or a parent widget is forgoted"""
+        if self._is_disappeared:
+            return True
+        return self.widget is not None and self.widget.is_disappeared
+
+    @property
+    def is_frozen(self) -> bool:
+        """Whether the widget is frozen by itself, a parent widget or its canvas"""
+        return self._get_layer() is not None
 
     @property
     def offset(self) -> tuple[float, float]:
@@ -506,6 +607,27 @@ class Widget:
         """Whether the widget is a nested widget"""
         return self.widget is not None
 
+    def _walk(self) -> collections.abc.Iterator[Widget]:
+        """Iterate over the widget and all its nested widgets"""
+        widgets = [self]
+        while widgets:
+            yield (widget := widgets.pop())
+            widgets.extend(reversed(widget.widgets))
+
+    def _get_layer(self) -> RasterLayer | None:
+        """Return the raster layer that the widget is frozen in
+
+        Widgets created after a parent widget or the canvas was frozen are not in its layer.
+        """
+        widget = self
+        while widget is not None:
+            if widget.layer is not None and self in widget.layer.widgets:
+                return widget.layer
+            widget = widget.widget
+        if self.master.layer is not None and self in self.master.layer.widgets:
+            return self.master.layer
+        return None
+
     def register(self, component: Component) -> None:
         """Register a component to the widget"""
         if isinstance(component, Shape):
@@ -516,6 +638,11 @@ class Widget:
             self.images.append(component)
         component.display()
         component.coords()
+        for item in component.items:
+            for tag in self.tags:
+                self.master.addtag_withtag(tag, item)
+            if self.is_disappeared:
+                self.master.itemconfigure(item, state="hidden")
         component.update(no_delay=True)
 
     def deregister(self, component: Component) -> None:
@@ -633,28 +760,91 @@ class Widget:
             self.update(last_state, no_delay=True)
 
     def disappear(self, value: bool = True) -> None:
-        """Let all components of the widget to disappear"""
-        for widget in self.widgets:
-            widget.disappear(value)
+        """Let the widget and its nested widgets to disappear
+
+        Nested widgets and components that have disappeared by themselves remain hidden when the
+        widget appears again.
+        """
         self._is_disappeared = value
-        for component in self.components:
-            component.disappear(value)
+        if not value and self.is_disappeared:
+            return  # A parent widget is still hidden
+        self.master.itemconfigure(self.tag, state="hidden" if value else "")
+        layers = {self._get_layer()}
+        for widget in self._walk():
+            layers.add(widget.layer)
+            if value:
+                continue
+            if widget.is_disappeared:
+                self.master.itemconfigure(widget.tag, state="hidden")
+                continue
+            for component in widget.components:
+                if not component.visible:
+                    for item in component.items:
+                        self.master.itemconfigure(item, state="hidden")
+        layers.discard(None)
+        for layer in layers:
+            layer.render()  # Draw without hidden items, or hide the replaced items again
 
     def move(self, dx: int | float, dy: int | float) -> None:
         """Move the widget"""
-        self.position[0] += dx
-        self.position[1] += dy
-        for widget in self.widgets:
-            widget.move(dx, dy)
-        for component in self.components:
-            component.move(dx, dy)
+        self.master.move(self.tag, dx, dy)
+        for widget in self._walk():
+            widget.position[0] += dx
+            widget.position[1] += dy
+            for component in widget.components:
+                component.move(dx, dy, by_tag=True)
 
     def moveto(self, x: int, y: int) -> None:
         """Move the Widget to a certain position"""
         return self.move(x-self.position[0], y-self.position[1])
 
+    def lift(self) -> None:
+        """Raise the widget and its nested widgets above all other items of the canvas"""
+        self.master.tag_raise(self.tag)
+        widgets = set(self._walk())
+        self.master.widgets.sort(key=lambda widget: widget in widgets)
+
+    def lower(self) -> None:
+        """Lower the widget and its nested widgets below all other items of the canvas"""
+        self.master.tag_lower(self.tag)
+        widgets = set(self._walk())
+        self.master.widgets.sort(key=lambda widget: widget not in widgets)
+
+    def freeze(self) -> None:
+        """Replace the shapes of the widget and its nested widgets with one static image and stop
+        them from receiving events
+
+        Call it again to draw the image again after the widget is changed. It does nothing if the
+        widget is frozen with a parent widget or its canvas, or if no shape can be drawn, for
+        example when Pillow is not installed.
+        """
+        if self.layer is None and self.is_frozen:
+            return
+        for widget in self._walk():
+            if widget is not self:
+                widget.thaw()
+            for component in widget.components:
+                if component.gradient is not None:
+                    component.update(no_delay=True)
+        if self.layer is None:
+            self.layer = RasterLayer(self.master, (), tags=self.tags)
+        self.layer.widgets = set(self._walk())
+        self.layer.render()
+        if self.layer.item is None:
+            self.thaw()
+
+    def thaw(self) -> None:
+        """Restore the widget frozen by method `freeze`"""
+        if self.layer is None:
+            return
+        self.layer.remove()
+        self.layer = None
+
     def destroy(self) -> None:
         """Destroy the widget"""
+        self.thaw()
+        if (layer := self._get_layer()) is not None:
+            layer.widgets.difference_update(self._walk())
         self.master.widgets.remove(self)
         del self.feature
 
@@ -665,6 +855,8 @@ class Widget:
             widget.destroy()
         for component in self.components:
             component.destroy()
+        if layer is not None:
+            layer.render()  # Remove the destroyed shapes from the image
 
     def detect(self, x: int, y: int) -> bool:
         """Detect whether the specified coordinates are within the `Widget`"""
@@ -698,3 +890,85 @@ class Widget:
 
         for component in self.components:
             component.zoom(ratios, zoom_position=zoom_position, zoom_size=zoom_size)
+
+        if self.layer is not None:
+            self.layer.schedule()
+
+
+class RasterLayer:
+    """A static image that replaces the shapes of some widgets on a canvas
+
+    Only the items that `enhanced.rasterize` can draw are replaced, the others, such as texts and
+    images, remain on the canvas. The replaced items are hidden, so they can still be changed.
+    Widgets and components that have disappeared are not drawn.
+    """
+
+    def __init__(
+        self,
+        canvas: containers.Canvas,
+        widgets: collections.abc.Iterable[Widget],
+        *,
+        tags: tuple[str, ...] = (),
+    ) -> None:
+        """
+        * `canvas`: the canvas where the widgets are
+        * `widgets`: widgets whose shapes are replaced, they are frozen in the layer
+        * `tags`: tags of the image, the image moves with the items that have the same tags
+        """
+        self.canvas = canvas
+        self.widgets: set[Widget] = set(widgets)
+        self.tags = tags
+        self.item: int | None = None
+        self.image: enhanced.PhotoImage | None = None
+        self.items: list[int] = []
+        self._after_id: str | None = None
+
+    def render(self) -> None:
+        """Draw the items on the image and hide them"""
+        self.cancel()
+        if (result := enhanced.rasterize(self.canvas, self._get_items())) is None:
+            self._delete()
+            self.items = []
+            return None
+        self.image, (x, y), self.items = result
+        if self.item is None:
+            self.item = self.canvas.create_image(
+                x, y, anchor="nw", image=self.image, tags=self.tags)
+        else:
+            self.canvas.coords(self.item, x, y)
+            self.canvas.itemconfigure(self.item, image=self.image)
+        self.canvas.tag_lower(self.item, self.items[0])
+        for item in self.items:
+            self.canvas.itemconfigure(item, state="hidden")
+        return None
+
+    def schedule(self) -> None:
+        """Render the image again when Tk is idle, repeated calls before that only render once"""
+        if self._after_id is None:
+            self._after_id = self.canvas.after_idle(self.render)
+
+    def cancel(self) -> None:
+        """Cancel the scheduled rendering"""
+        if self._after_id is not None:
+            self.canvas.after_cancel(self._after_id)
+            self._after_id = None
+
+    def remove(self) -> None:
+        """Delete the image and show the replaced items that are still visible"""
+        self.cancel()
+        self._delete()
+        for item in set(self.items).intersection(self._get_items()):
+            self.canvas.itemconfigure(item, state="")
+        self.items = []
+
+    def _get_items(self) -> list[int]:
+        """Return visible items of the widgets"""
+        return [item for widget in self.widgets if not widget.is_disappeared
+                for component in widget.components if component.visible
+                for item in component.items]
+
+    def _delete(self) -> None:
+        """Delete the image"""
+        if self.item is not None:
+            self.canvas.delete(self.item)
+            self.item = self.image = None
@@ -14,6 +14,7 @@ __all__ = [
     "RadioButtonFeature",
     "ProgressBarFeature",
     "InputBoxFeature",
+    "TextBoxFeature",
     "SliderFeature",
     "SpinBoxFeature",
 ]
@@ -366,7 +367,10 @@ class InputBoxFeature(ButtonFeature):
                 self.widget.texts[0].text_proxy.select_clear()
                 self.widget.texts[0].remove(*select)
             if value := self.widget.master.clipboard_get():
-                self.widget.texts[0].append(value)
+                if (index := self.widget.texts[0].text_proxy.cursor_get()) is None:
+                    self.widget.texts[0].append(value, truncate=True)
+                else:
+                    self.widget.texts[0].insert(index, value, truncate=True)
         return flag
 
     def _cut(self, event: tkinter.Event) -> bool:
@@ -383,6 +387,72 @@ class InputBoxFeature(ButtonFeature):
         return flag
 
 
+class TextBoxFeature(virtual.Feature):
+    """Feature of text box"""
+
+    def _motion(self, event: tkinter.Event) -> bool:
+        if flag := self.widget.shapes[0].detect(event.x, event.y):
+            self.widget.master.trigger_config.update(cursor="xterm")
+            if self.widget.state == "normal":
+                self.widget.update("hover")
+        else:
+            if self.widget.state == "hover":
+                self.widget.update("normal")
+        return flag
+
+    def _button_1(self, event: tkinter.Event) -> bool:
+        if flag := self.widget.shapes[0].detect(event.x, event.y):
+            self.widget.update("active")
+            if self.widget.state == "active":  # Maybe widget is disabled
+                self.widget.master.trigger_focus.update(True, self.widget.texts[0].items[0])
+                self.widget.texts[0].cursor_set(
+                    self.widget.texts[0].cursor_find(event.x, event.y))
+        else:
+            if self.widget.state != "normal":
+                self.widget.update("normal")
+        return flag
+
+    def _mouse_wheel(self, event: tkinter.Event) -> bool:
+        if flag := self.widget.shapes[0].detect(event.x, event.y):
+            self.widget.texts[0].scroll(-3 if event.delta > 0 else 3)
+        return flag
+
+    def _key_press(self, event: tkinter.Event) -> bool:
+        if self.widget.state == "active":
+            text = self.widget.texts[0]
+            match event.keysym:
+                case "Right":
+                    text.cursor_move(1)
+                case "Left":
+                    text.cursor_move(-1)
+                case "Up":
+                    text.cursor_move_line(-1)
+                case "Down":
+                    text.cursor_move_line(1)
+                case "Prior":
+                    text.cursor_move_line(-len(text.items))
+                case "Next":
+                    text.cursor_move_line(len(text.items))
+                case "BackSpace":
+                    if text.cursor > 0:
+                        text.remove(text.cursor - 1)
+                case "Delete":
+                    if text.cursor < len(text.table):
+                        text.remove(text.cursor)
+                case "Return":
+                    text.insert(text.cursor, "\n")
+                case _:
+                    if len(event.char) and event.char.isprintable():
+                        text.insert(text.cursor, event.char)
+        return False
+
+    def _paste(self, _: tkinter.Event) -> bool:
+        if flag := self.widget.state == "active":
+            if value := self.widget.master.clipboard_get():
+                self.widget.texts[0].insert(self.widget.texts[0].cursor, value, truncate=True)
+        return flag
+
+
 class SliderFeature(virtual.Feature):
     """Feature of Slider"""
 
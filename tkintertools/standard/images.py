@@ -4,12 +4,30 @@ from __future__ import annotations
 
 __all__ = [
     "StillImage",
+    "DoubleBufferedImage",
+    "TiledImage",
+    "MappedImageSource",
+    "PillowImageSource",
 ]
 
+import collections
+import math
+import mmap
+import os
+import threading
+import time
+import tkinter
+import typing
+
 import typing_extensions
 
 from ..core import virtual
 
+try:
+    from PIL import Image
+except ImportError:
+    pass
+
 
 class StillImage(virtual.Image):
     """A simple still image"""
@@ -29,3 +47,449 @@ class StillImage(virtual.Image):
         super().coords(size, position)
 
         self.widget.master.coords(self.items[0], *self.center())
+
+
+class DoubleBufferedImage(virtual.Image):
+    """An image that displays a stream of frames with two reusable buffers
+
+    Frames are uploaded to the hidden buffer, and then the buffers are swapped. Only the latest
+    frame is displayed when frames are pushed faster than `max_fps`, the others are dropped. The
+    rendering is only scheduled while a frame is waiting.
+    """
+
+    def __init__(
+        self,
+        widget: virtual.Widget,
+        relative_position: tuple[int, int] = (0, 0),
+        size: tuple[int, int] | None = None,
+        *,
+        max_fps: int = 60,
+        name: str | None = None,
+        animation: bool = True,
+        styles: dict[str, dict[str, str]] | None = None,
+        **kwargs,
+    ) -> None:
+        """
+        * `widget`: parent widget
+        * `relative_position`: position relative to its widgets
+        * `size`: size of component
+        * `max_fps`: the maximum number of frames displayed per second
+        * `name`: name of component
+        * `animation`: Wether use animation to change color
+        * `styles`: style dict of component
+        * `kwargs`: extra parameters for CanvasItem
+        """
+        self.buffers = [tkinter.PhotoImage(master=widget.master),
+                        tkinter.PhotoImage(master=widget.master)]
+        self.max_fps = max_fps
+        self.dropped = 0
+        self._frame: tuple[tuple[int, int], bytes] | None = None
+        self._lock = threading.Lock()
+        self._times: collections.deque[float] = collections.deque()
+        self._last: float = -math.inf  # Time of the last displayed frame
+        self._after_id: str | None = None
+        self._closed: bool = False
+        virtual.Image.__init__(self, widget, relative_position, size, image=self.buffers[0],
+                               name=name, animation=animation, styles=styles, **kwargs)
+
+    @property
+    def fps(self) -> float:
+        """The number of frames displayed in the last second"""
+        now = time.perf_counter()
+        while self._times and now - self._times[0] > 1:
+            self._times.popleft()
+        return float(len(self._times))
+
+    @typing_extensions.override
+    def display(self) -> None:
+        """Display the `Component` on a `Canvas`"""
+        self.items = [self.widget.master.create_image(0, 0, image=self.image, **self.kwargs)]
+
+    @typing_extensions.override
+    def coords(
+        self,
+        size: tuple[float, float] | None = None,
+        position: tuple[float, float] | None = None,
+    ) -> None:
+        """Resize the `Component`"""
+        super().coords(size, position)
+
+        self.widget.master.coords(self.items[0], *self.center())
+
+    @typing_extensions.override
+    def zoom(
+        self,
+        ratios: tuple[float, float],
+        *,
+        zoom_position: bool = True,
+        zoom_size: bool = True,
+    ) -> None:
+        """Move the image, frames are always displayed in their own size"""
+        virtual.Component.zoom(
+            self, ratios, zoom_position=zoom_position, zoom_size=zoom_size)
+
+    @typing_extensions.override
+    def destroy(self) -> None:
+        """Destroy the `Component` and stop displaying frames"""
+        self._closed = True
+        if self._after_id is not None:
+            self.widget.master.after_cancel(self._after_id)
+        virtual.Image.destroy(self)
+
+    def push(self, frame: typing.Any, size: tuple[int, int] | None = None) -> None:
+        """Push a frame of RGB pixels, it can be called from any thread
+
+        * `frame`: `bytes`, `bytearray`, `memoryview` or a NumPy array of shape (height, width, 3)
+        with dtype uint8
+        * `size`: size of the frame, it is required unless `frame` is a NumPy array
+        """
+        if len(shape := getattr(frame, "shape", ())) == 3:
+            size = shape[1], shape[0]
+        elif size is None:
+            raise ValueError("The size of the frame is required.")
+        data = memoryview(frame).tobytes()
+        if len(data) != size[0]*size[1]*3:
+            raise ValueError(f"Expected {size[0]*size[1]*3} bytes, got {len(data)}.")
+        data = b"P6 %d %d 255\n" % size + data
+        with self._lock:
+            if scheduled := self._frame is not None:  # The rendering has been scheduled
+                self.dropped += 1
+            self._frame = size, data
+        if scheduled or self._closed:
+            return
+        delay = self._last + 1/self.max_fps - time.perf_counter()
+        # tkinter marshals the call when it comes from another thread, so the lock is not held
+        self._after_id = self.widget.master.after(round(max(delay, 0)*1000), self._render)
+
+    def _render(self) -> None:
+        """Upload the latest frame to the hidden buffer and swap the buffers"""
+        with self._lock:
+            frame, self._frame, self._after_id = self._frame, None, None
+        if frame is None or self._closed:
+            return
+        (width, height), data = frame
+        back = self.buffers[1]
+        if back.width() != width or back.height() != height:
+            back.configure(width=width, height=height)
+        back.tk.call(back, "put", data, "-format", "ppm")
+        self.widget.master.itemconfigure(self.items[0], image=back)
+        self.buffers.reverse()
+        self.image = back
+        self._last = now = time.perf_counter()
+        self._times.append(now)
+        while now - self._times[0] > 1:
+            self._times.popleft()
+
+
+class MappedImageSource:
+    """Memory-mapped source of raw RGB pixels or a binary PPM file
+
+    Only the pixels that are read are loaded into memory by the operating system.
+    """
+
+    def __init__(
+        self,
+        file: str | os.PathLike,
+        size: tuple[int, int] | None = None,
+        *,
+        offset: int = 0,
+    ) -> None:
+        """
+        * `file`: path of the file
+        * `size`: size of the raw pixels, `None` means that the file is a binary PPM file
+        * `offset`: offset of raw pixels in the file, it is ignored for PPM files
+        """
+        with open(file, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if size is None:
+            size, offset = self._parse_header()
+        self.width, self.height = size
+        self.offset = offset
+
+    def _parse_header(self) -> tuple[tuple[int, int], int]:
+        """Parse the header of a PPM file, return the size and the offset of pixels"""
+        values: list[int] = []
+        index = 2
+        if self._map[:2] != b"P6":
+            raise ValueError("Only binary PPM files are supported.")
+        while len(values) < 3:
+            while self._map[index:index+1].isspace():
+                index += 1
+            if self._map[index:index+1] == b"#":  # Comment
+                index = self._map.find(b"\n", index) + 1
+                continue
+            end = index
+            while self._map[end:end+1].isdigit():
+                end += 1
+            values.append(int(self._map[index:end]))
+            index = end
+        if values[2] != 255:
+            raise ValueError("Only 8-bit PPM files are supported.")
+        return (values[0], values[1]), index + 1
+
+    def read(self, x: int, y: int, width: int, height: int, step: int = 1) -> bytes:
+        """Read RGB pixels of a region, every `step` pixels are taken in both directions
+
+        * `x`: x-coordinate of the upper left corner
+        * `y`: y-coordinate of the upper left corner
+        * `width`: width of the region
+        * `height`: height of the region
+        * `step`: interval of pixels that are taken
+        """
+        stride, pixels = self.width * 3, bytearray()
+        for j in range(y, y + height, step):
+            start = self.offset + j*stride + x*3
+            row = self._map[start:start+width*3]
+            if step > 1:
+                row, full = bytearray(-(-width//step) * 3), row
+                for channel in range(3):
+                    row[channel::3] = full[channel::3*step]
+            pixels += row
+        return bytes(pixels)
+
+    def close(self) -> None:
+        """Close the file"""
+        self._map.close()
+
+
+class PillowImageSource:
+    """Source of an image opened by Pillow
+
+    Unlike `MappedImageSource`, it is not read lazily: Pillow decodes the whole image the first time
+    a region of it is read. JPEG images are decoded at a reduced scale when they are read with a
+    large `step`, which makes zoomed out views much cheaper.
+    """
+
+    def __init__(self, file: str | os.PathLike) -> None:
+        """
+        * `file`: path of the file
+        """
+        self.file = file
+        self.image = Image.open(file)
+        self.width, self.height = self.image.size
+        self._drafts: dict[int, tuple[Image.Image, int]] = {}
+
+    def _get_image(self, step: int) -> tuple[Image.Image, int]:
+        """Get the image to read with `step` and the scale at which it is decoded"""
+        if step == 1:
+            return self.image, 1
+        if (result := self._drafts.get(step)) is None:
+            image = Image.open(self.file)
+            image.draft("RGB", (max(self.width//step, 1), max(self.height//step, 1)))  # Only JPEG
+            scale = round(self.width/image.width)
+            if scale == 1 or step % scale:
+                image.close()
+                result = self.image, 1
+            else:
+                result = image, scale
+            self._drafts[step] = result
+        return result
+
+    def read(self, x: int, y: int, width: int, height: int, step: int = 1) -> bytes:
+        """Read RGB pixels of a region, every `step` pixels are merged in both directions
+
+        * `x`: x-coordinate of the upper left corner
+        * `y`: y-coordinate of the upper left corner
+        * `width`: width of the region
+        * `height`: height of the region
+        * `step`: number of pixels that are merged
+        """
+        image, scale = self._get_image(step)
+        region = image.crop((x//scale, y//scale, min(-(-(x + width)//scale), image.width),
+                             min(-(-(y + height)//scale), image.height)))
+        if step > scale:
+            region = region.reduce(step//scale)
+        return region.convert("RGB").tobytes()
+
+    def close(self) -> None:
+        """Close the file"""
+        for image, _ in self._drafts.values():
+            if image is not self.image:
+                image.close()
+        self.image.close()
+
+
+class TiledImage(virtual.Image):
+    """An image that is displayed in tiles, which is used for very large images
+
+    The image is displayed at the largest power of 2 scale that is not larger than its size, and
+    only the tiles that overlap the visible region of the `Canvas` are decoded and displayed. Tiles
+    are kept in an LRU cache and the tiles around the visible ones are prefetched while idle.
+
+    ATTENTION:
+
+    * The visible region is updated when the component is moved, resized or zoomed, call `refresh`
+    manually after the `Canvas` is scrolled
+    """
+
+    def __init__(
+        self,
+        widget: virtual.Widget,
+        relative_position: tuple[int, int] = (0, 0),
+        size: tuple[int, int] | None = None,
+        *,
+        source: MappedImageSource | PillowImageSource,
+        tile_size: int = 256,
+        cache_size: int = 256,
+        name: str | None = None,
+        animation: bool = True,
+        styles: dict[str, dict[str, str]] | None = None,
+        **kwargs,
+    ) -> None:
+        """
+        * `widget`: parent widget
+        * `relative_position`: position relative to its widgets
+        * `size`: size of component, `None` means the size of the source
+        * `source`: source of the image
+        * `tile_size`: size of tiles, it should be a power of 2
+        * `cache_size`: the maximum number of cached tiles
+        * `name`: name of component
+        * `animation`: Wether use animation to change color
+        * `styles`: style dict of component
+        * `kwargs`: extra parameters for CanvasItem
+        """
+        self.source = source
+        self.tile_size = tile_size
+        self.cache_size = cache_size
+        self._tiles: collections.OrderedDict[tuple[int, int, int], tkinter.PhotoImage] = \
+            collections.OrderedDict()
+        self._visible: dict[tuple[int, int, int], int] = {}  # Tile -> item
+        self._prefetching: list[tuple[int, int, int]] = []
+        self._prefetch_id: str | None = None
+        if size is None:
+            size = source.width, source.height
+        virtual.Image.__init__(self, widget, relative_position, size, name=name,
+                               animation=animation, styles=styles, **kwargs)
+
+    @typing_extensions.override
+    def display(self) -> None:
+        """Display the `Component` on a `Canvas`"""
+        self.items = []
+
+    @typing_extensions.override
+    def coords(
+        self,
+        size: tuple[float, float] | None = None,
+        position: tuple[float, float] | None = None,
+    ) -> None:
+        """Resize the `Component`"""
+        super().coords(size, position)
+        self._clear()
+        self.refresh()
+
+    @typing_extensions.override
+    def move(self, dx: float, dy: float, *, by_tag: bool = False) -> None:
+        """Move the `Component`"""
+        virtual.Image.move(self, dx, dy, by_tag=by_tag)
+        self.refresh()
+
+    @typing_extensions.override
+    def zoom(
+        self,
+        ratios: tuple[float, float],
+        *,
+        zoom_position: bool = True,
+        zoom_size: bool = True,
+    ) -> None:
+        """Scale the image"""
+        self._clear()  # Tiles of another level are displayed after zooming
+        virtual.Component.zoom(
+            self, ratios, zoom_position=zoom_position, zoom_size=zoom_size)
+        self.refresh()
+
+    @typing_extensions.override
+    def destroy(self) -> None:
+        """Destroy the `Component`"""
+        if self._prefetch_id is not None:
+            self.widget.master.after_cancel(self._prefetch_id)
+        virtual.Image.destroy(self)
+        self._tiles.clear()
+
+    def _clear(self) -> None:
+        """Delete all displayed tiles"""
+        self.widget.master.delete(*self._visible.values())
+        self._visible.clear()
+        self.items = []
+
+    def _get_level(self) -> int:
+        """Get the level of the scale, the scale is `2**level`"""
+        scale = min(self.size[0]/self.source.width, self.size[1]/self.source.height)
+        return min(max(math.floor(math.log2(scale)) if scale > 0 else -32, -32), 4)
+
+    def _get_tile(self, key: tuple[int, int, int]) -> tkinter.PhotoImage:
+        """Get a tile from the cache or decode it"""
+        if (tile := self._tiles.get(key)) is not None:
+            self._tiles.move_to_end(key)
+            return tile
+        level, column, row = key
+        step, zoom = 2**max(-level, 0), 2**max(level, 0)
+        span = self.tile_size * step // zoom  # Size of the tile in the source
+        x, y = column*span, row*span
+        width, height = min(span, self.source.width - x), min(span, self.source.height - y)
+        data = self.source.read(x, y, width, height, step)
+        width, height = -(-width//step), -(-height//step)
+        tile = tkinter.PhotoImage(
+            master=self.widget.master, data=b"P6 %d %d 255\n" % (width, height) + data,
+            format="ppm")
+        if zoom > 1:
+            tile, source = tkinter.PhotoImage(
+                master=self.widget.master, width=width*zoom, height=height*zoom), tile
+            tile.tk.call(tile, "copy", source, "-zoom", zoom, zoom)
+        self._tiles[key] = tile
+        while len(self._tiles) > max(self.cache_size, len(self._visible) + 1):
+            oldest = next(iter(self._tiles))
+            if oldest == key or oldest in self._visible:  # Displayed and returned tiles are kept
+                self._tiles.move_to_end(oldest)
+                continue
+            del self._tiles[oldest]
+        return tile
+
+    def _get_range(self, level: int, margin: int = 0) -> tuple[range, range]:
+        """Get ranges of columns and rows of tiles that overlap the visible region"""
+        canvas = self.widget.master
+        scale = 2.0**level
+        columns = math.ceil(self.source.width*scale/self.tile_size)
+        rows = math.ceil(self.source.height*scale/self.tile_size)
+        x1 = canvas.canvasx(0) - self.position[0]
+        y1 = canvas.canvasy(0) - self.position[1]
+        x2 = x1 + canvas.winfo_width()
+        y2 = y1 + canvas.winfo_height()
+        return (range(max(0, math.floor(x1/self.tile_size) - margin),
+                      min(columns, math.ceil(x2/self.tile_size) + margin)),
+                range(max(0, math.floor(y1/self.tile_size) - margin),
+                      min(rows, math.ceil(y2/self.tile_size) + margin)))
+
+    def refresh(self) -> None:
+        """Display the tiles that overlap the visible region of the `Canvas`"""
+        canvas, level = self.widget.master, self._get_level()
+        columns, rows = self._get_range(level)
+        needed = {(level, column, row) for column in columns for row in rows}
+
+        for key in tuple(self._visible):
+            if key not in needed:
+                canvas.delete(self._visible.pop(key))
+        state = "" if self.visible and not self.widget.is_disappeared else "hidden"
+        for key in sorted(needed - self._visible.keys()):
+            self._visible[key] = canvas.create_image(
+                self.position[0] + key[1]*self.tile_size, self.position[1] + key[2]*self.tile_size,
+                image=self._get_tile(key), anchor="nw", state=state, tags=self.widget.tags,
+                **self.kwargs)
+        for key in needed:
+            self._tiles.move_to_end(key)
+        self.items = list(self._visible.values())
+
+        columns, rows = self._get_range(level, 1)
+        self._prefetching = [(level, column, row) for column in columns for row in rows
+                             if (level, column, row) not in self._tiles]
+        if self._prefetching and self._prefetch_id is None:
+            self._prefetch_id = canvas.after_idle(self._prefetch)
+
+    def _prefetch(self) -> None:
+        """Decode a tile around the visible ones, and continue while idle"""
+        self._prefetch_id = None
+        if self._prefetching:
+            key = self._prefetching.pop()
+            if key not in self._tiles:
+                self._get_tile(key)
+            if self._prefetching:
+                self._prefetch_id = self.widget.master.after_idle(self._prefetch)
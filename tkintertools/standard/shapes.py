@@ -12,16 +12,86 @@ __all__ = [
     "SemicircularRectangle",
     "SharpRectangle",
     "Parallelogram",
+    "PolygonRoundedRectangle",
+    "PolygonHalfRoundedRectangle",
+    "PolygonSemicircularRectangle",
+    "RasterRoundedRectangle",
+    "RasterOval",
+    "RasterSemicircularRectangle",
 ]
 
+import abc
+import collections
+import functools
+import itertools
 import math
+import tkinter
 import typing
 import warnings
+import weakref
 
 import typing_extensions
 
 from ..core import virtual
 
+try:
+    from PIL import Image, ImageDraw, ImageTk
+except ImportError:
+    pass
+
+_TCL_PROCS: typing.Final[str] = """
+namespace eval ::tkintertools {
+    proc create_items {canvas options specs} {
+        set ids {}
+        foreach spec $specs {
+            lappend ids [$canvas create {*}$spec {*}$options]
+        }
+        return $ids
+    }
+    proc coords_items {canvas ids coords} {
+        set i 0
+        foreach id $ids {
+            $canvas coords $id {*}[lrange $coords $i [expr {$i+3}]]
+            incr i 4
+        }
+    }
+}
+"""
+"""Tcl procedures that create and resize all items of a shape in one call"""
+
+_registered_roots: weakref.WeakSet[tkinter.Tk] = weakref.WeakSet()
+
+
+def _create_items(
+    canvas: tkinter.Canvas,
+    specs: list[tuple],
+    kwargs: dict[str, typing.Any],
+) -> list[int]:
+    """Create items on a canvas with one Tcl call, the procedures are registered once per Tcl
+    interpreter
+
+    * `canvas`: the canvas
+    * `specs`: type, coordinates and options of each item
+    * `kwargs`: options shared by all items
+    """
+    if (root := canvas.nametowidget(".")) not in _registered_roots:
+        canvas.tk.eval(_TCL_PROCS)
+        _registered_roots.add(root)
+    options = [option for key, value in kwargs.items() if value is not None
+               for option in (f"-{key.rstrip('_')}", value)]
+    ids = canvas.tk.call("::tkintertools::create_items", str(canvas), options, specs)
+    return [int(i) for i in canvas.tk.splitlist(ids)]
+
+
+def _coords_items(canvas: tkinter.Canvas, items: list[int], coords: list[float]) -> None:
+    """Set coordinates of items with one Tcl call, each item takes four values
+
+    * `canvas`: the canvas
+    * `items`: items to resize
+    * `coords`: coordinates of all items
+    """
+    canvas.tk.call("::tkintertools::coords_items", str(canvas), items, coords)
+
 
 class Line(virtual.Shape):
     """Create a line for a widget"""
@@ -214,36 +284,26 @@ class RoundedRectangle(virtual.Shape):
     @typing_extensions.override
     def display(self) -> None:
         """Display the `Component` on a `Canvas`"""
-        self.items = [
-            self.widget.master.create_rectangle(
-                0, 0, 0, 0, outline="", tags=("fill", "fill"), **self.kwargs),
-            self.widget.master.create_rectangle(
-                0, 0, 0, 0, outline="", tags=("fill", "fill"), **self.kwargs),
-            self.widget.master.create_line(  # n
-                0, 0, 0, 0, tags=("fill", "outline"), **self.kwargs),
-            self.widget.master.create_line(  # s
-                0, 0, 0, 0, tags=("fill", "outline"), **self.kwargs),
-            self.widget.master.create_line(  # w
-                0, 0, 0, 0, tags=("fill", "outline"), **self.kwargs),
-            self.widget.master.create_line(  # e
-                0, 0, 0, 0, tags=("fill", "outline"), **self.kwargs),
-            self.widget.master.create_arc(  # nw
-                0, 0, 0, 0, outline="", start=90, tags=("fill", "fill"), **self.kwargs),
-            self.widget.master.create_arc(  # sw
-                0, 0, 0, 0, outline="", start=180, tags=("fill", "fill"), **self.kwargs),
-            self.widget.master.create_arc(  # ne
-                0, 0, 0, 0, outline="", start=0, tags=("fill", "fill"), **self.kwargs),
-            self.widget.master.create_arc(  # se
-                0, 0, 0, 0, outline="", start=-90, tags=("fill", "fill"), **self.kwargs),
-            self.widget.master.create_arc(  # nw
-                0, 0, 0, 0, style="arc", start=90, tags=("outline", "outline"), **self.kwargs),
-            self.widget.master.create_arc(  # sw
-                0, 0, 0, 0, style="arc", start=180, tags=("outline", "outline"), **self.kwargs),
-            self.widget.master.create_arc(  # ne
-                0, 0, 0, 0, style="arc", start=0, tags=("outline", "outline"), **self.kwargs),
-            self.widget.master.create_arc(  # se
-                0, 0, 0, 0, style="arc", start=-90, tags=("outline", "outline"), **self.kwargs),
-        ]
+        self.items = _create_items(self.widget.master, [
+            ("rectangle", 0, 0, 0, 0, "-outline", "", "-tags", ("fill", "fill")),
+            ("rectangle", 0, 0, 0, 0, "-outline", "", "-tags", ("fill", "fill")),
+            ("line", 0, 0, 0, 0, "-tags", ("fill", "outline")),  # n
+            ("line", 0, 0, 0, 0, "-tags", ("fill", "outline")),  # s
+            ("line", 0, 0, 0, 0, "-tags", ("fill", "outline")),  # w
+            ("line", 0, 0, 0, 0, "-tags", ("fill", "outline")),  # e
+            ("arc", 0, 0, 0, 0, "-outline", "", "-start", 90, "-tags", ("fill", "fill")),  # nw
+            ("arc", 0, 0, 0, 0, "-outline", "", "-start", 180, "-tags", ("fill", "fill")),  # sw
+            ("arc", 0, 0, 0, 0, "-outline", "", "-start", 0, "-tags", ("fill", "fill")),  # ne
+            ("arc", 0, 0, 0, 0, "-outline", "", "-start", -90, "-tags", ("fill", "fill")),  # se
+            ("arc", 0, 0, 0, 0, "-style", "arc", "-start", 90,
+             "-tags", ("outline", "outline")),  # nw
+            ("arc", 0, 0, 0, 0, "-style", "arc", "-start", 180,
+             "-tags", ("outline", "outline")),  # sw
+            ("arc", 0, 0, 0, 0, "-style", "arc", "-start", 0,
+             "-tags", ("outline", "outline")),  # ne
+            ("arc", 0, 0, 0, 0, "-style", "arc", "-start", -90,
+             "-tags", ("outline", "outline")),  # se
+        ], self.kwargs)
 
     @typing_extensions.override
     def coords(
@@ -265,20 +325,22 @@ class RoundedRectangle(virtual.Shape):
         elif w < d < h or w < d < h:
             warnings.warn("Parameters are not suitable", UserWarning, 5)
 
-        self.widget.master.coords(self.items[0], x1, y1+r, x2, y2-r+1)
-        self.widget.master.coords(self.items[1], x1+r, y1, x2-r+1, y2)
-        self.widget.master.coords(self.items[2], x1+r, y1, x2-r+1, y1)  # n
-        self.widget.master.coords(self.items[3], x1+r, y2, x2-r+1, y2)  # s
-        self.widget.master.coords(self.items[4], x1, y1+r, x1, y2-r+1)  # w
-        self.widget.master.coords(self.items[5], x2, y1+r, x2, y2-r+1)  # e
-        self.widget.master.coords(self.items[6], x1, y1, x1+d, y1+d)  # nw
-        self.widget.master.coords(self.items[7], x1, y2-d, x1+d, y2)  # sw
-        self.widget.master.coords(self.items[8], x2-d, y1, x2, y1+d)  # ne
-        self.widget.master.coords(self.items[9], x2-d, y2-d, x2, y2)  # se
-        self.widget.master.coords(self.items[10], x1, y1, x1+d, y1+d)  # nw
-        self.widget.master.coords(self.items[11], x1, y2-d, x1+d, y2)  # sw
-        self.widget.master.coords(self.items[12], x2-d, y1, x2, y1+d)  # ne
-        self.widget.master.coords(self.items[13], x2-d, y2-d, x2, y2)  # se
+        _coords_items(self.widget.master, self.items, [
+            x1, y1+r, x2, y2-r+1,
+            x1+r, y1, x2-r+1, y2,
+            x1+r, y1, x2-r+1, y1,  # n
+            x1+r, y2, x2-r+1, y2,  # s
+            x1, y1+r, x1, y2-r+1,  # w
+            x2, y1+r, x2, y2-r+1,  # e
+            x1, y1, x1+d, y1+d,  # nw
+            x1, y2-d, x1+d, y2,  # sw
+            x2-d, y1, x2, y1+d,  # ne
+            x2-d, y2-d, x2, y2,  # se
+            x1, y1, x1+d, y1+d,  # nw
+            x1, y2-d, x1+d, y2,  # sw
+            x2-d, y1, x2, y1+d,  # ne
+            x2-d, y2-d, x2, y2,  # se
+        ])
 
 
 class HalfRoundedRectangle(virtual.Shape):
@@ -317,39 +379,19 @@ class HalfRoundedRectangle(virtual.Shape):
     @typing_extensions.override
     def display(self) -> None:
         """Display the `Component` on a `Canvas`"""
-        self.items = [
-            self.widget.master.create_rectangle(
-                0, 0, 0, 0, outline="", tags=("fill", "fill"), **self.kwargs),
-            self.widget.master.create_rectangle(
-                0, 0, 0, 0, outline="", tags=("fill", "fill"), **self.kwargs),
-            self.widget.master.create_line(  # n
-                0, 0, 0, 0, tags=("fill", "outline"), **self.kwargs),
-            self.widget.master.create_line(  # s
-                0, 0, 0, 0, tags=("fill", "outline"), **self.kwargs),
-            self.widget.master.create_line(  # w
-                0, 0, 0, 0, tags=("fill", "outline"), **self.kwargs),
-            self.widget.master.create_line(  # e
-                0, 0, 0, 0, tags=("fill", "outline"), **self.kwargs),
-        ]
-        self.items += [
-            self.widget.master.create_arc(  # ne
-                0, 0, 0, 0, outline="", start=0, tags=("fill", "fill"), **self.kwargs),
-            self.widget.master.create_arc(  # se
-                0, 0, 0, 0, outline="", start=-90, tags=("fill", "fill"), **self.kwargs),
-            self.widget.master.create_arc(  # ne
-                0, 0, 0, 0, style="arc", start=0, tags=("outline", "outline"), **self.kwargs),
-            self.widget.master.create_arc(  # se
-                0, 0, 0, 0, style="arc", start=-90, tags=("outline", "outline"), **self.kwargs),
-        ] if self.ignore == "left" else [
-            self.widget.master.create_arc(  # nw
-                0, 0, 0, 0, outline="", start=90, tags=("fill", "fill"), **self.kwargs),
-            self.widget.master.create_arc(  # sw
-                0, 0, 0, 0, outline="", start=180, tags=("fill", "fill"), **self.kwargs),
-            self.widget.master.create_arc(  # nw
-                0, 0, 0, 0, style="arc", start=90, tags=("outline", "outline"), **self.kwargs),
-            self.widget.master.create_arc(  # sw
-                0, 0, 0, 0, style="arc", start=180, tags=("outline", "outline"), **self.kwargs),
-        ]
+        starts = (0, -90) if self.ignore == "left" else (90, 180)  # ne, se or nw, sw
+        self.items = _create_items(self.widget.master, [
+            ("rectangle", 0, 0, 0, 0, "-outline", "", "-tags", ("fill", "fill")),
+            ("rectangle", 0, 0, 0, 0, "-outline", "", "-tags", ("fill", "fill")),
+            ("line", 0, 0, 0, 0, "-tags", ("fill", "outline")),  # n
+            ("line", 0, 0, 0, 0, "-tags", ("fill", "outline")),  # s
+            ("line", 0, 0, 0, 0, "-tags", ("fill", "outline")),  # w
+            ("line", 0, 0, 0, 0, "-tags", ("fill", "outline")),  # e
+            *(("arc", 0, 0, 0, 0, "-outline", "", "-start", start, "-tags", ("fill", "fill"))
+              for start in starts),
+            *(("arc", 0, 0, 0, 0, "-style", "arc", "-start", start,
+               "-tags", ("outline", "outline")) for start in starts),
+        ], self.kwargs)
 
     @typing_extensions.override
     def coords(
@@ -374,23 +416,21 @@ class HalfRoundedRectangle(virtual.Shape):
         a = self.ignore != "left"
         b = not a
 
-        self.widget.master.coords(self.items[0], x1, y1+r, x2, y2-r+1)
-        self.widget.master.coords(self.items[1], x1+r*a, y1, x2-r*b+1, y2)
-        self.widget.master.coords(self.items[2], x1+r*a, y1, x2-r*b+1, y1)  # n
-        self.widget.master.coords(self.items[3], x1+r*a, y2, x2-r*b+1, y2)  # s
-        self.widget.master.coords(self.items[4], x1, y1+r*a, x1, y2-r*a+1)  # w
-        self.widget.master.coords(self.items[5], x2, y1+r*b, x2, y2-r*b+1)  # e
+        coords = [
+            x1, y1+r, x2, y2-r+1,
+            x1+r*a, y1, x2-r*b+1, y2,
+            x1+r*a, y1, x2-r*b+1, y1,  # n
+            x1+r*a, y2, x2-r*b+1, y2,  # s
+            x1, y1+r*a, x1, y2-r*a+1,  # w
+            x2, y1+r*b, x2, y2-r*b+1,  # e
+        ]
 
         if self.ignore == "left":
-            self.widget.master.coords(self.items[6], x2-d, y1, x2, y1+d)  # ne
-            self.widget.master.coords(self.items[7], x2-d, y2-d, x2, y2)  # se
-            self.widget.master.coords(self.items[8], x2-d, y1, x2, y1+d)  # ne
-            self.widget.master.coords(self.items[9], x2-d, y2-d, x2, y2)  # se
+            corners = [x2-d, y1, x2, y1+d, x2-d, y2-d, x2, y2]  # ne, se
         else:
-            self.widget.master.coords(self.items[6], x1, y1, x1+d, y1+d)  # nw
-            self.widget.master.coords(self.items[7], x1, y2-d, x1+d, y2)  # sw
-            self.widget.master.coords(self.items[8], x1, y1, x1+d, y1+d)  # nw
-            self.widget.master.coords(self.items[9], x1, y2-d, x1+d, y2)  # sw
+            corners = [x1, y1, x1+d, y1+d, x1, y2-d, x1+d, y2]  # nw, sw
+
+        _coords_items(self.widget.master, self.items, coords + corners*2)
 
 
 class SemicircularRectangle(virtual.Shape):
@@ -399,26 +439,19 @@ class SemicircularRectangle(virtual.Shape):
     @typing_extensions.override
     def display(self) -> None:
         """Display the `Component` on a `Canvas`"""
-        self.items = [
-            self.widget.master.create_arc(
-                0, 0, 0, 0, outline="", extent=180, start=90,
-                tags=("fill", "fill"), **self.kwargs),
-            self.widget.master.create_arc(
-                0, 0, 0, 0, outline="", extent=180, start=-90,
-                tags=("fill", "fill"), **self.kwargs),
-            self.widget.master.create_rectangle(
-                0, 0, 0, 0, outline="", tags=("fill", "fill"), **self.kwargs),
-            self.widget.master.create_arc(
-                0, 0, 0, 0, style="arc", extent=180, start=90,
-                tags=("outline", "outline"), **self.kwargs),
-            self.widget.master.create_arc(
-                0, 0, 0, 0, style="arc", extent=180, start=-90,
-                tags=("outline", "outline"), **self.kwargs),
-            self.widget.master.create_line(
-                0, 0, 0, 0, tags=("fill", "outline"), **self.kwargs),
-            self.widget.master.create_line(
-                0, 0, 0, 0, tags=("fill", "outline"), **self.kwargs),
-        ]
+        self.items = _create_items(self.widget.master, [
+            ("arc", 0, 0, 0, 0, "-outline", "", "-extent", 180, "-start", 90,
+             "-tags", ("fill", "fill")),
+            ("arc", 0, 0, 0, 0, "-outline", "", "-extent", 180, "-start", -90,
+             "-tags", ("fill", "fill")),
+            ("rectangle", 0, 0, 0, 0, "-outline", "", "-tags", ("fill", "fill")),
+            ("arc", 0, 0, 0, 0, "-style", "arc", "-extent", 180, "-start", 90,
+             "-tags", ("outline", "outline")),
+            ("arc", 0, 0, 0, 0, "-style", "arc", "-extent", 180, "-start", -90,
+             "-tags", ("outline", "outline")),
+            ("line", 0, 0, 0, 0, "-tags", ("fill", "outline")),
+            ("line", 0, 0, 0, 0, "-tags", ("fill", "outline")),
+        ], self.kwargs)
 
     @typing_extensions.override
     def coords(
@@ -439,13 +472,15 @@ class SemicircularRectangle(virtual.Shape):
         elif d == 0:
             warnings.warn("Parameters are not suitable", UserWarning, 5)
 
-        self.widget.master.coords(self.items[0], x1, y1, x1+d, y1+d)
-        self.widget.master.coords(self.items[1], x2-d, y1, x2, y1+d)
-        self.widget.master.coords(self.items[2], x1+r, y1, x2-r+1, y2)
-        self.widget.master.coords(self.items[3], x1, y1, x1+d, y1+d)
-        self.widget.master.coords(self.items[4], x2-d, y2-d, x2, y2)
-        self.widget.master.coords(self.items[5], x1+r, y1, x2-r+1, y1)
-        self.widget.master.coords(self.items[6], x1+r, y2, x2-r+1, y2)
+        _coords_items(self.widget.master, self.items, [
+            x1, y1, x1+d, y1+d,
+            x2-d, y1, x2, y1+d,
+            x1+r, y1, x2-r+1, y2,
+            x1, y1, x1+d, y1+d,
+            x2-d, y2-d, x2, y2,
+            x1+r, y1, x2-r+1, y1,
+            x1+r, y2, x2-r+1, y2,
+        ])
 
     @typing_extensions.override
     def detect(self, x: int, y: int) -> bool:
@@ -597,3 +632,434 @@ class Parallelogram(virtual.Shape):
         ]
 
         self.widget.master.coords(self.items[0], *points)
+
+
+@functools.lru_cache(maxsize=1024)
+def _rounded_rectangle_points(
+    width: float,
+    height: float,
+    radius: float,
+    corners: tuple[bool, bool, bool, bool] = (True, True, True, True),
+) -> tuple[float, ...]:
+    """Return vertices of a rounded rectangle relative to its upper left corner, arcs are
+    approximated by line segments
+
+    * `width`: width of the rectangle
+    * `height`: height of the rectangle
+    * `radius`: radius of the fillet
+    * `corners`: whether the nw, ne, se and sw corners are rounded
+    """
+    segments = max(2, min(32, math.ceil(math.sqrt(radius)*2)))
+    centers = (radius, radius), (width-radius, radius), \
+        (width-radius, height-radius), (radius, height-radius)
+    vertices = (0, 0), (width, 0), (width, height), (0, height)
+    points: list[float] = []
+    for i, (rounded, (cx, cy), vertex) in enumerate(zip(corners, centers, vertices)):
+        if not rounded:
+            points.extend(vertex)
+            continue
+        start = math.pi + i*math.pi/2  # Clockwise from the left of the nw corner
+        for j in range(segments + 1):
+            angle = start + j*math.pi/2/segments
+            points.append(cx + radius*math.cos(angle))
+            points.append(cy + radius*math.sin(angle))
+    return tuple(points)
+
+
+def _get_style_name(name: str | None, cls: type) -> str | type:
+    """Get the name that the polygon variant of a shape uses to share the styles of the shape"""
+    if name is None:
+        return cls
+    if name.startswith("."):
+        return cls.__name__ + name
+    return name
+
+
+class PolygonRoundedRectangle(RoundedRectangle):
+    """Create a rounded rectangle for a widget with only one polygon item
+
+    It uses the styles of `RoundedRectangle`. Corners are approximated by line segments, and the
+    vertices are cached by size and radius.
+    """
+
+    def __init__(
+        self,
+        widget: virtual.Widget,
+        relative_position: tuple[int, int] = (0, 0),
+        size: tuple[int, int] | None = None,
+        *,
+        radius: int = 5,
+        name: str | None = None,
+        animation: bool = True,
+        styles: dict[str, dict[str, str]] | None = None,
+        **kwargs,
+    ) -> None:
+        """
+        * `widget`: parent widget
+        * `relative_position`: position relative to its widgets
+        * `size`: size of component
+        * `radius`: radius of the fillet
+        * `name`: name of component
+        * `animation`: Wether use animation to change color
+        * `styles`: style dict of component
+        * `kwargs`: extra parameters for CanvasItem
+        """
+        RoundedRectangle.__init__(
+            self, widget, relative_position, size, radius=radius,
+            name=_get_style_name(name, RoundedRectangle), styles=styles,
+            animation=animation, **kwargs)
+
+    @typing_extensions.override
+    def display(self) -> None:
+        """Display the `Component` on a `Canvas`"""
+        self.items = [self.widget.master.create_polygon(
+            0, 0, 0, 0, tags=("fill", "fill", "outline", "outline"), **self.kwargs)]
+
+    @typing_extensions.override
+    def coords(
+        self,
+        size: tuple[float, float] | None = None,
+        position: tuple[float, float] | None = None,
+    ) -> None:
+        """Resize the `Component`"""
+        virtual.Shape.coords(self, size, position)
+
+        x, y, w, h = *self.position, *self.size
+
+        if self.radius*2 > min(w, h) or self.radius == 0:
+            warnings.warn("Parameters are not suitable", UserWarning, 5)
+
+        points = _rounded_rectangle_points(w, h, self.radius)
+        self.widget.master.coords(
+            self.items[0], [p + d for p, d in zip(points, itertools.cycle((x, y)))])
+
+
+class PolygonHalfRoundedRectangle(HalfRoundedRectangle):
+    """Create a half rounded rectangle for a widget with only one polygon item
+
+    It uses the styles of `HalfRoundedRectangle`. Corners are approximated by line segments, and
+    the vertices are cached by size and radius.
+    """
+
+    def __init__(
+        self,
+        widget: virtual.Widget,
+        relative_position: tuple[int, int] = (0, 0),
+        size: tuple[int, int] | None = None,
+        *,
+        radius: int = 5,
+        ignore: typing.Literal["left", "right"] = "left",
+        name: str | None = None,
+        animation: bool = True,
+        styles: dict[str, dict[str, str]] | None = None,
+        **kwargs,
+    ) -> None:
+        """
+        * `widget`: parent widget
+        * `relative_position`: position relative to its widgets
+        * `size`: size of component
+        * `radius`: radius of the fillet
+        * `ignore`: edges to ignore
+        * `name`: name of component
+        * `animation`: Wether use animation to change color
+        * `styles`: style dict of component
+        * `kwargs`: extra parameters for CanvasItem
+        """
+        HalfRoundedRectangle.__init__(
+            self, widget, relative_position, size, radius=radius, ignore=ignore,
+            name=_get_style_name(name, HalfRoundedRectangle), styles=styles,
+            animation=animation, **kwargs)
+
+    @typing_extensions.override
+    def display(self) -> None:
+        """Display the `Component` on a `Canvas`"""
+        self.items = [self.widget.master.create_polygon(
+            0, 0, 0, 0, tags=("fill", "fill", "outline", "outline"), **self.kwargs)]
+
+    @typing_extensions.override
+    def coords(
+        self,
+        size: tuple[float, float] | None = None,
+        position: tuple[float, float] | None = None,
+    ) -> None:
+        """Resize the `Component`"""
+        virtual.Shape.coords(self, size, position)
+
+        x, y, w, h = *self.position, *self.size
+
+        if self.radius*2 > min(w, h) or self.radius == 0:
+            warnings.warn("Parameters are not suitable", UserWarning, 5)
+
+        right = self.ignore == "left"
+        points = _rounded_rectangle_points(
+            w, h, self.radius, (not right, right, right, not right))
+        self.widget.master.coords(
+            self.items[0], [p + d for p, d in zip(points, itertools.cycle((x, y)))])
+
+
+class PolygonSemicircularRectangle(SemicircularRectangle):
+    """Create a semicircular rectangle for a widget with only one polygon item
+
+    It uses the styles of `SemicircularRectangle`. Semicircles are approximated by line segments,
+    and the vertices are cached by size.
+    """
+
+    def __init__(
+        self,
+        widget: virtual.Widget,
+        relative_position: tuple[int, int] = (0, 0),
+        size: tuple[int, int] | None = None,
+        *,
+        name: str | None = None,
+        animation: bool = True,
+        styles: dict[str, dict[str, str]] | None = None,
+        **kwargs,
+    ) -> None:
+        """
+        * `widget`: parent widget
+        * `relative_position`: position relative to its widgets
+        * `size`: size of component
+        * `name`: name of component
+        * `animation`: Wether use animation to change color
+        * `styles`: style dict of component
+        * `kwargs`: extra parameters for CanvasItem
+        """
+        SemicircularRectangle.__init__(
+            self, widget, relative_position, size,
+            name=_get_style_name(name, SemicircularRectangle), styles=styles,
+            animation=animation, **kwargs)
+
+    @typing_extensions.override
+    def display(self) -> None:
+        """Display the `Component` on a `Canvas`"""
+        self.items = [self.widget.master.create_polygon(
+            0, 0, 0, 0, tags=("fill", "fill", "outline", "outline"), **self.kwargs)]
+
+    @typing_extensions.override
+    def coords(
+        self,
+        size: tuple[float, float] | None = None,
+        position: tuple[float, float] | None = None,
+    ) -> None:
+        """Resize the `Component`"""
+        virtual.Shape.coords(self, size, position)
+
+        x, y, w, h = *self.position, *self.size
+
+        if h <= 0:
+            warnings.warn("Parameters are not suitable", UserWarning, 5)
+
+        points = _rounded_rectangle_points(w, h, h/2)
+        self.widget.master.coords(
+            self.items[0], [p + d for p, d in zip(points, itertools.cycle((x, y)))])
+
+
+class _RasterCache:
+    """LRU cache of rasterized shapes, which is limited by both the number of images and the memory
+    of their pixels"""
+
+    maxsize: int = 1024
+    """The maximum number of cached images"""
+
+    max_bytes: int = 64 * 1024 * 1024
+    """The maximum memory of pixels of cached images"""
+
+    _images: collections.OrderedDict[tuple, tkinter.PhotoImage] = collections.OrderedDict()
+    _bytes: int = 0
+    _roots: set[tkinter.Misc] = set()
+
+    @classmethod
+    def get(cls, key: tuple) -> tkinter.PhotoImage | None:
+        """Get a cached image, `None` if it is not cached"""
+        if (image := cls._images.get(key)) is not None:
+            cls._images.move_to_end(key)
+        return image
+
+    @classmethod
+    def put(cls, key: tuple, image: tkinter.PhotoImage) -> None:
+        """Cache an image and evict the least recently used ones if the cache is full"""
+        cls._images[key] = image
+        cls._bytes += image.width() * image.height() * 4
+        while len(cls._images) > 1 and (
+                len(cls._images) > cls.maxsize or cls._bytes > cls.max_bytes):
+            _, oldest = cls._images.popitem(last=False)
+            cls._bytes -= oldest.width() * oldest.height() * 4
+
+    @classmethod
+    def watch(cls, root: tkinter.Misc) -> None:
+        """Remove the images of a root window from the cache when it is destroyed, the images are
+        keyed by their root windows first"""
+        if root in cls._roots:
+            return
+        cls._roots.add(root)
+        root.bind("<Destroy>", lambda event: cls.discard(root) if event.widget is root else None,
+                  "+")
+
+    @classmethod
+    def discard(cls, root: tkinter.Misc) -> None:
+        """Remove the images of a root window"""
+        cls._roots.discard(root)
+        for key in [key for key in cls._images if key[0] is root]:
+            image = cls._images.pop(key)
+            cls._bytes -= image.width() * image.height() * 4
+
+    @classmethod
+    def clear(cls) -> None:
+        """Clear the cache"""
+        cls._images.clear()
+        cls._bytes = 0
+
+
+class _RasterShape(virtual.Shape):
+    """Base class of shapes that are rasterized by Pillow with anti-aliasing and displayed as one
+    image item, the shapes fall back to their other base classes if Pillow is not installed"""
+
+    supersample: int = 4
+    """Shapes are drawn at this multiple of their size and then downsampled"""
+
+    @abc.abstractmethod
+    def _get_radius(self) -> float:
+        """Return the radius of corners"""
+
+    @typing_extensions.override
+    def display(self) -> None:
+        """Display the `Component` on a `Canvas`"""
+        if globals().get("ImageTk") is None:
+            return super().display()
+        self._colors = {"fill": "", "outline": ""}
+        self._image: tkinter.PhotoImage | None = None
+        self.items = [self.widget.master.create_image(0, 0, anchor="nw")]
+        return None
+
+    @typing_extensions.override
+    def coords(
+        self,
+        size: tuple[float, float] | None = None,
+        position: tuple[float, float] | None = None,
+    ) -> None:
+        """Resize the `Component`"""
+        if globals().get("ImageTk") is None:
+            return super().coords(size, position)
+        virtual.Component.coords(self, size, position)
+        self.widget.master.coords(self.items[0], *self.position)
+        self._render()
+        return None
+
+    @typing_extensions.override
+    def configure(self, style: dict[str, str], *, no_delay: bool = False) -> None:
+        """Configure properties of `Component` and update them immediately, colors are changed
+        without animation"""
+        if globals().get("ImageTk") is None:
+            return super().configure(style, no_delay=no_delay)
+        colors = {key: value for key in self._colors if (value := style.get(key)) is not None}
+        if colors.items() - self._colors.items():
+            self._colors.update(colors)
+            self._render()
+        return None
+
+    def _get_color(self, color: str) -> tuple[int, int, int, int]:
+        """Convert a color of Tk to RGBA"""
+        if not color:
+            return 0, 0, 0, 0
+        if color.startswith("#") and len(color) == 9:
+            return tuple(int(color[i:i+2], 16) for i in range(1, 9, 2))
+        return *(value >> 8 for value in self.widget.master.winfo_rgb(color)), 255
+
+    def _draw(self, draw: ImageDraw.ImageDraw, box: tuple[int, int, int, int], radius: float,
+              **kwargs) -> None:
+        """Draw the shape on an image
+
+        * `draw`: the drawing interface of the image
+        * `box`: the bounding box of the shape
+        * `radius`: the radius of corners
+        * `kwargs`: fill, outline and width of the shape
+        """
+        draw.rounded_rectangle(box, radius, **kwargs)
+
+    def _render(self) -> None:
+        """Rasterize the shape and display it"""
+        width, height = round(self.size[0]), round(self.size[1])
+        if width <= 0 or height <= 0 or not any(self._colors.values()):
+            self._image = None
+            self.widget.master.itemconfigure(self.items[0], image="")
+            return
+        radius = min(self._get_radius(), width/2, height/2)
+        line_width = float(self.kwargs.get("width", 1))
+        root = self.widget.master.nametowidget(".")  # Images belong to its Tcl interpreter
+        key = (root, type(self).__name__, width, height, radius,
+               self._colors["fill"], self._colors["outline"], line_width, self.supersample)
+        if (image := _RasterCache.get(key)) is None:
+            _RasterCache.watch(root)
+            scale = self.supersample
+            source = Image.new("RGBA", (width*scale, height*scale))
+            self._draw(
+                ImageDraw.Draw(source), (0, 0, width*scale - 1, height*scale - 1), radius*scale,
+                fill=self._get_color(self._colors["fill"]),
+                outline=self._get_color(self._colors["outline"]),
+                width=round(line_width*scale))
+            image = ImageTk.PhotoImage(
+                source.resize((width, height), Image.Resampling.LANCZOS),
+                master=self.widget.master)
+            _RasterCache.put(key, image)
+        self._image = image  # Keep a reference, it may be evicted from the cache
+        self.widget.master.itemconfigure(self.items[0], image=image)
+
+
+class RasterRoundedRectangle(_RasterShape, PolygonRoundedRectangle):
+    """Create an anti-aliased rounded rectangle for a widget with only one image item
+
+    It is rasterized by Pillow and cached. It falls back to `PolygonRoundedRectangle` if Pillow is
+    not installed.
+    """
+
+    def _get_radius(self) -> float:
+        return self.radius
+
+
+class RasterOval(_RasterShape, Oval):
+    """Create an anti-aliased oval for a widget with only one image item
+
+    It is rasterized by Pillow and cached. It falls back to `Oval` if Pillow is not installed.
+    """
+
+    def __init__(
+        self,
+        widget: virtual.Widget,
+        relative_position: tuple[int, int] = (0, 0),
+        size: tuple[int, int] | None = None,
+        *,
+        name: str | None = None,
+        animation: bool = True,
+        styles: dict[str, dict[str, str]] | None = None,
+        **kwargs,
+    ) -> None:
+        """
+        * `widget`: parent widget
+        * `relative_position`: position relative to its widgets
+        * `size`: size of component
+        * `name`: name of component
+        * `animation`: Wether use animation to change color
+        * `styles`: style dict of component
+        * `kwargs`: extra parameters for CanvasItem
+        """
+        Oval.__init__(
+            self, widget, relative_position, size, name=_get_style_name(name, Oval),
+            styles=styles, animation=animation, **kwargs)
+
+    def _get_radius(self) -> float:
+        return 0
+
+    def _draw(self, draw: ImageDraw.ImageDraw, box: tuple[int, int, int, int], radius: float,
+              **kwargs) -> None:
+        draw.ellipse(box, **kwargs)
+
+
+class RasterSemicircularRectangle(_RasterShape, PolygonSemicircularRectangle):
+    """Create an anti-aliased semicircular rectangle for a widget with only one image item
+
+    It is rasterized by Pillow and cached. It falls back to `PolygonSemicircularRectangle` if
+    Pillow is not installed.
+    """
+
+    def _get_radius(self) -> float:
+        return self.size[1] / 2
@@ -5,10 +5,10 @@ from __future__ import annotations
 __all__ = [
     "Information",
     "SingleLineText",
+    "MultiLineText",
 ]
 
 import bisect
-import itertools
 import math
 import tkinter.font
 import typing
@@ -16,13 +16,233 @@ import typing
 import typing_extensions
 
 from ..core import containers, virtual
+from ..toolbox import tools
+
+
+class _PieceTable:
+    """Storage of a large text
+
+    The text is stored as pieces of append-only buffers, so inserting or removing text doesn't copy
+    the whole text. Positions of line breaks of each buffer are indexed, so a line can be located
+    by binary searches without scanning the text.
+    """
+
+    chunk_size: int = 65536
+    """The maximum size of a buffer that inserted text is appended to"""
+
+    def __init__(self, text: str = "") -> None:
+        """
+        * `text`: initial text
+        """
+        # The original text and lists of characters that inserted text is appended to
+        self._buffers: list[str | list[str]] = [text]
+        self._breaks: list[list[int]] = [self._find_breaks(text)]
+        self._pieces: list[tuple[int, int, int]] = [(0, 0, len(text))] if text else []
+        # Prefix sums of lengths and line breaks of pieces
+        self._offsets: list[int] = [0]
+        self._lines: list[int] = [0]
+        self._reindex(0)
+
+    def __len__(self) -> int:
+        return self._offsets[-1]
+
+    @staticmethod
+    def _find_breaks(text: str) -> list[int]:
+        """Find positions of all line breaks of the text"""
+        breaks: list[int] = []
+        index = text.find("\n")
+        while index != -1:
+            breaks.append(index)
+            index = text.find("\n", index+1)
+        return breaks
+
+    def _count_breaks(self, buffer: int, start: int, end: int) -> int:
+        """Count line breaks of the buffer in `[start, end)`"""
+        breaks = self._breaks[buffer]
+        return bisect.bisect_left(breaks, end) - bisect.bisect_left(breaks, start)
+
+    def _reindex(self, index: int) -> None:
+        """Update the prefix sums from the piece of the index"""
+        del self._offsets[index+1:]
+        del self._lines[index+1:]
+        for buffer, start, length in self._pieces[index:]:
+            self._offsets.append(self._offsets[-1] + length)
+            self._lines.append(self._lines[-1] + self._count_breaks(buffer, start, start+length))
+
+    def _locate(self, offset: int) -> tuple[int, int]:
+        """Get the index of the piece that contains the offset and the offset in the piece"""
+        if not 0 <= offset <= len(self):
+            raise IndexError("string index out of range")
+        index = bisect.bisect_right(self._offsets, offset) - 1
+        return index, offset - self._offsets[index]
+
+    def _add(self, text: str) -> tuple[int, int]:
+        """Add text to buffers and return the index of the buffer and the start of the text"""
+        buffer = len(self._buffers) - 1
+        if buffer and len(self._buffers[buffer]) + len(text) <= self.chunk_size:
+            start = len(self._buffers[buffer])
+            self._buffers[buffer].extend(text)
+        else:
+            buffer, start = buffer + 1, 0
+            self._buffers.append(list(text))
+            self._breaks.append([])
+        self._breaks[buffer].extend(start + i for i in self._find_breaks(text))
+        return buffer, start
+
+    def _slice(self, buffer: int, start: int, end: int) -> str:
+        """Get the text of the buffer in `[start, end)`"""
+        if isinstance(text := self._buffers[buffer], str):
+            return text[start:end]
+        return "".join(text[start:end])
+
+    def get(self) -> str:
+        """Get the whole text"""
+        return "".join(self._slice(buffer, start, start+length)
+                       for buffer, start, length in self._pieces)
+
+    def substring(self, start: int, end: int) -> str:
+        """Get the text in `[start, end)`"""
+        index, offset = self._locate(start)
+        parts: list[str] = []
+        remaining = end - start
+        while remaining > 0:
+            buffer, piece_start, length = self._pieces[index]
+            part = self._slice(
+                buffer, piece_start+offset, piece_start+min(length, offset+remaining))
+            parts.append(part)
+            remaining -= len(part)
+            index, offset = index + 1, 0
+        return "".join(parts)
+
+    def insert(self, offset: int, text: str) -> None:
+        """Insert text at the offset"""
+        index, inner = self._locate(offset)
+        if not text:
+            return
+        buffer, start = self._add(text)
+        if inner == 0:
+            if index and (piece := self._pieces[index-1])[0] == buffer \
+                    and piece[1] + piece[2] == start:  # Typed continuously
+                self._pieces[index-1] = buffer, piece[1], piece[2] + len(text)
+                index -= 1
+            else:
+                self._pieces.insert(index, (buffer, start, len(text)))
+        else:
+            piece = self._pieces[index]
+            self._pieces[index:index+1] = [
+                (piece[0], piece[1], inner),
+                (buffer, start, len(text)),
+                (piece[0], piece[1] + inner, piece[2] - inner)]
+        self._reindex(index)
+
+    def remove(self, start: int, end: int) -> None:
+        """Remove the text in `[start, end)`"""
+        if start > end:
+            raise IndexError("string index out of range")
+        first, first_inner = self._locate(start)
+        last, last_inner = self._locate(end)
+        if start == end:
+            return
+        pieces: list[tuple[int, int, int]] = []
+        if first_inner:
+            piece = self._pieces[first]
+            pieces.append((piece[0], piece[1], first_inner))
+        if last_inner:
+            piece = self._pieces[last]
+            pieces.append((piece[0], piece[1] + last_inner, piece[2] - last_inner))
+            last += 1
+        self._pieces[first:last] = pieces
+        self._reindex(first)
+
+    def line_count(self) -> int:
+        """Get the number of lines"""
+        return self._lines[-1] + 1
+
+    def line_start(self, line: int) -> int:
+        """Get the offset of the start of the line"""
+        if not 0 <= line < self.line_count():
+            raise IndexError("line index out of range")
+        if line == 0:
+            return 0
+        index = bisect.bisect_left(self._lines, line) - 1
+        buffer, start, _ = self._pieces[index]
+        breaks = self._breaks[buffer]
+        position = breaks[bisect.bisect_left(breaks, start) + line - self._lines[index] - 1]
+        return self._offsets[index] + position - start + 1
+
+    def line_end(self, line: int) -> int:
+        """Get the offset of the end of the line, excluding the line break"""
+        if line + 1 == self.line_count():
+            return len(self)
+        return self.line_start(line + 1) - 1
+
+    def get_line(self, line: int) -> str:
+        """Get the text of the line, excluding the line break"""
+        return self.substring(self.line_start(line), self.line_end(line))
+
+    def position(self, offset: int) -> tuple[int, int]:
+        """Get the line and the column of the offset"""
+        index, inner = self._locate(offset)
+        if index == len(self._pieces):
+            line = self._lines[-1]
+        else:
+            buffer, start, _ = self._pieces[index]
+            line = self._lines[index] + self._count_breaks(buffer, start, start+inner)
+        return line, offset - self.line_start(line)
+
+    def index(self, line: int, column: int) -> int:
+        """Get the offset of the line and the column, the column is limited to the line"""
+        line = min(max(line, 0), self.line_count() - 1)
+        return min(self.line_start(line) + max(column, 0), self.line_end(line))
 
 
 class _CanvasTextProxy:
 
-    def __init__(self, canvas: containers.Canvas, tag_or_id: str | int) -> None:
+    def __init__(
+        self,
+        canvas: containers.Canvas,
+        tag_or_id: str | int,
+        font: tkinter.font.Font | None = None,
+    ) -> None:
         self.canvas = canvas
         self.id = tag_or_id
+        self.font = font
+        # Widths of displayed characters and their prefix sums, `_prefix[i]` is the width of the
+        # first `i` characters and is only valid up to its current length
+        self._widths: list[int] | None = None
+        self._prefix: list[int] = [0]
+
+    def _measure(self, value: str) -> list[int]:
+        """Measure the width of each character of the value"""
+        if self.font is None:
+            self.font = tkinter.font.Font(font=self.canvas.itemcget(self.id, "font"))
+        key = tools.TextMetrics.get_font_key(self.font)
+        return tools.TextMetrics.char_widths(value, key, root=self.canvas)
+
+    def _get_widths(self) -> list[int]:
+        """Get the widths of displayed characters"""
+        if self._widths is None:
+            self._widths = self._measure(self.get())
+            del self._prefix[1:]
+        return self._widths
+
+    def _get_prefix(self) -> list[int]:
+        """Get the prefix sums of the widths of displayed characters"""
+        widths, prefix = self._get_widths(), self._prefix
+        for width in widths[len(prefix)-1:]:
+            prefix.append(prefix[-1] + width)
+        return prefix
+
+    def _update_widths(self, start: int, end: int, value: str = "") -> None:
+        """Replace widths of characters in `[start, end)` with widths of the value"""
+        if self._widths is not None:
+            self._widths[start:end] = self._measure(value) if value else []
+            del self._prefix[start+1:]
+
+    def invalidate(self) -> None:
+        """Discard the cached widths, call it when the font is changed"""
+        self._widths = None
+        del self._prefix[1:]
 
     def _get_index(self, index: int) -> int:
         if index < 0:
@@ -44,12 +264,14 @@ class _CanvasTextProxy:
         if show:
             value = show * len(value)
         self.canvas.itemconfigure(self.id, text=value)
+        self._update_widths(0, len(self._widths or ()), value)
 
     def insert(self, index: int, value: str, *, show: str | None = None) -> None:
         """Insert"""
         if show:
             value = show * len(value)
-        self.canvas.insert(self.id, self._get_index(index), value)
+        self.canvas.insert(self.id, index := self._get_index(index), value)
+        self._update_widths(index, index, value)
 
     def append(self, value: str, *, show: str | None = None) -> None:
         """Append"""
@@ -60,6 +282,7 @@ class _CanvasTextProxy:
         start = self._get_index(start)
         end = start + 1 if end is None else self._get_index(end)
         self.canvas.dchars(self.id, start, end - 1)  # including
+        self._update_widths(start, end)
 
     def pop(self, index: int = -1) -> None:
         """Pop"""
@@ -70,6 +293,8 @@ class _CanvasTextProxy:
     def clear(self) -> None:
         """Clear"""
         self.canvas.itemconfigure(self.id, text="")
+        self._widths = []
+        del self._prefix[1:]
 
     def select_get(self) -> tuple[int, int] | None:
         """select get"""
@@ -111,26 +336,89 @@ class _CanvasTextProxy:
         """cursor find"""
         x1, *_ = self.canvas.bbox(self.id)
         x -= x1 + 1
-        font = tkinter.font.Font(font=self.canvas.itemcget(self.id, "font"))
-        index = bisect.bisect_right(tuple(itertools.accumulate(self.get())), x, key=font.measure)
-
-        distance_left = abs(x - font.measure(self.get()[:index]))
-        distance_right = abs(x - font.measure(self.get()[:index+1]))
+        prefix = self._get_prefix()
+        index = max(0, bisect.bisect_right(prefix, x) - 1)
 
-        if distance_right <= distance_left:
+        if index + 1 < len(prefix) and prefix[index+1] - x <= x - prefix[index]:
             index += 1
 
-        return min(self.length(), index)
+        return index
 
 
 class Information(virtual.Text):
     """General information text"""
 
+    def __init__(
+        self,
+        widget: virtual.Widget,
+        relative_position: tuple[int, int] = (0, 0),
+        size: tuple[int, int] | None = None,
+        *,
+        text: str = "",
+        limit: int = -1,
+        width: int | None = None,
+        wrap: bool = True,
+        max_lines: int | None = None,
+        ellipsis: typing.Literal["end", "middle"] | None = None,
+        family: str | None = None,
+        fontsize: int | None = None,
+        weight: typing.Literal["normal", "bold"] = "normal",
+        slant: typing.Literal["roman", "italic"] = "roman",
+        underline: bool = False,
+        overstrike: bool = False,
+        name: str | None = None,
+        animation: bool = True,
+        styles: dict[str, dict[str, str]] | None = None,
+        **kwargs,
+    ) -> None:
+        """
+        * `widget`: parent widget
+        * `relative_position`: position relative to its widgets
+        * `size`: size of component
+        * `text`: text value
+        * `limit`: limit on the number of characters
+        * `width`: the maximum width of lines, `None` means that the text is not laid out
+        * `wrap`: whether to break lines that are longer than `width`
+        * `max_lines`: the maximum number of lines
+        * `ellipsis`: where to put the ellipsis if the text is truncated
+        * `family`: font family
+        * `fontsize`: font size
+        * `weight`: weight of the font
+        * `slant`: slant of the font
+        * `underline`: wether text is underline
+        * `overstrike`: wether text is overstrike
+        * `name`: name of component
+        * `animation`: Wether use animation to change color
+        * `styles`: style dict of component
+        * `kwargs`: extra parameters for CanvasItem
+        """
+        self.width = width
+        self.wrap = wrap
+        self.max_lines = max_lines
+        self.ellipsis = ellipsis
+        # The font key and the width of the last layout
+        self._layout: tuple[tools.FontKey, float] | None = None
+        virtual.Text.__init__(
+            self, widget, relative_position, size, text=text, limit=limit, family=family,
+            fontsize=fontsize, weight=weight, slant=slant, underline=underline,
+            overstrike=overstrike, name=name, styles=styles, animation=animation, **kwargs)
+
+    def _get_layout_text(self) -> str:
+        """Get the text that is displayed, it is laid out if `width` is given"""
+        if self.width is None:
+            return self.text
+        if self._layout is None:
+            self._layout = tools.TextMetrics.get_font_key(self.font), round(self.width)
+        return tools.TextMetrics.layout(
+            self.text, *self._layout, wrap=self.wrap, max_lines=self.max_lines,
+            ellipsis=self.ellipsis, root=self.widget.master)
+
     @typing_extensions.override
     def display(self) -> None:
         """Display the `Component` on a `Canvas`"""
         self.items = [self.widget.master.create_text(
-            0, 0, text=self.text, font=self.font, tags=("fill", "fill"), **self.kwargs)]
+            0, 0, text=self._get_layout_text(), font=self.font, tags=("fill", "fill"),
+            **self.kwargs)]
 
     @typing_extensions.override
     def coords(
@@ -143,6 +431,24 @@ class Information(virtual.Text):
 
         self.widget.master.coords(self.items[0], *self.center())
 
+    @typing_extensions.override
+    def zoom(
+        self,
+        ratios: tuple[float, float],
+        *,
+        zoom_position: bool = True,
+        zoom_size: bool = True,
+    ) -> None:
+        """Scale the text"""
+        virtual.Text.zoom(self, ratios, zoom_position=zoom_position, zoom_size=zoom_size)
+        if self.width is not None and zoom_size:
+            # Lay out again only if the font or the width is changed
+            self.width *= ratios[0]
+            layout, self._layout = self._layout, None
+            text = self._get_layout_text()
+            if layout != self._layout:
+                self.widget.master.itemconfigure(self.items[0], text=text)
+
     def get(self) -> str:
         """Get the value of `Text`"""
         return self.text
@@ -152,25 +458,25 @@ class Information(virtual.Text):
         if len(text) > self.limit >= 0:
             text = text[:self.limit]
         self.text = text
-        self.widget.master.itemconfigure(self.items[0], text=self.text)
+        self.widget.master.itemconfigure(self.items[0], text=self._get_layout_text())
 
     def append(self, text: str) -> None:
         """Append value to the value of `Text`"""
         if len(self.text) + len(text) > self.limit >= 0:
             text = self.text[:self.limit-len(self.text)]
         self.text = self.text + text
-        self.widget.master.itemconfigure(self.items[0], text=self.text)
+        self.widget.master.itemconfigure(self.items[0], text=self._get_layout_text())
 
     def delete(self, num: int) -> None:
         """Remove a portion of the `Text` value from the trail"""
         num = min(len(self.text), num)
         self.text = self.text[:-num]
-        self.widget.master.itemconfigure(self.items[0], text=self.text)
+        self.widget.master.itemconfigure(self.items[0], text=self._get_layout_text())
 
     def clear(self) -> None:
         """Clear the value of `Text`"""
         self.text = ""
-        self.widget.master.itemconfigure(self.items[0], text=self.text)
+        self.widget.master.itemconfigure(self.items[0], text=self._get_layout_text())
 
 
 class SingleLineText(virtual.Text):
@@ -220,13 +526,15 @@ class SingleLineText(virtual.Text):
         """
         self.left: int = 0
         self.right: int = 0
+        self._font_key: tools.FontKey | None = None
+        self._widths: list[int] | None = None
         self.anchor = "w" if align == "left" else "e" if align == "right" else "center"
         virtual.Text.__init__(
             self, widget, relative_position, size, text=text, limit=limit, show=show,
             placeholder=placeholder, family=family, fontsize=fontsize, weight=weight, slant=slant,
             underline=underline, overstrike=overstrike, name=name, styles=styles,
             animation=animation, **kwargs)
-        self.text_proxy = _CanvasTextProxy(widget.master, self.items[0])
+        self.text_proxy = _CanvasTextProxy(widget.master, self.items[0], self.font)
 
     @typing_extensions.override
     def display(self) -> None:
@@ -257,17 +565,83 @@ class SingleLineText(virtual.Text):
         self.widget.master.coords(self.items[0], x, y)
         self.widget.master.coords(self.items[1], x, y)
 
+    @typing_extensions.override
+    def zoom(
+        self,
+        ratios: tuple[float, float],
+        *,
+        zoom_position: bool = True,
+        zoom_size: bool = True,
+    ) -> None:
+        """Scale the text"""
+        virtual.Text.zoom(self, ratios, zoom_position=zoom_position, zoom_size=zoom_size)
+        self._font_key = self._widths = None
+        self.text_proxy.invalidate()
+
     def _get_margin(self) -> float:
         """Get the size of the spacing between the text and the border"""
         if self.items:
-            _, y1, _, y2 = self.widget.master.bbox(self.items[0])
-            return (self.size[1] - (y2-y1)) / 2
+            linespace = tools.TextMetrics.linespace(self._get_font_key(), root=self.widget.master)
+            return (self.size[1] - linespace) / 2
         return (self.size[1] - abs(self.font.cget("size"))) / 2
 
-    def _is_overflow(self) -> bool:
-        """Whether the text content extends beyond the text box"""
-        x1, _, x2, _ = self.widget.master.bbox(self.items[0])
-        return (x2-x1) + self._get_margin()*2 >= self.size[0]
+    def _get_font_key(self) -> tools.FontKey:
+        """Get the key of the font, it is cached until the text is zoomed"""
+        if self._font_key is None:
+            self._font_key = tools.TextMetrics.get_font_key(self.font)
+        return self._font_key
+
+    def _get_widths(self) -> list[int]:
+        """Get the widths of all characters of the text as they are displayed"""
+        if self._widths is None:
+            self._widths = self._measure(self.text)
+        return self._widths
+
+    def _measure(self, value: str) -> list[int]:
+        """Measure the width of each character of the value as it is displayed"""
+        if self.show:  # All characters have the same width
+            width = tools.TextMetrics.measure(
+                self.show, self._get_font_key(), root=self.widget.master)
+            return [width] * len(value)
+        return tools.TextMetrics.char_widths(value, self._get_font_key(), root=self.widget.master)
+
+    def _update_widths(self, start: int, end: int, value: str = "") -> None:
+        """Replace widths of characters in `[start, end)` with widths of the value"""
+        if self._widths is not None:
+            self._widths[start:end] = self._measure(value) if value else []
+
+    def _fit_right(self, left: int, right: int) -> int:
+        """Get the largest index not greater than `right` that the text from `left` to it fits"""
+        widths, total = self._get_widths(), 0
+        available = self.size[0] - self._get_margin()*2 - 2  # 2: border of the bbox
+        for index in range(left, right):
+            total += widths[index]
+            if total >= available:
+                return max(index, left + 1)  # At least one character is displayed
+        return right
+
+    def _fit_left(self, right: int, left: int) -> int:
+        """Get the smallest index not less than `left` that the text from it to `right` fits"""
+        widths, total = self._get_widths(), 0
+        available = self.size[0] - self._get_margin()*2 - 2  # 2: border of the bbox
+        for index in range(right-1, left-1, -1):
+            total += widths[index]
+            if total >= available:
+                return min(index + 1, right - 1)  # At least one character is displayed
+        return left
+
+    def _get_cursor(self) -> int | None:
+        """Get the index of the text cursor in the whole text"""
+        if (index := self.text_proxy.cursor_get()) is None:
+            return None
+        return self.left + index
+
+    def _apply(self, left: int, right: int, cursor: int | None = None) -> None:
+        """Display the text from `left` to `right` and restore the text cursor"""
+        self.left, self.right = left, right
+        self.text_proxy.set(self.text[left:right], show=self.show)
+        if cursor is not None:
+            self.text_proxy.cursor_set(min(max(cursor - left, 0), right - left))
 
     def _get_index(self, index: int) -> int:
         if index < 0:
@@ -285,34 +659,40 @@ class SingleLineText(virtual.Text):
         self.clear()
         return self.append(value)
 
-    def insert(self, index: int, value: str) -> bool:
-        """Insert text to the location of the specified index"""
-        if flag := len(self.text + value) <= self.limit:
+    def insert(self, index: int, value: str, *, truncate: bool = False) -> bool:
+        """Insert text to the location of the specified index
+
+        * `index`: index of the displayed text
+        * `value`: text to be inserted
+        * `truncate`: whether to insert the part of the value within the limit instead of nothing
+        """
+        if truncate and len(self.text) + len(value) > self.limit:
+            value = value[:max(0, int(self.limit) - len(self.text))]
+        if flag := len(self.text) + len(value) <= self.limit:
             index = self._get_index(index)
+            cursor = self._get_cursor()
             key = self.left + index
             self.text = self.text[:key] + value + self.text[key:]
-            self.text_proxy.insert(index, value, show=self.show)
-            self.right += len(value)
-
-            if index + len(value) == self.text_proxy.length():
-                # Insert at the end
-                while self._is_overflow():
-                    self.text_proxy.remove(0)
-                    self.left += 1
+            self._update_widths(key, key, value)
+
+            if cursor is not None and cursor >= key:
+                cursor += len(value)
+
+            right = self.right + len(value)
+            if key == self.right:  # Insert at the end
+                self._apply(self._fit_left(right, self.left), right, cursor)
             else:
-                while self._is_overflow():
-                    self.text_proxy.remove(-1)
-                    self.right -= 1
+                self._apply(self.left, self._fit_right(self.left, right), cursor)
 
         return flag
 
-    def append(self, value: str) -> bool:
+    def append(self, value: str, *, truncate: bool = False) -> bool:
         """Add some characters to the text cursor"""
-        return self.insert(len(self.text), value)
+        return self.insert(len(self.text) - self.left, value, truncate=truncate)
 
     def remove(self, start: int, end: int | None = None) -> None:
         """Remove text within the specified index range"""
-        if self.text_proxy.length() == 0:
+        if self.left == self.right:
             return None
         start = self._get_index(start)
         end = start + 1 if end is None else self._get_index(end)
@@ -320,29 +700,16 @@ class SingleLineText(virtual.Text):
         if start > end:
             start, end = end, start
 
-        self.text = self.text[:self.left+start] + self.text[self.left+end:]
-        self.text_proxy.remove(start, end)
-        self.right -= end - start
+        cursor = self._get_cursor()
+        start, end = self.left + start, self.left + end
+        self.text = self.text[:start] + self.text[end:]
+        self._update_widths(start, end)
 
-        if self.right < len(self.text):  # There is a string on the right
-            while not self._is_overflow():
-                if self.right == len(self.text):
-                    break
-                self.text_proxy.append(self.text[self.right], show=self.show)
-                self.right += 1
-            else:
-                self.text_proxy.remove(-1)
-                self.right -= 1
+        if cursor is not None and cursor > start:
+            cursor = cursor - (end-start) if cursor >= end else start
 
-        if self.left > 0:  # There is a string on the left
-            while not self._is_overflow():
-                if self.left == 0:
-                    break
-                self.left -= 1
-                self.text_proxy.insert(0, self.text[self.left], show=self.show)
-            else:
-                self.text_proxy.remove(0)
-                self.left += 1
+        right = self._fit_right(self.left, len(self.text))
+        self._apply(self._fit_left(right, 0), right, cursor)
 
         return None
 
@@ -355,32 +722,22 @@ class SingleLineText(virtual.Text):
     def clear(self) -> None:
         """Clear"""
         self.text, self.left, self.right = "", 0, 0
+        self._widths = []
         self.text_proxy.clear()
 
     def _move_left(self) -> None:
         """Move the text to the left as a whole, i.e. press the right arrow"""
         if self.right == len(self.text):
             return
-        self.text_proxy.insert(
-            length := self.text_proxy.length(), self.text[self.right], show=self.show)
-        self.right += 1
-        self.text_proxy.cursor_set(length+1)
-
-        while self._is_overflow():
-            self.text_proxy.remove(0)
-            self.left += 1
+        right = self.right + 1
+        self._apply(self._fit_left(right, self.left), right, right)
 
     def _move_right(self) -> None:
         """Move the text to the right as a whole, i.e. press the left arrow"""
         if self.left == 0:
             return
-        self.left -= 1
-        self.text_proxy.insert(0, self.text[self.left], show=self.show)
-        self.text_proxy.cursor_set(0)
-
-        while self._is_overflow():
-            self.text_proxy.remove(-1)
-            self.right -= 1
+        left = self.left - 1
+        self._apply(left, self._fit_right(left, self.right), left)
 
     def cursor_move(self, count: int) -> None:
         """Move the index position of the text cursor"""
@@ -397,3 +754,272 @@ class SingleLineText(virtual.Text):
     def cursor_move_to(self, count: int) -> None:
         """Move the index position of the text cursor to a certain index"""
         return self.cursor_move(count - self.text_proxy.cursor_get())
+
+
+class MultiLineText(virtual.Text):
+    """Multi-line editable text
+
+    The text is stored in a piece table, and only the visible lines have canvas items, so the cost
+    of editing and scrolling depends on the size of the viewport rather than the length of the
+    text.
+    """
+
+    def __init__(
+        self,
+        widget: virtual.Widget,
+        relative_position: tuple[int, int] = (0, 0),
+        size: tuple[int, int] | None = None,
+        *,
+        text: str = "",
+        limit: int = math.inf,
+        family: str | None = None,
+        fontsize: int | None = None,
+        weight: typing.Literal["normal", "bold"] = "normal",
+        slant: typing.Literal["roman", "italic"] = "roman",
+        underline: bool = False,
+        overstrike: bool = False,
+        name: str | None = None,
+        animation: bool = True,
+        styles: dict[str, dict[str, str]] | None = None,
+        **kwargs,
+    ) -> None:
+        """
+        * `widget`: parent widget
+        * `relative_position`: position relative to its widgets
+        * `size`: size of component
+        * `text`: text value
+        * `limit`: limit on the number of characters
+        * `family`: font family
+        * `fontsize`: font size
+        * `weight`: weight of the font
+        * `slant`: slant of the font
+        * `underline`: wether text is underline
+        * `overstrike`: wether text is overstrike
+        * `name`: name of component
+        * `animation`: Wether use animation to change color
+        * `styles`: style dict of component
+        * `kwargs`: extra parameters for CanvasItem
+        """
+        self.top: int = 0  # The first visible line
+        self.left: int = 0  # The first visible column
+        self.cursor: int = 0  # Offset of the text cursor in the whole text
+        self._font_key: tools.FontKey | None = None
+        self._shown: list[str | None] = []
+        virtual.Text.__init__(
+            self, widget, relative_position, size, text=text, limit=limit, family=family,
+            fontsize=fontsize, weight=weight, slant=slant, underline=underline,
+            overstrike=overstrike, name=name, styles=styles, animation=animation, **kwargs)
+
+    @property
+    def text(self) -> str:
+        """The whole text"""
+        return self.table.get()
+
+    @text.setter
+    def text(self, value: str) -> None:
+        self.table = _PieceTable(value)
+
+    @typing_extensions.override
+    def display(self) -> None:
+        """Display the `Component` on a `Canvas`"""
+        self.items = [self.widget.master.create_text(
+            0, 0, text="", font=self.font, anchor="nw", tags=("fill", "fill"), **self.kwargs)]
+        self._shown = [None]
+
+    @typing_extensions.override
+    def coords(
+        self,
+        size: tuple[float, float] | None = None,
+        position: tuple[float, float] | None = None,
+    ) -> None:
+        """Resize the `Component`"""
+        super().coords(size, position)
+
+        linespace, padding = self._get_linespace(), self._get_padding()
+        capacity = max(1, int((self.size[1] - padding*2) // linespace))
+        while len(self.items) < capacity:  # New items have the same style as the existing ones
+            self.items.append(self.widget.master.create_text(
+                0, 0, text="", font=self.font, anchor="nw",
+                tags=("fill", "fill", *self.widget.tags),
+                fill=self.widget.master.itemcget(self.items[0], "fill"),
+                state=self.widget.master.itemcget(self.items[0], "state"), **self.kwargs))
+            self._shown.append(None)
+        while len(self.items) > capacity:
+            self.widget.master.delete(self.items.pop())
+            self._shown.pop()
+
+        x, y = self.position[0] + padding, self.position[1] + padding
+        for index, item in enumerate(self.items):
+            self.widget.master.coords(item, x, y + index*linespace)
+
+        self._render()
+
+    @typing_extensions.override
+    def zoom(
+        self,
+        ratios: tuple[float, float],
+        *,
+        zoom_position: bool = True,
+        zoom_size: bool = True,
+    ) -> None:
+        """Scale the text"""
+        virtual.Text.zoom(self, ratios, zoom_position=zoom_position, zoom_size=zoom_size)
+        self._font_key = None
+        self._shown = [None] * len(self.items)
+        self.coords()
+
+    @typing_extensions.override
+    def region(self) -> tuple[float, float, float, float]:
+        """Return the decision region of the `Text`"""
+        return virtual.Component.region(self)
+
+    def _get_font_key(self) -> tools.FontKey:
+        """Get the key of the font, it is cached until the text is zoomed"""
+        if self._font_key is None:
+            self._font_key = tools.TextMetrics.get_font_key(self.font)
+        return self._font_key
+
+    def _get_linespace(self) -> int:
+        """Get the height of a line"""
+        return tools.TextMetrics.linespace(self._get_font_key(), root=self.widget.master)
+
+    def _get_padding(self) -> float:
+        """Get the size of the spacing between the text and the border"""
+        return self._get_linespace() / 4
+
+    def _measure(self, char: str) -> int:
+        """Measure the width of a character"""
+        return tools.TextMetrics.measure(char, self._get_font_key(), root=self.widget.master)
+
+    def _clip(self, line: str) -> str:
+        """Get the visible part of the line"""
+        available, total = self.size[0] - self._get_padding()*2, 0
+        for index in range(self.left, len(line)):
+            total += self._measure(line[index])
+            if total > available:
+                return line[self.left:index]
+        return line[self.left:]
+
+    def _render(self) -> None:
+        """Display the visible lines and the text cursor"""
+        count = self.table.line_count()
+        for index, item in enumerate(self.items):
+            line = self.top + index
+            text = self._clip(self.table.get_line(line)) if line < count else ""
+            if text != self._shown[index]:
+                self.widget.master.itemconfigure(item, text=text)
+                self._shown[index] = text
+
+        if self.widget.state != "active":
+            return
+        line, column = self.table.position(self.cursor)
+        index = line - self.top
+        if 0 <= index < len(self.items) and 0 <= column - self.left <= len(self._shown[index]):
+            self.widget.master.focus(self.items[index])
+            self.widget.master.icursor(self.items[index], column - self.left)
+        else:
+            self.widget.master.focus("")
+
+    def _scroll_to_cursor(self) -> None:
+        """Scroll the text to make the text cursor visible"""
+        line, column = self.table.position(self.cursor)
+        if line < self.top:
+            self.top = line
+        elif line >= self.top + len(self.items):
+            self.top = line - len(self.items) + 1
+
+        if column < self.left:
+            self.left = column
+        else:
+            text = self.table.get_line(line)
+            available, total = self.size[0] - self._get_padding()*2, 0
+            for index in range(column-1, self.left-1, -1):
+                total += self._measure(text[index])
+                if total > available:
+                    self.left = index + 1
+                    break
+
+    def get(self) -> str:
+        """Get text of the component"""
+        return self.table.get()
+
+    def set(self, value: str) -> bool:
+        """Set text of the component"""
+        if flag := len(value) <= self.limit:
+            self.text = value
+            self.top = self.left = self.cursor = 0
+            self._render()
+        return flag
+
+    def insert(self, index: int, value: str, *, truncate: bool = False) -> bool:
+        """Insert text to the location of the specified index
+
+        * `index`: index of the whole text
+        * `value`: text to be inserted
+        * `truncate`: whether to insert the part of the value within the limit instead of nothing
+        """
+        if truncate and len(self.table) + len(value) > self.limit:
+            value = value[:max(0, int(self.limit) - len(self.table))]
+        if flag := len(self.table) + len(value) <= self.limit:
+            self.table.insert(index, value)
+            if self.cursor >= index:
+                self.cursor += len(value)
+                self._scroll_to_cursor()
+            self._render()
+        return flag
+
+    def append(self, value: str, *, truncate: bool = False) -> bool:
+        """Add some characters to the end of the text"""
+        return self.insert(len(self.table), value, truncate=truncate)
+
+    def remove(self, start: int, end: int | None = None) -> None:
+        """Remove text within the specified index range"""
+        if end is None:
+            end = start + 1
+        if start > end:
+            start, end = end, start
+        self.table.remove(start, end)
+        if self.cursor > start:
+            self.cursor = self.cursor - (end-start) if self.cursor >= end else start
+        self.top = min(self.top, self.table.line_count() - 1)
+        self._scroll_to_cursor()
+        self._render()
+
+    def clear(self) -> None:
+        """Clear"""
+        self.set("")
+
+    def scroll(self, count: int) -> None:
+        """Scroll the text by lines, positive numbers scroll down"""
+        self.top = min(max(self.top + count, 0), self.table.line_count() - 1)
+        self._render()
+
+    def cursor_set(self, index: int) -> None:
+        """Set the index of the text cursor in the whole text"""
+        self.cursor = min(max(index, 0), len(self.table))
+        self._scroll_to_cursor()
+        self._render()
+
+    def cursor_move(self, count: int) -> None:
+        """Move the index position of the text cursor"""
+        self.cursor_set(self.cursor + count)
+
+    def cursor_move_line(self, count: int) -> None:
+        """Move the text cursor by lines and try to keep its column"""
+        line, column = self.table.position(self.cursor)
+        self.cursor_set(self.table.index(line + count, column))
+
+    def cursor_find(self, x: int, y: int) -> int:
+        """Get the index in the whole text which is nearest to the coordinates"""
+        padding = self._get_padding()
+        line = self.top + int((y - self.position[1] - padding) // self._get_linespace())
+        line = min(max(line, 0), self.table.line_count() - 1)
+        text = self.table.get_line(line)
+        x -= self.position[0] + padding
+        total = 0
+        for index in range(self.left, len(text)):
+            width = self._measure(text[index])
+            if x < total + width/2:
+                return self.table.index(line, index)
+            total += width
+        return self.table.line_end(line)
@@ -5,10 +5,12 @@ from __future__ import annotations
 __all__ = [
     "Text",
     "Image",
+    "StreamImage",
     "Label",
     "Button",
     "Switch",
     "InputBox",
+    "TextBox",
     "ToggleButton",
     "CheckButton",
     "RadioButton",
@@ -24,8 +26,11 @@ __all__ = [
 ]
 
 import collections.abc
+import concurrent.futures
 import itertools
 import math
+import os
+import tkinter
 import typing
 
 from ..animation import animations, controllers
@@ -43,6 +48,10 @@ class Text(virtual.Widget):
         position: tuple[int, int],
         *,
         text: str = "",
+        width: int | None = None,
+        wrap: bool = True,
+        max_lines: int | None = None,
+        ellipsis: typing.Literal["end", "middle"] | None = None,
         family: str | None = None,
         fontsize: int | None = None,
         weight: typing.Literal['normal', 'bold'] = "normal",
@@ -50,6 +59,7 @@ class Text(virtual.Widget):
         underline: bool = False,
         overstrike: bool = False,
         justify: typing.Literal["left", "center", "right"] = "left",
+        max_fps: int | None = None,
         name: str | None = None,
         anchor: typing.Literal["n", "e", "w", "s", "nw", "ne", "sw", "se", "center"] = "nw",
         through: bool | None = None,
@@ -59,6 +69,10 @@ class Text(virtual.Widget):
         * `master`: parent canvas
         * `position`: position of the widget
         * `text`: text of the widget
+        * `width`: the maximum width of lines, `None` means that the text is not laid out
+        * `wrap`: whether to break lines that are longer than `width`
+        * `max_lines`: the maximum number of lines
+        * `ellipsis`: where to put the ellipsis if the text is truncated
         * `family`: font family
         * `fontsize`: font size
         * `weight`: weight of the text
@@ -66,6 +80,8 @@ class Text(virtual.Widget):
         * `underline`: whether the text is underline
         * `overstrike`: whether the text is overstrike
         * `justify`: justify mode of the text
+        * `max_fps`: the maximum number of times the text is redrawn per second, `None` means that
+        it is redrawn every time it is set
         * `name`: name of the widget
         * `anchor`: anchor of the widget
         * `through`: wether detect another widget under the widget
@@ -77,16 +93,24 @@ class Text(virtual.Widget):
         # The above parameter `anchor` has no practical effect and is only used
         # to query the data of the widget.
         texts.Information(
-            self, text=text, family=family, fontsize=fontsize, weight=weight, slant=slant,
+            self, text=text, width=width, wrap=wrap, max_lines=max_lines, ellipsis=ellipsis,
+            family=family, fontsize=fontsize, weight=weight, slant=slant,
             underline=underline, overstrike=overstrike, justify=justify, anchor=anchor)
+        self._limiter = None if max_fps is None else tools.FrameLimiter(
+            self.master, self.texts[0].set, max_fps)
 
     def get(self) -> str:
         """Get the text of the widget"""
+        if self._limiter is not None and (args := self._limiter.pending) is not None:
+            return args[0]
         return self.texts[0].get()
 
     def set(self, text: str) -> None:
         """Set the text of the widget"""
-        return self.texts[0].set(text)
+        if self._limiter is not None:
+            self._limiter(text)
+        else:
+            self.texts[0].set(text)
 
 
 class Image(virtual.Widget):
@@ -131,6 +155,21 @@ class Image(virtual.Widget):
             return image
         return self.images[0].initail_image
 
+    def load(
+        self,
+        file: str | os.PathLike,
+        size: tuple[int, int] | None = None,
+        *,
+        placeholder: enhanced.PhotoImage | None = None,
+    ) -> concurrent.futures.Future:
+        """Load the image of the widget asynchronously, see `virtual.Image.load`
+
+        * `file`: path of the image
+        * `size`: size that the image is resized to, `None` means the original size
+        * `placeholder`: image displayed until the image is ready
+        """
+        return self.images[0].load(file, size, placeholder=placeholder)
+
     def set(self, image: enhanced.PhotoImage | None) -> None:
         """Set the image of the widget"""
         self.images[0].initail_image = image
@@ -141,6 +180,59 @@ class Image(virtual.Widget):
         self.master.itemconfigure(self.images[0].items[0], image=image)
 
 
+class StreamImage(virtual.Widget):
+    """Stream image widget, generally used to display frames of cameras or simulations"""
+
+    def __init__(
+        self,
+        master: containers.Canvas | virtual.Widget,
+        position: tuple[int, int],
+        *,
+        max_fps: int = 60,
+        name: str | None = None,
+        anchor: typing.Literal["n", "e", "w", "s", "nw", "ne", "sw", "se", "center"] = "nw",
+        through: bool | None = None,
+        animation: bool | None = None,
+    ) -> None:
+        """
+        * `master`: parent canvas
+        * `position`: position of the widget
+        * `max_fps`: the maximum number of frames displayed per second
+        * `name`: name of the widget
+        * `anchor`: anchor of the widget
+        * `through`: wether detect another widget under the widget
+        * `animation`: wether enable animation
+        """
+        virtual.Widget.__init__(
+            self, master, position, (0, 0),
+            name=name, anchor=anchor, through=through, animation=animation)
+        # The above parameter `anchor` has no practical effect and is only used
+        # to query the data of the widget.
+        images.DoubleBufferedImage(self, anchor=anchor, max_fps=max_fps)
+
+    @property
+    def fps(self) -> float:
+        """The number of frames displayed in the last second"""
+        return self.images[0].fps
+
+    @property
+    def dropped(self) -> int:
+        """The number of frames dropped because newer frames arrived in time"""
+        return self.images[0].dropped
+
+    def get(self) -> tkinter.PhotoImage:
+        """Get the image that is displayed"""
+        return self.images[0].image
+
+    def push(self, frame: typing.Any, size: tuple[int, int] | None = None) -> None:
+        """Push a frame of RGB pixels, see `images.DoubleBufferedImage.push`
+
+        * `frame`: `bytes`, `bytearray`, `memoryview` or a NumPy array of shape (height, width, 3)
+        * `size`: size of the frame, it is required unless `frame` is a NumPy array
+        """
+        self.images[0].push(frame, size)
+
+
 class Label(virtual.Widget):
     """Label widget, which is generally used to display key information"""
 
@@ -151,6 +243,9 @@ class Label(virtual.Widget):
         size: tuple[int, int] | None = None,
         *,
         text: str = "",
+        wrap: bool = False,
+        max_lines: int | None = None,
+        ellipsis: typing.Literal["end", "middle"] | None = None,
         family: str | None = None,
         fontsize: int | None = None,
         weight: typing.Literal['normal', 'bold'] = "normal",
@@ -159,6 +254,7 @@ class Label(virtual.Widget):
         overstrike: bool = False,
         justify: typing.Literal["left", "center", "right"] = "left",
         image: enhanced.PhotoImage | None = None,
+        max_fps: int | None = None,
         name: str | None = None,
         anchor: typing.Literal["n", "e", "w", "s", "nw", "ne", "sw", "se", "center"] = "nw",
         through: bool | None = None,
@@ -169,6 +265,9 @@ class Label(virtual.Widget):
         * `position`: position of the widget
         * `size`: size of the widget
         * `text`: text of the widget
+        * `wrap`: whether to break lines that are longer than the widget
+        * `max_lines`: the maximum number of lines
+        * `ellipsis`: where to put the ellipsis if the text is longer than the widget
         * `family`: font family
         * `fontsize`: font size
         * `weight`: weight of the text
@@ -177,6 +276,8 @@ class Label(virtual.Widget):
         * `overstrike`: whether the text is overstrike
         * `justify`: justify mode of the text
         * `image`: image of the widget
+        * `max_fps`: the maximum number of times the text is redrawn per second, `None` means that
+        it is redrawn every time it is set
         * `name`: name of the widget
         * `anchor`: anchor of the widget
         * `through`: wether detect another widget under the widget
@@ -194,10 +295,30 @@ class Label(virtual.Widget):
             shapes.RoundedRectangle(self)
         if image is not None:
             images.StillImage(self, image=image)
+        if wrap or max_lines is not None or ellipsis is not None:
+            width = self.size[0] - 12  # 12: the same padding as the default size
+        else:
+            width = None
         texts.Information(
-            self, text=text, family=family, fontsize=fontsize, weight=weight, slant=slant,
-            underline=underline, overstrike=overstrike, justify=justify)
+            self, text=text, width=width, wrap=wrap, max_lines=max_lines, ellipsis=ellipsis,
+            family=family, fontsize=fontsize, weight=weight, slant=slant, underline=underline,
+            overstrike=overstrike, justify=justify)
         features.LabelFeature(self)
+        self._limiter = None if max_fps is None else tools.FrameLimiter(
+            self.master, self.texts[0].set, max_fps)
+
+    def get(self) -> str:
+        """Get the text of the widget"""
+        if self._limiter is not None and (args := self._limiter.pending) is not None:
+            return args[0]
+        return self.texts[0].get()
+
+    def set(self, text: str) -> None:
+        """Set the text of the widget"""
+        if self._limiter is not None:
+            self._limiter(text)
+        else:
+            self.texts[0].set(text)
 
 
 class Button(virtual.Widget):
@@ -416,6 +537,87 @@ class InputBox(virtual.Widget):
         self.texts[0].clear()
 
 
+class TextBox(virtual.Widget):
+    """Text box widget, generally used to view or edit large text with multiple lines"""
+
+    def __init__(
+        self,
+        master: containers.Canvas | virtual.Widget,
+        position: tuple[int, int],
+        size: tuple[int, int] = (400, 300),
+        *,
+        text: str = "",
+        family: str | None = None,
+        fontsize: int | None = None,
+        weight: typing.Literal['normal', 'bold'] = "normal",
+        slant: typing.Literal['roman', 'italic'] = "roman",
+        underline: bool = False,
+        overstrike: bool = False,
+        limit: int = math.inf,
+        name: str | None = None,
+        anchor: typing.Literal["n", "e", "w", "s", "nw", "ne", "sw", "se", "center"] = "nw",
+        through: bool | None = None,
+        animation: bool | None = None,
+    ) -> None:
+        """
+        * `master`: parent canvas
+        * `position`: position of the widget
+        * `size`: size of the widget
+        * `text`: text of the widget
+        * `family`: font family
+        * `fontsize`: font size
+        * `weight`: weight of the text
+        * `slant`: slant of the text
+        * `underline`: whether the text is underline
+        * `overstrike`: whether the text is overstrike
+        * `limit`: limit on the number of characters
+        * `name`: name of the widget
+        * `anchor`: anchor of the widget
+        * `through`: wether detect another widget under the widget
+        * `animation`: wether enable animation
+        """
+        virtual.Widget.__init__(
+            self, master, position, size, name=name, anchor=anchor,
+            through=through, animation=animation)
+        if configs.Env.system == "Windows10":
+            shapes.Rectangle(self)
+        else:
+            shapes.RoundedRectangle(self, name=".out")
+            shapes.RoundedRectangle(self, name=".in", size=(self.size[0], self.size[1]-3))
+        texts.MultiLineText(
+            self, text=text, family=family, fontsize=fontsize, weight=weight, slant=slant,
+            underline=underline, overstrike=overstrike, limit=limit)
+        features.TextBoxFeature(self)
+
+    def get(self) -> str:
+        """Get the value of the text box"""
+        return self.texts[0].get()
+
+    def set(self, value: str) -> bool:
+        """Set the text value of the text box"""
+        return self.texts[0].set(value)
+
+    def insert(self, index: int, value: str) -> bool:
+        """Insert"""
+        return self.texts[0].insert(index, value)
+
+    def append(self, value: str) -> bool:
+        """Append text to the text box"""
+        return self.texts[0].append(value)
+
+    def remove(self, start: int, end: int | None = None) -> None:
+        """Remove"""
+        self.texts[0].remove(start, end)
+
+    def clear(self) -> None:
+        """Clear the text value of the text box"""
+        self.texts[0].clear()
+
+    def scroll(self, count: int) -> None:
+        """Scroll the text by lines, positive numbers scroll down"""
+        self.texts[0].scroll(count)
+
+
 class CheckButton(virtual.Widget):
     """Checkbox button widget, generally used to check some options"""
 
@@ -629,6 +831,8 @@ class ProgressBar(virtual.Widget):
         default: float | None = None,
         command: collections.abc.Callable[[float], typing.Any] | None = None,
         image: enhanced.PhotoImage | None = None,
+        max_fps: int | None = None,
+        command_policy: typing.Literal["each", "frame"] = "each",
         name: str | None = None,
         anchor: typing.Literal["n", "e", "w", "s", "nw", "ne", "sw", "se", "center"] = "nw",
         through: bool | None = None,
@@ -641,6 +845,10 @@ class ProgressBar(virtual.Widget):
         * `default`: default value of the widget
         * `command`: a function that is triggered when the progress of progress bar is 100%
         * `image`: image of the widget
+        * `max_fps`: the maximum number of times the widget is redrawn per second, `None` means
+        that it is redrawn every time the value is set
+        * `command_policy`: "each" calls `command` every time the value is set with callback,
+        "frame" calls it at most once per redrawing with the latest value, it needs `max_fps`
         * `name`: name of the widget
         * `anchor`: anchor of the widget
         * `through`: wether detect another widget under the widget
@@ -665,6 +873,10 @@ class ProgressBar(virtual.Widget):
         features.ProgressBarFeature(self)
         self.shapes[1].disappear()
         self.command = command
+        self.command_policy = command_policy
+        self._callback = False
+        self._limiter = None if max_fps is None else tools.FrameLimiter(
+            self.master, self._render, max_fps)
         if default is not None:
             self.set(default)
 
@@ -676,7 +888,19 @@ class ProgressBar(virtual.Widget):
         """Set the progress of the progress bar"""
         self.value = 0 if value < 0 else 1 if value > 1 else value
         if callback and self.command is not None:
-            self.command(value)
+            if self._limiter is not None and self.command_policy == "frame":
+                self._callback = True
+            else:
+                self.command(value)
+        if self._limiter is not None:
+            return self._limiter()
+        return self._render()
+
+    def _render(self) -> None:
+        """Redraw the progress bar according to its value"""
+        if self._callback:
+            self._callback = False
+            self.command(self.value)
         if self.value == 0:
             return self.shapes[1].disappear()
         if not self.shapes[1].visible:
@@ -874,6 +1098,8 @@ class Slider(virtual.Widget):
         *,
         default: float | None = None,
         command: collections.abc.Callable[[float], typing.Any] | None = None,
+        max_fps: int | None = None,
+        command_policy: typing.Literal["each", "frame"] = "each",
         name: str | None = None,
         anchor: typing.Literal["n", "e", "w", "s", "nw", "ne", "sw", "se", "center"] = "nw",
         through: bool | None = None,
@@ -885,6 +1111,10 @@ class Slider(virtual.Widget):
         * `size`: size of the widget
         * `default`: default value of the widget
         * `command`: a function that is triggered when the button is pressed
+        * `max_fps`: the maximum number of times the widget is redrawn per second, `None` means
+        that it is redrawn every time the value is set
+        * `command_policy`: "each" calls `command` every time the value is set with callback,
+        "frame" calls it at most once per redrawing with the latest value, it needs `max_fps`
         * `name`: name of the widget
         * `anchor`: anchor of the widget
         * `through`: wether detect another widget under the widget
@@ -892,6 +1122,9 @@ class Slider(virtual.Widget):
         """
         self.value: float = 0
         self.command = command
+        self.command_policy = command_policy
+        self._drawn_value: float = 0
+        self._callback = False
         virtual.Widget.__init__(
             self, master, position, size, name=name, anchor=anchor,
             through=through, animation=animation)
@@ -905,6 +1138,8 @@ class Slider(virtual.Widget):
             shapes.Oval(self, size=(size[1], size[1]), name=".out")
             shapes.Oval(self, (size[1]/4, size[1]/4), (size[1]/2, size[1]/2), name=".in")
         features.SliderFeature(self)
+        self._limiter = None if max_fps is None else tools.FrameLimiter(
+            self.master, self._render, max_fps)
         if default is not None:
             self.set(default)
 
@@ -916,14 +1151,27 @@ class Slider(virtual.Widget):
         """Set the value of the slider"""
         value = 1 if value > 1 else 0 if value < 0 else value
         if callback and self.command is not None:
-            self.command(value)
-        if self.get() == value:
+            if self._limiter is not None and self.command_policy == "frame":
+                self._callback = True
+            else:
+                self.command(value)
+        self.value = value
+        if self._limiter is not None:
+            return self._limiter()
+        return self._render()
+
+    def _render(self) -> None:
+        """Redraw the slider according to its value"""
+        if self._callback:
+            self._callback = False
+            self.command(self.value)
+        if self._drawn_value == self.value:
             return
         if isinstance(self.shapes[-1], shapes.Oval):
-            delta = (value-self.value) * (self.size[0]-self.size[1])
+            delta = (self.value-self._drawn_value) * (self.size[0]-self.size[1])
         else:
-            delta = (value-self.value) * (self.size[0]-self.size[1]*2/5)
-        self.value = value
+            delta = (self.value-self._drawn_value) * (self.size[0]-self.size[1]*2/5)
+        self._drawn_value = self.value
         for shape in self.shapes[2:]:
             shape.move(delta, 0)
         if isinstance(self.shapes[-1], shapes.Oval):
@@ -1058,6 +1306,7 @@ class SpinBox(virtual.Widget):
         limit: int = math.inf,
         command: collections.abc.Callable[[bool], typing.Any] | None = None,
         image: enhanced.PhotoImage | None = None,
+        max_fps: int | None = None,
         name: str | None = None,
         anchor: typing.Literal["n", "e", "w", "s", "nw", "ne", "sw", "se", "center"] = "nw",
         through: bool | None = None,
@@ -1081,6 +1330,8 @@ class SpinBox(virtual.Widget):
         * `limit`: limit on the number of characters
         * `command`: a function that is triggered when the button is pressed
         * `image`: image of the widget
+        * `max_fps`: the maximum number of times the value is redrawn per second when it is set,
+        `None` means that it is redrawn every time it is set
         * `name`: name of the widget
         * `anchor`: anchor of the widget
         * `through`: wether detect another widget under the widget
@@ -1105,27 +1356,34 @@ class SpinBox(virtual.Widget):
         self.format = style
         self.step = step
         features.SpinBoxFeature(self, command=command)
+        self._limiter = None if max_fps is None else tools.FrameLimiter(
+            self.master, self.widgets[0].set, max_fps)
 
     def change(self, up: bool) -> None:
         """Try change the current value"""
-        if not (value := self.widgets[0].get()):
-            return self.widgets[0].set(("%"+self.format) % 0)
+        if not (value := self.get()):
+            return self.set(("%"+self.format) % 0)
         try:
             value = float(value) + (self.step if up else -self.step)
             if math.isclose(value, int_value := int(value)):
                 value = int_value
-            self.widgets[0].set(("%"+self.format) % value)
+            self.set(("%"+self.format) % value)
         except ValueError:
             pass
         return None
 
     def get(self) -> str:
         """Get the value of the Entry"""
+        if self._limiter is not None and (args := self._limiter.pending) is not None:
+            return args[0]
         return self.widgets[0].get()
 
     def set(self, value: str) -> None:
         """Set the text value of the Entry"""
-        self.widgets[0].set(value)
+        if self._limiter is not None:
+            self._limiter(value)
+        else:
+            self.widgets[0].set(value)
 
     def append(self, value: str) -> None:
         """Append text to Entry"""
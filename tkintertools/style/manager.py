@@ -53,6 +53,21 @@ except ImportError:
 _callback_events: dict[collections.abc.Callable[[bool, typing.Any], typing.Any], tuple] = {}
 """Events that are responded to when the system theme changes"""
 
+_pending_events: dict[
+    typing.Any, tuple[bool, dict[collections.abc.Callable[[bool, typing.Any], typing.Any], tuple]]
+] = {}
+"""Events waiting for the next batched theme pass, keyed by their targets, each target keeps the
+latest theme and its callback functions"""
+
+_pending_scheduled: bool = False
+"""Whether a batched theme pass has been scheduled"""
+
+_pending_lock = threading.Lock()
+"""Lock that protects the pending data, which can be touched by the listener thread"""
+
+_listener: threading.Thread | None = None
+"""The thread that listens to the changes of the system theme, it is started when it is needed"""
+
 
 def set_color_mode(mode: typing.Literal["system", "dark", "light"] = "system") -> None:
     """Set the color mode of the program
@@ -64,6 +79,8 @@ def set_color_mode(mode: typing.Literal["system", "dark", "light"] = "system") -
     `"system"` is the following system
     """
     configs.Theme.color_mode = mode
+    if mode == "system" and _callback_events:
+        _start_listener()
     _process_event(configs.Env.is_dark if mode == "system" else (mode == "dark"))
 
 
@@ -103,6 +120,8 @@ def register_event(
     * `args`: extra arguments
     """
     _callback_events[func] = args
+    if configs.Theme.color_mode == "system":
+        _start_listener()
 
 
 def remove_event(func: collections.abc.Callable[[bool, typing.Any], typing.Any]) -> None:
@@ -198,16 +217,65 @@ def customize_window(
             win32material.SetWindowBorder(ctypes.wintypes.HWND(tools.get_hwnd(window)), type_)
 
 
+def _get_target(func: collections.abc.Callable) -> typing.Any:
+    """Get the target of a callback function, i.e. the bound object of a method
+
+    * `func`: callback function
+    """
+    return getattr(func, "__self__", func)
+
+
 def _process_event(dark_mode: bool) -> None:
     """Handle registered callback functions
 
+    The requests are coalesced by the targets of the callback functions: only the latest theme of
+    each target is applied, once, by one batched theme pass, which runs on the Tk thread when it is
+    idle.
+
     * `dark_mode`: Wether it is dark mode
     """
-    for func, args in _callback_events.items():
-        try:  # Prevent detection thread from crashing
-            func(dark_mode, *args)
-        except Exception as exc:
-            traceback.print_exception(exc)
+    global _pending_scheduled
+
+    with _pending_lock:
+        for func, args in tuple(_callback_events.items()):
+            target = _get_target(func)
+            callbacks = _pending_events.get(target, (dark_mode, {}))[1]
+            callbacks[func] = args
+            _pending_events[target] = dark_mode, callbacks
+        if _pending_scheduled:
+            return None
+        _pending_scheduled = True
+
+    if (root := tkinter._default_root) is None:
+        return _flush_events()
+
+    try:  # tkinter marshals the call when it comes from another thread
+        root.after_idle(_flush_events)
+    except (RuntimeError, tkinter.TclError) as exc:
+        with _pending_lock:
+            _pending_scheduled = False
+        traceback.print_exception(exc)
+
+    return None
+
+
+def _flush_events() -> None:
+    """Run one batched theme pass for all pending callback functions"""
+    global _pending_scheduled
+
+    with _pending_lock:
+        events = tuple(_pending_events.values())
+        _pending_events.clear()
+        _pending_scheduled = False
+
+    for dark_mode, callbacks in events:
+        for func, args in callbacks.items():
+            if _callback_events.get(func) is None:
+                continue  # It has been removed before the pass
+            try:  # Prevent one callback from breaking the whole pass
+                func(dark_mode, *args)
+            except Exception as exc:
+                traceback.print_exception(exc)
 
 
 def _callback(theme: str) -> None:
@@ -221,5 +289,14 @@ def _callback(theme: str) -> None:
         _process_event(configs.Env.is_dark)
 
 
-if globals().get("darkdetect") is not None:
-    threading.Thread(target=lambda: darkdetect.listener(_callback), daemon=True).start()
+def _start_listener() -> None:
+    """Start the thread that listens to the system theme if it has not been started yet
+
+    The listener keeps a monitoring subprocess alive on some platforms, so it is only started when
+    a callback function is registered and the color mode is `"system"`.
+    """
+    global _listener
+
+    if _listener is None and globals().get("darkdetect") is not None:
+        _listener = threading.Thread(target=lambda: darkdetect.listener(_callback), daemon=True)
+        _listener.start()
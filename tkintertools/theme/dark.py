@@ -296,6 +296,9 @@ UnderlineButton = {
     }
 }
 
+TextBox = copy.deepcopy(InputBox)
+TextBox["MultiLineText"] = TextBox.pop("SingleLineText")
+
 _AuxiliaryLabel = copy.deepcopy(Label)
 del _AuxiliaryLabel["RoundedRectangle"]
 _AuxiliaryLabel["HalfRoundedRectangle"] = Label["RoundedRectangle"]
@@ -4,16 +4,134 @@ from __future__ import annotations
 
 __all__ = [
     "PhotoImage",
+    "ImageAtlas",
+    "ImageLoader",
+    "load_async",
+    "rasterize",
 ]
 
+import array
+import base64
+import collections.abc
+import concurrent.futures
+import fractions
 import functools
+import json
+import math
+import os
+import pathlib
+import struct
 import tkinter
+import traceback
+import typing
+import zlib
 
 try:
-    from PIL import ImageTk
+    from PIL import Image, ImageDraw, ImageTk
 except ImportError:
     pass
 
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+
+def _paeth(a: int, b: int, c: int) -> int:
+    """Paeth predictor of PNG"""
+    p = a + b - c
+    pa, pb, pc = abs(p - a), abs(p - b), abs(p - c)
+    if pa <= pb and pa <= pc:
+        return a
+    return b if pb <= pc else c
+
+
+def _png_decode(data: bytes) -> tuple[int, int, bytes]:
+    """Decode 8-bit non-interlaced RGB or RGBA PNG data into width, height and RGBA pixels"""
+    if not data.startswith(_PNG_SIGNATURE):
+        raise ValueError("Not PNG data.")
+    offset, chunks = len(_PNG_SIGNATURE), []
+    width = height = channels = 0
+    while offset < len(data):
+        length, kind = struct.unpack_from(">I4s", data, offset)
+        body = data[offset+8:offset+8+length]
+        offset += length + 12
+        if kind == b"IHDR":
+            width, height, depth, color, _, _, interlace = struct.unpack(">IIBBBBB", body)
+            if depth != 8 or color not in (2, 6) or interlace:
+                raise ValueError("Unsupported PNG format.")
+            channels = 4 if color == 6 else 3
+        elif kind == b"IDAT":
+            chunks.append(body)
+        elif kind == b"IEND":
+            break
+
+    raw, stride = zlib.decompress(b"".join(chunks)), width * channels
+    pixels = bytearray(stride * height)
+    previous = bytearray(stride)
+    for y in range(height):
+        kind, row = raw[y*(stride+1)], bytearray(raw[y*(stride+1)+1:(y+1)*(stride+1)])
+        if kind == 1:
+            for i in range(channels, stride):
+                row[i] = (row[i] + row[i-channels]) & 0xFF
+        elif kind == 2:
+            row = bytearray((a + b) & 0xFF for a, b in zip(row, previous))
+        elif kind == 3:
+            for i in range(stride):
+                left = row[i-channels] if i >= channels else 0
+                row[i] = (row[i] + ((left + previous[i]) >> 1)) & 0xFF
+        elif kind == 4:
+            for i in range(stride):
+                left = row[i-channels] if i >= channels else 0
+                upper_left = previous[i-channels] if i >= channels else 0
+                row[i] = (row[i] + _paeth(left, previous[i], upper_left)) & 0xFF
+        pixels[y*stride:(y+1)*stride] = previous = row  # Filter 0 needs nothing
+
+    if channels == 3:
+        rgba = bytearray(b"\xff" * (width * height * 4))
+        for i in range(3):
+            rgba[i::4] = pixels[i::3]
+        pixels = rgba
+    return width, height, bytes(pixels)
+
+
+def _png_encode(width: int, height: int, pixels: bytes) -> bytes:
+    """Encode RGBA pixels into PNG data without filters"""
+    def chunk(kind: bytes, body: bytes) -> bytes:
+        return struct.pack(">I", len(body)) + kind + body \
+            + struct.pack(">I", zlib.crc32(kind + body))
+
+    stride = width * 4
+    raw = b"".join(b"\x00" + pixels[y*stride:(y+1)*stride] for y in range(height))
+    return _PNG_SIGNATURE + chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 6, 0, 0, 0)) \
+        + chunk(b"IDAT", zlib.compress(raw, 1)) + chunk(b"IEND", b"")
+
+
+def _ppm_encode(width: int, height: int, pixels: bytes) -> bytes:
+    """Encode RGBA pixels into PPM data, the alpha channel is dropped"""
+    rgb = bytearray(width * height * 3)
+    for i in range(3):
+        rgb[i::3] = pixels[i::4]
+    return b"P6 %d %d 255\n" % (width, height) + rgb
+
+
+def _resize_pixels(
+    width: int,
+    height: int,
+    pixels: bytes,
+    new_width: int,
+    new_height: int,
+) -> bytes:
+    """Resize RGBA pixels with the nearest neighbor algorithm"""
+    source = memoryview(pixels).cast("I")  # One item per pixel
+    columns = [int(i * width / new_width) for i in range(new_width)]
+    rows: list[bytes] = []
+    last_y, last_row = -1, b""
+    for j in range(new_height):
+        if (y := int(j * height / new_height)) != last_y:  # Reuse the same source row
+            offset = y * width
+            last_y, last_row = y, array.array(
+                "I", map(source.__getitem__, [offset + i for i in columns])).tobytes()
+        rows.append(last_row)
+    return b"".join(rows)
+
 
 if globals().get("ImageTk") is None:
 
@@ -38,6 +156,44 @@ if globals().get("ImageTk") is None:
 
         def resize(self, width: int, height: int) -> PhotoImage:
             """Resize the PhotoImage"""
+            if (image := self._resize_by_copy(width, height)) is not None:
+                return image
+            try:
+                return self._resize_by_data(width, height)
+            except (ValueError, zlib.error, tkinter.TclError):
+                return self._resize_by_pixels(width, height)
+
+        def _resize_by_copy(self, width: int, height: int) -> PhotoImage | None:
+            """Resize the PhotoImage by Tk natively if the ratios are simple enough"""
+            x = fractions.Fraction(width, self.width())
+            y = fractions.Fraction(height, self.height())
+            if max(x.numerator, x.denominator, y.numerator, y.denominator) > 8:
+                return None
+            if self.width() % x.denominator or self.height() % y.denominator:
+                return None  # Subsampling doesn't get the exact size
+            options: list[str | int] = []
+            if x.numerator != 1 or y.numerator != 1:
+                options += ["-zoom", x.numerator, y.numerator]
+            if x.denominator != 1 or y.denominator != 1:
+                options += ["-subsample", x.denominator, y.denominator]
+            new_image = PhotoImage(width=width, height=height)
+            new_image.tk.call(new_image, "copy", self, *options)
+            return new_image
+
+        def _resize_by_data(self, width: int, height: int) -> PhotoImage:
+            """Resize the PhotoImage through its PNG data"""
+            data = self.tk.call(self, "data", "-format", "png")
+            if isinstance(data, str):
+                data = data.encode("latin-1") if data.startswith("\x89PNG") \
+                    else base64.b64decode(data)
+            pixels = _resize_pixels(*_png_decode(data), width, height)
+            if pixels[3::4] == b"\xff" * (width * height):  # Opaque
+                return PhotoImage(data=_ppm_encode(width, height, pixels), format="ppm")
+            return PhotoImage(
+                data=base64.b64encode(_png_encode(width, height, pixels)), format="png")
+
+        def _resize_by_pixels(self, width: int, height: int) -> PhotoImage:
+            """Resize the PhotoImage pixel by pixel, it is slow but works with any image"""
             x, y = width / self.width(), height / self.height()
             new_image = PhotoImage(width=width, height=height)
             new_image.put([[self._data[int(j/y)][int(i/x)]
@@ -55,10 +211,367 @@ else:
     class PhotoImage(ImageTk.PhotoImage, tkinter.PhotoImage):
         """Pillow version of `tkinter.PhotoImage`"""
 
+        def __init__(
+            self,
+            image: Image.Image | str | None = None,
+            size: tuple[int, int] | None = None,
+            *,
+            keep_source: bool = False,
+            **kwargs,
+        ) -> None:
+            """
+            * `image`: the image of Pillow or the mode of a new image
+            * `size`: size of a new image
+            * `keep_source`: whether to keep the image of Pillow, which makes `source` faster
+            but takes as much memory again
+            * `**kwargs`: compatible with other parameters of class `ImageTk.PhotoImage`
+            """
+            ImageTk.PhotoImage.__init__(self, image, size, **kwargs)
+            self._source = image if keep_source and isinstance(image, Image.Image) else None
+
+        @property
+        def source(self) -> Image.Image:
+            """The image of Pillow, it is read from Tk every time if it is not kept"""
+            return ImageTk.getimage(self) if self._source is None else self._source
+
         def scale(self, x: int | float, y: int | float) -> PhotoImage:
             """Scale the PhotoImage"""
             return self.resize(round(x*self.width()), round(y*self.height()))
 
         def resize(self, width: int, height: int) -> PhotoImage:
             """Resize the PhotoImage"""
-            return PhotoImage(ImageTk.getimage(self).resize((width, height)))
+            return PhotoImage(self.source.resize((width, height)))
+
+
+class ImageAtlas:
+    """Atlas of images, i.e. a sprite sheet
+
+    Many small images are stored in one file, which is decoded only once. Sub-images are sliced
+    from the sheet when they are got for the first time and then cached, and they are instances of
+    `PhotoImage`, so they can be used anywhere a `PhotoImage` can be used.
+    """
+
+    def __init__(
+        self,
+        file: str | os.PathLike,
+        regions: dict[str, tuple[int, int, int, int]] | None = None,
+    ) -> None:
+        """
+        * `file`: path of the sheet
+        * `regions`: names and regions (x, y, width, height) of sub-images
+        """
+        self.file = file
+        self.regions: dict[str, tuple[int, int, int, int]] = {} if regions is None else regions
+        self._cache: dict[tuple[int, int, int, int], PhotoImage] = {}
+
+    @classmethod
+    def from_manifest(cls, file: str | os.PathLike) -> ImageAtlas:
+        """Create an atlas from a JSON manifest
+
+        The format of the manifest is `{"image": "path", "regions": {"name": [x, y, w, h]}}`, and
+        the path of the sheet is relative to the manifest
+
+        * `file`: path of the manifest
+        """
+        return cls(*cls.read_manifest(file))
+
+    @staticmethod
+    def read_manifest(
+        file: str | os.PathLike,
+    ) -> tuple[pathlib.Path, dict[str, tuple[int, int, int, int]]]:
+        """Read the path of the sheet and regions of sub-images from a JSON manifest
+
+        * `file`: path of the manifest
+        """
+        with open(file, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        regions = {name: tuple(region) for name, region in data["regions"].items()}
+        return pathlib.Path(file).parent/data["image"], regions
+
+    @functools.cached_property
+    def sheet(self) -> PhotoImage:
+        """The whole sheet, it is loaded when it is used for the first time"""
+        if globals().get("Image") is None:
+            return PhotoImage(file=self.file)
+        return PhotoImage(self.source)
+
+    @functools.cached_property
+    def source(self) -> Image.Image:
+        """The decoded sheet of Pillow, it is only available when Pillow is installed"""
+        with Image.open(self.file) as image:
+            return image.convert("RGBA")
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.regions
+
+    def __getitem__(self, name: str) -> PhotoImage:
+        """Get a sub-image by its name"""
+        return self.crop(*self.regions[name])
+
+    def get(self, name: str, default: PhotoImage | None = None) -> PhotoImage | None:
+        """Get a sub-image by its name, return `default` if the name doesn't exist"""
+        if name not in self.regions:
+            return default
+        return self[name]
+
+    def crop(self, x: int, y: int, width: int, height: int) -> PhotoImage:
+        """Get a sub-image by its region, which is cached
+
+        * `x`: x-coordinate of the upper left corner
+        * `y`: y-coordinate of the upper left corner
+        * `width`: width of the region
+        * `height`: height of the region
+        """
+        if (image := self._cache.get((x, y, width, height))) is None:
+            if globals().get("Image") is None:
+                image = PhotoImage(width=width, height=height)
+                image.tk.call(image, "copy", self.sheet, "-from", x, y, x+width, y+height)
+            else:
+                image = PhotoImage(self.source.crop((x, y, x+width, y+height)))
+            self._cache[x, y, width, height] = image
+        return image
+
+    def clear(self) -> None:
+        """Clear the cached sub-images"""
+        self._cache.clear()
+
+
+def _decode(file: str | os.PathLike, size: tuple[int, int] | None) -> typing.Any:
+    """Decode an image in a worker thread, return the data that `_to_photo` needs"""
+    if globals().get("Image") is None:
+        with open(file, "rb") as f:  # Only reading can be done without Tk
+            return f.read()
+    with Image.open(file) as image:
+        image = image.convert("RGBA")
+        if size is not None:
+            image = image.resize(size)
+        return image
+
+
+def _to_photo(
+    data: typing.Any,
+    size: tuple[int, int] | None,
+    master: tkinter.Misc | None,
+) -> PhotoImage:
+    """Create a `PhotoImage` from the data that `_decode` returns on the Tk thread"""
+    if globals().get("Image") is None:
+        image = PhotoImage(data=data, master=master)
+        if size is not None and size != (image.width(), image.height()):
+            image = image.resize(*size)
+        return image
+    return PhotoImage(data, master=master)
+
+
+def _exists(widget: tkinter.Misc | None) -> bool:
+    """Whether the widget exists, it is `False` if its Tcl interpreter has been deleted"""
+    if widget is None:
+        return False
+    try:
+        return bool(widget.winfo_exists())
+    except tkinter.TclError:
+        return False
+
+
+class ImageLoader:
+    """Loader of images, which decodes images in a thread pool
+
+    Decoding and resizing are done in worker threads (Pillow releases the GIL while doing them), and
+    images are created on the Tk thread by polling with `after` on the root window, which only runs
+    while there are pending jobs. All jobs finished between two polls are applied in the same poll.
+    """
+
+    def __init__(self, max_workers: int = 4, *, interval: int = 16) -> None:
+        """
+        * `max_workers`: the maximum number of images that are decoded at the same time
+        * `interval`: interval of polling, in milliseconds
+        """
+        self.max_workers = max_workers
+        self.interval = interval
+        self._executor: concurrent.futures.ThreadPoolExecutor | None = None
+        self._pending: dict[concurrent.futures.Future, tuple[
+            collections.abc.Callable[[PhotoImage], typing.Any],
+            tuple[int, int] | None, tkinter.Misc | None]] = {}
+        self._polling: bool = False
+        self._root: tkinter.Misc | None = None
+
+    def load(
+        self,
+        file: str | os.PathLike,
+        size: tuple[int, int] | None = None,
+        *,
+        callback: collections.abc.Callable[[PhotoImage], typing.Any],
+        master: tkinter.Misc | None = None,
+    ) -> concurrent.futures.Future:
+        """Load an image asynchronously, the callback is called with the image on the Tk thread
+
+        * `file`: path of the image
+        * `size`: size that the image is resized to, `None` means the original size
+        * `callback`: function that is called with the image when it is ready
+        * `master`: the widget used to find the root window and create the image
+        """
+        return self._submit(_decode, file, size, callback=callback, size=size, master=master)
+
+    def resize(
+        self,
+        image: PhotoImage,
+        size: tuple[int, int],
+        *,
+        callback: collections.abc.Callable[[PhotoImage], typing.Any],
+        master: tkinter.Misc | None = None,
+    ) -> concurrent.futures.Future:
+        """Resize an image asynchronously, it only works when Pillow is installed
+
+        * `image`: the image to be resized
+        * `size`: size that the image is resized to
+        * `callback`: function that is called with the new image when it is ready
+        * `master`: the widget used to find the root window and create the image
+        """
+        source = image.source  # Get it on the Tk thread
+        return self._submit(source.resize, size, callback=callback, size=size, master=master)
+
+    def _submit(
+        self,
+        function: collections.abc.Callable,
+        *args,
+        callback: collections.abc.Callable[[PhotoImage], typing.Any],
+        size: tuple[int, int] | None,
+        master: tkinter.Misc | None,
+    ) -> concurrent.futures.Future:
+        """Submit a job to the thread pool and start polling if it is not running"""
+        if self._executor is None:
+            self._executor = concurrent.futures.ThreadPoolExecutor(
+                self.max_workers, thread_name_prefix="ImageLoader")
+        future = self._executor.submit(function, *args)
+        self._pending[future] = callback, size, master
+        if not self._polling or not _exists(self._root):  # The root window may have been destroyed
+            self._polling = True
+            self._root = tkinter._get_default_root() if master is None else master._root()
+            self._root.after(self.interval, self._poll)
+        return future
+
+    def cancel(self, future: concurrent.futures.Future) -> None:
+        """Cancel a job, its callback won't be called even if the image has been decoded
+
+        * `future`: the future that `load` returns
+        """
+        future.cancel()
+        self._pending.pop(future, None)
+
+    def _poll(self) -> None:
+        """Deliver decoded images and poll again if there are pending jobs"""
+        for future in [future for future in self._pending if future.done()]:
+            callback, size, image_master = self._pending.pop(future)
+            if future.cancelled() or (image_master is not None and not _exists(image_master)):
+                continue
+            try:
+                callback(_to_photo(future.result(), size, image_master))
+            except Exception as exc:  # pylint: disable=broad-exception-caught
+                traceback.print_exception(exc)
+        if self._pending:
+            self._root.after(self.interval, self._poll)
+        else:
+            self._polling = False
+
+
+loader = ImageLoader()
+"""The default loader of images"""
+
+
+def load_async(
+    file: str | os.PathLike,
+    size: tuple[int, int] | None = None,
+    *,
+    callback: collections.abc.Callable[[PhotoImage], typing.Any],
+    master: tkinter.Misc | None = None,
+) -> concurrent.futures.Future:
+    """Load an image asynchronously with the default loader `loader`, see `ImageLoader.load`
+
+    The loader polls on the root window of `master`, or on the default root window if `master` is
+    `None`, and the callback is not called if `master` has been destroyed by then.
+
+    * `file`: path of the image
+    * `size`: size that the image is resized to, `None` means the original size
+    * `callback`: function that is called with the image when it is ready
+    * `master`: the widget used to find the root window and create the image
+    """
+    return loader.load(file, size, callback=callback, master=master)
+
+
+_RASTER_TYPES: typing.Final[frozenset[str]] = frozenset(
+    ("rectangle", "oval", "polygon", "line", "arc"))
+"""Types of canvas items that `rasterize` can draw"""
+
+
+def _get_rgb(canvas: tkinter.Canvas, color: str) -> tuple[int, int, int] | None:
+    """Convert a color of Tk to RGB, `None` means transparent"""
+    if not color:
+        return None
+    return tuple(value >> 8 for value in canvas.winfo_rgb(color))
+
+
+def rasterize(
+    canvas: tkinter.Canvas,
+    items: collections.abc.Iterable[int],
+) -> tuple[PhotoImage, tuple[int, int], list[int]] | None:
+    """Draw shape items of a canvas on one image with Pillow, items of other types, such as text
+    and image items, are not drawn
+
+    It returns the image, the position of its upper left corner and the drawn items from the lowest
+    to the highest, or `None` if Pillow is not installed or there is no item to draw. Hidden items
+    are drawn as well.
+
+    * `canvas`: the canvas where the items are
+    * `items`: items to draw
+    """
+    if globals().get("ImageTk") is None:
+        return None
+    targets = set(items)
+    drawn = [item for item in canvas.find_all()
+             if item in targets and canvas.type(item) in _RASTER_TYPES]
+    if not drawn:
+        return None
+
+    shapes: list[tuple[int, str, list[float], float]] = []
+    x1 = y1 = math.inf
+    x2 = y2 = -math.inf
+    for item in drawn:
+        points = canvas.coords(item)
+        width = float(canvas.itemcget(item, "width"))
+        shapes.append((item, canvas.type(item), points, width))
+        x1, x2 = min(x1, min(points[0::2]) - width), max(x2, max(points[0::2]) + width)
+        y1, y2 = min(y1, min(points[1::2]) - width), max(y2, max(points[1::2]) + width)
+    x1, y1 = math.floor(x1), math.floor(y1)
+
+    image = Image.new("RGBA", (math.ceil(x2) - x1 + 1, math.ceil(y2) - y1 + 1))
+    draw = ImageDraw.Draw(image)
+    for item, kind, points, width in shapes:
+        points = [value - (y1 if i % 2 else x1) for i, value in enumerate(points)]
+        fill = _get_rgb(canvas, canvas.itemcget(item, "fill"))
+        width = max(1, round(width))
+        if kind == "line":
+            if fill is not None:
+                draw.line(points, fill, width)
+            continue
+        outline = _get_rgb(canvas, canvas.itemcget(item, "outline"))
+        match kind:
+            case "rectangle":
+                draw.rectangle(points, fill, outline, width)
+            case "oval":
+                draw.ellipse(points, fill, outline, width)
+            case "polygon":
+                draw.polygon(points, fill, outline, width)
+            case "arc":
+                start = float(canvas.itemcget(item, "start"))
+                extent = float(canvas.itemcget(item, "extent"))
+                # Angles of Tk are counterclockwise, and those of Pillow are clockwise
+                begin, end = sorted((-start, -start - extent))
+                match canvas.itemcget(item, "style"):
+                    case "arc":
+                        if outline is not None:
+                            draw.arc(points, begin, end, outline, width)
+                    case "chord":
+                        draw.chord(points, begin, end, fill, outline, width)
+                    case _:
+                        draw.pieslice(points, begin, end, fill, outline, width)
+
+    return PhotoImage(image, master=canvas), (x1, y1), drawn
@@ -8,23 +8,52 @@ __all__ = [
     "load_font",
     "screen_size",
     "get_text_size",
+    "TextMetrics",
+    "run_async",
+    "DispatchQueue",
+    "FrameLimiter",
+    "ProgressReporter",
+    "Task",
+    "TaskRunner",
 ]
 
+import asyncio
 import atexit
+import bisect
+import collections
 import collections.abc
+import concurrent.futures
 import ctypes
+import json
+import math
+import multiprocessing
 import os
 import platform
+import selectors
 import shutil
+import threading
+import time
 import tkinter
 import tkinter.font
 import traceback
 import typing
 
+import _tkinter
+
 from ..core import configs, virtual
 
 _LINUX_FONTS_DIR: typing.Final[str] = os.path.expanduser("~/.fonts/")
 
+FontKey = tuple[str, int, str, str, bool, bool]
+"""
+family: font family
+size: font size
+weight: "normal" or "bold"
+slant: "roman" or "italic"
+underline: whether the text is underlined
+overstrike: whether the text is overstruck
+"""
+
 
 class Trigger:
     """Single trigger
@@ -147,6 +176,327 @@ def screen_size() -> tuple[int, int]:
     return width, height
 
 
+class TextMetrics:
+    """Cache of text measurement
+
+    Widths of text are measured by `tkinter.font.Font.measure` and cached by (font key, text) with
+    LRU eviction, and line spaces are cached by font key, so measuring the same text again costs
+    only a dictionary lookup instead of a Tcl call. The cache can also be saved to a file and loaded
+    in the next run.
+
+    ATTENTION:
+
+    * The cache only makes sense for the same fonts and the same screen scaling, so don't share the
+    cache file between different machines
+    """
+
+    maxsize: int = 8192
+    """The maximum number of widths that are cached"""
+
+    _widths: collections.OrderedDict[tuple[FontKey, str], int] = collections.OrderedDict()
+    _linespaces: dict[FontKey, int] = {}
+    _fonts: dict[FontKey, tkinter.font.Font] = {}
+
+    layout_maxsize: int = 1024
+    """The maximum number of layouts that are cached"""
+
+    _layouts: collections.OrderedDict[tuple, str] = collections.OrderedDict()
+
+    @staticmethod
+    def get_key(
+        family: str | None = None,
+        fontsize: int | None = None,
+        weight: typing.Literal["normal", "bold"] = "normal",
+        slant: typing.Literal["roman", "italic"] = "roman",
+        underline: bool = False,
+        overstrike: bool = False,
+    ) -> FontKey:
+        """Get the key of a font, which contains all options of `tkinter.font.Font` except its name
+
+        * `family`: font family of the text
+        * `fontsize`: font size of the text
+        * `weight`: weight of the font
+        * `slant`: slant of the font
+        * `underline`: whether the text is underlined
+        * `overstrike`: whether the text is overstruck
+        """
+        if family is None:
+            family = configs.Font.family
+        if fontsize is None:
+            fontsize = configs.Font.size
+        return family, -abs(fontsize), weight, slant, bool(underline), bool(overstrike)
+
+    @classmethod
+    def get_font_key(cls, font: tkinter.font.Font) -> FontKey:
+        """Get the key of an existing font
+
+        * `font`: an instance of `tkinter.font.Font`
+        """
+        options = font.config()
+        return cls.get_key(options["family"], options["size"], options["weight"], options["slant"],
+                           options["underline"], options["overstrike"])
+
+    @classmethod
+    def _get_font(cls, key: FontKey, root: tkinter.Misc | None = None) -> tkinter.font.Font:
+        """Get the font to measure text with, the font is created only once for each key"""
+        if (font := cls._fonts.get(key)) is None:
+            if root is None:
+                root = configs.Env.default_root
+            family, size, weight, slant, underline, overstrike = key
+            font = cls._fonts[key] = tkinter.font.Font(
+                root, family=family, size=size, weight=weight, slant=slant, underline=underline,
+                overstrike=overstrike)
+        return font
+
+    @classmethod
+    def _call(
+        cls,
+        key: FontKey,
+        root: tkinter.Misc | None,
+        method: collections.abc.Callable[[tkinter.font.Font], int],
+    ) -> int:
+        """Call a measuring method of the font, recreate the font if its root has been destroyed"""
+        try:
+            return method(cls._get_font(key, root))
+        except tkinter.TclError:
+            del cls._fonts[key]
+            return method(cls._get_font(key, root))
+
+    @classmethod
+    def _store(cls, key: FontKey, text: str, width: int) -> None:
+        """Store a width and remove the least recently used ones if the cache is full"""
+        cls._widths[key, text] = width
+        while len(cls._widths) > cls.maxsize:
+            cls._widths.popitem(last=False)
+
+    @classmethod
+    def measure(cls, text: str, key: FontKey, *, root: tkinter.Misc | None = None) -> int:
+        """Return the width of a single line of text
+
+        * `text`: the text
+        * `key`: key of the font
+        * `root`: the widget used to create the font if it is needed
+        """
+        if (width := cls._widths.get((key, text))) is not None:
+            cls._widths.move_to_end((key, text))
+            return width
+        width = cls._call(key, root, lambda font: font.measure(text))
+        cls._store(key, text, width)
+        return width
+
+    @classmethod
+    def linespace(cls, key: FontKey, *, root: tkinter.Misc | None = None) -> int:
+        """Return the height of a line of text
+
+        * `key`: key of the font
+        * `root`: the widget used to create the font if it is needed
+        """
+        if (linespace := cls._linespaces.get(key)) is None:
+            linespace = cls._linespaces[key] = cls._call(
+                key, root, lambda font: font.metrics("linespace"))
+        return linespace
+
+    @classmethod
+    def char_widths(
+        cls,
+        text: str,
+        key: FontKey,
+        *,
+        root: tkinter.Misc | None = None,
+    ) -> list[int]:
+        """Return the width of each character of the text
+
+        * `text`: the text
+        * `key`: key of the font
+        * `root`: the widget used to create the font if it is needed
+        """
+        widths = {char: cls.measure(char, key, root=root) for char in set(text)}
+        return list(map(widths.__getitem__, text))
+
+    @classmethod
+    def size(
+        cls,
+        text: str,
+        key: FontKey,
+        *,
+        root: tkinter.Misc | None = None,
+    ) -> tuple[int, int]:
+        """Return the size of the text, which is the same as the size of the bbox of a text item
+
+        * `text`: the text, it can have multiple lines
+        * `key`: key of the font
+        * `root`: the widget used to create the font if it is needed
+        """
+        lines = text.split("\n")
+        width = max(cls.measure(line, key, root=root) for line in lines)
+        return width + 2, cls.linespace(key, root=root)*len(lines)  # 2: border of the bbox
+
+    @classmethod
+    def _prefix(cls, text: str, key: FontKey, root: tkinter.Misc | None) -> list[int]:
+        """Return prefix sums of widths of characters, the first item is 0"""
+        prefix = [0]
+        for width in cls.char_widths(text, key, root=root):
+            prefix.append(prefix[-1] + width)
+        return prefix
+
+    @classmethod
+    def _wrap(
+        cls,
+        text: str,
+        key: FontKey,
+        width: float,
+        root: tkinter.Misc | None,
+    ) -> list[tuple[int, int]]:
+        """Break a single line of text into spans that fit the width, words are kept if possible"""
+        prefix, spans, start = cls._prefix(text, key, root), [], 0
+        while True:
+            end = bisect.bisect_right(prefix, prefix[start] + width) - 1
+            if end >= len(text):
+                spans.append((start, len(text)))
+                return spans
+            if text[end] != " ":
+                if (space := text.rfind(" ", start, end)) > start:
+                    end = space
+                else:  # The word is too long to be kept
+                    end = max(end, start + 1)
+            spans.append((start, len(text[start:end].rstrip(" ")) + start))
+            start = end
+            while start < len(text) and text[start] == " ":
+                start += 1
+            if start == len(text):
+                return spans
+
+    @classmethod
+    def _truncate(
+        cls,
+        text: str,
+        key: FontKey,
+        width: float,
+        ellipsis: typing.Literal["end", "middle"],
+        root: tkinter.Misc | None,
+        *,
+        force: bool = False,
+    ) -> str:
+        """Shorten a single line of text with an ellipsis to fit the width"""
+        prefix = cls._prefix(text, key, root)
+        if not force and prefix[-1] <= width:
+            return text
+        width -= cls.measure("…", key, root=root)
+        if ellipsis == "end":
+            return text[:max(0, bisect.bisect_right(prefix, width) - 1)].rstrip(" ") + "…"
+        low, high = 0, len(text)  # Binary search for the number of characters kept
+        while low < high:
+            count = (low + high + 1) // 2
+            if prefix[(count+1)//2] + prefix[-1] - prefix[len(text)-count//2] <= width:
+                low = count
+            else:
+                high = count - 1
+        return text[:(low+1)//2] + "…" + text[len(text)-low//2:]
+
+    @classmethod
+    def layout(
+        cls,
+        text: str,
+        key: FontKey,
+        width: float,
+        *,
+        wrap: bool = True,
+        max_lines: int | None = None,
+        ellipsis: typing.Literal["end", "middle"] | None = None,
+        root: tkinter.Misc | None = None,
+    ) -> str:
+        """Return the text with line breaks and ellipses that make it fit the width
+
+        * `text`: the text
+        * `key`: key of the font
+        * `width`: the maximum width of lines
+        * `wrap`: whether to break long lines, words are kept if possible
+        * `max_lines`: the maximum number of lines
+        * `ellipsis`: where to put the ellipsis if the text is truncated, `None` means no ellipsis
+        * `root`: the widget used to create the font if it is needed
+        """
+        if max_lines is not None and max_lines < 1:
+            raise ValueError(f"Expected max_lines to be at least 1, got {max_lines}.")
+        cache_key = key, width, text, wrap, max_lines, ellipsis
+        if (result := cls._layouts.get(cache_key)) is not None:
+            cls._layouts.move_to_end(cache_key)
+            return result
+
+        spans: list[tuple[int, int]] = []
+        start = 0
+        for line in text.split("\n"):
+            if wrap:
+                spans.extend((start+i, start+j) for i, j in cls._wrap(line, key, width, root))
+            else:
+                spans.append((start, start+len(line)))
+            start += len(line) + 1
+            if max_lines is not None and len(spans) > max_lines:
+                break
+
+        lines = [text[i:j] for i, j in spans[:max_lines]]
+        if max_lines is not None and len(spans) > max_lines:
+            if ellipsis == "end":
+                lines[-1] = cls._truncate(lines[-1], key, width, "end", root, force=True)
+            elif ellipsis == "middle":
+                rest = text[spans[max_lines-1][0]:].replace("\n", " ")
+                lines[-1] = cls._truncate(rest, key, width, "middle", root, force=True)
+        if ellipsis is not None and not wrap:
+            lines = [cls._truncate(line, key, width, ellipsis, root) for line in lines]
+
+        result = cls._layouts[cache_key] = "\n".join(lines)
+        while len(cls._layouts) > cls.layout_maxsize:
+            cls._layouts.popitem(last=False)
+        return result
+
+    @classmethod
+    def clear(cls) -> None:
+        """Clear the cache"""
+        cls._widths.clear()
+        cls._linespaces.clear()
+        cls._fonts.clear()
+        cls._layouts.clear()
+
+    @classmethod
+    def save(cls, file: str | os.PathLike) -> None:
+        """Save the cache to a JSON file
+
+        * `file`: path of the file
+        """
+        data = {
+            "linespaces": [[*key, value] for key, value in cls._linespaces.items()],
+            "widths": [[*key, text, value] for (key, text), value in cls._widths.items()],
+        }
+        with open(file, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+
+    @classmethod
+    def load(cls, file: str | os.PathLike) -> bool:
+        """Load the cache from a JSON file, and return `True` if the operation succeeds
+
+        * `file`: path of the file
+        """
+        try:
+            with open(file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            for *key, value in data["linespaces"]:
+                cls._linespaces[cls.get_key(*key)] = value
+            for *key, text, value in data["widths"]:
+                cls._store(cls.get_key(*key), text, value)
+        except (OSError, ValueError, KeyError, TypeError):
+            return False
+        return True
+
+    @classmethod
+    def persist(cls, file: str | os.PathLike) -> None:
+        """Load the cache from a file if it exists, and save the cache to it when the program exits
+
+        * `file`: path of the file
+        """
+        if os.path.exists(file):
+            cls.load(file)
+        atexit.register(cls.save, file)
+
+
 def get_text_size(
     text: str,
     fontsize: int | None = None,
@@ -163,25 +513,482 @@ def get_text_size(
     * `family`: font family of the text
     * `padding`: extra padding of the size
     * `master`: default canvas or widget provided
-    * `kwargs`: kwargs of `tkinter.font.Font`
+    * `kwargs`: other options of the font, see `TextMetrics.get_key`, other keywords raise
+    `TypeError`
+
+    TIP:
+
+    The result is measured by `TextMetrics`, so it is cached
+    """
+    while isinstance(master, virtual.Widget):
+        master = master.master
+    key = TextMetrics.get_key(family, fontsize, **kwargs)
+    width, height = TextMetrics.size(text, key, root=master)
+    return 2*padding + width, 2*padding + height
+
+
+class _TkSelector(selectors.BaseSelector):
+    """A selector that waits for the events of Tk instead of sleeping, an asyncio event loop that
+    uses it processes the events of Tk without polling
+
+    The registered files are watched by Tk as well. Tk can not watch files on Windows, so there it
+    wakes up every `interval` seconds while any file is registered.
+    """
+
+    def __init__(self, tk: _tkinter.TkappType, interval: float = 0.01) -> None:
+        """
+        * `tk`: the Tcl interpreter of the main window
+        * `interval`: interval of checking files when Tk can not watch them, in seconds
+        """
+        self._tk = tk
+        self._interval = interval
+        self._selector = selectors.DefaultSelector()
+        self._watch = hasattr(tk, "createfilehandler")
+
+    def register(
+        self,
+        fileobj: int | typing.IO,
+        events: int,
+        data: typing.Any = None,
+    ) -> selectors.SelectorKey:
+        key = self._selector.register(fileobj, events, data)
+        if self._watch:
+            mask = (tkinter.READABLE if events & selectors.EVENT_READ else 0) \
+                | (tkinter.WRITABLE if events & selectors.EVENT_WRITE else 0)
+            self._tk.createfilehandler(key.fd, mask, lambda *_: None)  # Only to wake Tk up
+        return key
+
+    def unregister(self, fileobj: int | typing.IO) -> selectors.SelectorKey:
+        key = self._selector.unregister(fileobj)
+        if self._watch:
+            self._tk.deletefilehandler(key.fd)
+        return key
+
+    def select(self, timeout: float | None = None) -> list[tuple[selectors.SelectorKey, int]]:
+        if not (ready := self._selector.select(0)) and (timeout is None or timeout > 0):
+            if not self._watch and self._selector.get_map():
+                timeout = self._interval if timeout is None else min(timeout, self._interval)
+            timer = None if timeout is None else \
+                self._tk.createtimerhandler(math.ceil(timeout*1000), lambda: None)
+            self._tk.dooneevent(_tkinter.ALL_EVENTS)  # Wait for an event of Tk or a file
+            if timer is not None:
+                timer.deletetimerhandler()
+            ready = self._selector.select(0)
+        # File events are left out, they keep coming until asyncio reads the files
+        while self._tk.dooneevent(_tkinter.WINDOW_EVENTS | _tkinter.TIMER_EVENTS
+                                  | _tkinter.IDLE_EVENTS | _tkinter.DONT_WAIT):
+            pass
+        return ready
+
+    def close(self) -> None:
+        for key in tuple(self._selector.get_map().values()):
+            self.unregister(key.fileobj)
+        self._selector.close()
+
+    def get_map(self) -> collections.abc.Mapping[typing.Any, selectors.SelectorKey]:
+        return self._selector.get_map()
+
+
+def run_async(
+    root: tkinter.Tk,
+    coro: collections.abc.Coroutine | None = None,
+) -> typing.Any:
+    """Run the main window and an asyncio event loop together, it replaces `root.mainloop()`
+
+    It returns when the window is destroyed. The coroutine is cancelled if it is not finished by
+    then, otherwise its result is returned. An exception raised by the coroutine is propagated at
+    once. The event loop waits for the events of Tk while it is idle, so neither side polls the
+    other, except on Windows, where Tk can not watch the files of asyncio.
+
+    * `root`: the main window
+    * `coro`: the coroutine that runs with the window
+    """
+    async def main() -> typing.Any:
+        closed = asyncio.get_running_loop().create_future()
+
+        def _destroy(event: tkinter.Event) -> None:
+            if event.widget is root and not closed.done():
+                closed.set_result(None)
+
+        root.bind("<Destroy>", _destroy, "+")
+        if coro is None:
+            return await closed
+        task = asyncio.ensure_future(coro)
+        await asyncio.wait((closed, task), return_when=asyncio.FIRST_COMPLETED)
+        if not task.done():
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+            return None
+        if task.exception() is not None:
+            return task.result()
+        await closed
+        return task.result()
+
+    loop = asyncio.SelectorEventLoop(_TkSelector(root.tk))
+    try:
+        return loop.run_until_complete(main())
+    finally:
+        try:
+            tasks = asyncio.all_tasks(loop)
+            for task in tasks:
+                task.cancel()
+            loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+            loop.run_until_complete(loop.shutdown_asyncgens())
+        finally:
+            loop.close()
+
+
+class DispatchQueue:
+    """A thread-safe queue of calls that are made in the Tk thread
+
+    Calls can be put from any thread, and they are made in the Tk thread in batches once per frame.
+    Calls with the same key are merged before they are made, only the last one is kept.
+
+    * `depth`: the number of pending calls
+    * `max_depth`: the maximum number of pending calls so far
+    * `merged`: the number of calls that were replaced by later calls with the same key
+    * `dispatched`: the number of calls that were made
+    """
+
+    def __init__(
+        self,
+        master: tkinter.Misc,
+        *,
+        interval: int = 16,
+        batch_size: int = 256,
+    ) -> None:
+        """
+        * `master`: the widget whose thread makes the calls
+        * `interval`: interval of draining the queue, in milliseconds
+        * `batch_size`: the maximum number of calls made in one batch
+        """
+        self.master = master
+        self.interval = interval
+        self.batch_size = batch_size
+        self.max_depth = 0
+        self.merged = 0
+        self.dispatched = 0
+        self._queue: collections.deque[
+            tuple[collections.abc.Hashable | None, collections.abc.Callable | None, tuple]
+        ] = collections.deque()
+        self._keyed: dict[collections.abc.Hashable, tuple[collections.abc.Callable, tuple]] = {}
+        self._lock = threading.Lock()
+        self._after_id: str | None = master.after(interval, self._drain)
+
+    @property
+    def depth(self) -> int:
+        """The number of pending calls"""
+        return len(self._queue)
+
+    def put(
+        self,
+        func: collections.abc.Callable,
+        *args: typing.Any,
+        key: collections.abc.Hashable | None = None,
+    ) -> None:
+        """Put a call into the queue, it can be called from any thread
+
+        * `func`: the function to call
+        * `args`: arguments of the function
+        * `key`: a pending call with the same key is replaced, `None` means it is never replaced
+        """
+        with self._lock:
+            if key is None:
+                self._queue.append((None, func, args))
+            elif key in self._keyed:  # Keep its position in the queue
+                self._keyed[key] = func, args
+                self.merged += 1
+                return
+            else:
+                self._keyed[key] = func, args
+                self._queue.append((key, None, ()))
+            self.max_depth = max(self.max_depth, len(self._queue))
+
+    def _drain(self) -> None:
+        """Make a batch of calls"""
+        calls: list[tuple[collections.abc.Callable, tuple]] = []
+        with self._lock:
+            for _ in range(min(self.batch_size, len(self._queue))):
+                key, func, args = self._queue.popleft()
+                calls.append((func, args) if key is None else self._keyed.pop(key))
+        for func, args in calls:
+            try:
+                func(*args)
+            except Exception as exc:
+                traceback.print_exception(exc)
+        self.dispatched += len(calls)
+        self._after_id = self.master.after(self.interval, self._drain)
+
+    def close(self) -> None:
+        """Stop draining the queue, pending calls are discarded"""
+        if self._after_id is not None:
+            self.master.after_cancel(self._after_id)
+            self._after_id = None
+        with self._lock:
+            self._queue.clear()
+            self._keyed.clear()
+
+
+class FrameLimiter:
+    """Limit the rate of calling a function
+
+    The function is called at most once per frame, calls made in between are merged and only the
+    arguments of the last one are used.
+    """
+
+    def __init__(
+        self,
+        master: tkinter.Misc,
+        func: collections.abc.Callable[..., typing.Any],
+        max_fps: int = 60,
+    ) -> None:
+        """
+        * `master`: the widget that schedules the calls
+        * `func`: the function to call
+        * `max_fps`: the maximum number of calls per second
+        """
+        self.master = master
+        self.func = func
+        self.max_fps = max_fps
+        self._args: tuple | None = None
+        self._after_id: str | None = None
+        self._last: float = -math.inf
+
+    @property
+    def pending(self) -> tuple | None:
+        """Arguments of the call that has not been made yet"""
+        return self._args
+
+    def __call__(self, *args: typing.Any) -> None:
+        """Call the function now if a frame has passed since the last call, otherwise later"""
+        self._args = args
+        if self._after_id is not None:  # The scheduled call will use the new arguments
+            return
+        if (wait := self._last + 1/self.max_fps - time.perf_counter()) <= 0:
+            self.flush()
+        else:
+            self._after_id = self.master.after(math.ceil(wait*1000), self.flush)
+
+    def flush(self) -> None:
+        """Make the pending call now"""
+        if self._after_id is not None:
+            self.master.after_cancel(self._after_id)
+            self._after_id = None
+        if (args := self._args) is None or not self.master.winfo_exists():
+            return
+        self._args = None
+        self._last = time.perf_counter()
+        self.func(*args)
+
+    def cancel(self) -> None:
+        """Discard the pending call"""
+        if self._after_id is not None:
+            self.master.after_cancel(self._after_id)
+            self._after_id = None
+        self._args = None
+
+
+class ProgressReporter:
+    """Report the progress of a task from its process, it is passed to the task as the first
+    argument by `TaskRunner`
+    """
+
+    def __init__(
+        self,
+        queue: typing.Any | None,
+        key: int,
+        event: typing.Any | None = None,
+    ) -> None:
+        """
+        * `queue`: a queue shared by processes, `None` means that the progress is not reported
+        * `key`: the key of the task
+        * `event`: an event shared by processes, which is set when the task is cancelled
+        """
+        self.queue = queue
+        self.key = key
+        self.event = event
+
+    @property
+    def cancelled(self) -> bool:
+        """Whether the task has been cancelled, a long task should check it and return early"""
+        return self.event is not None and self.event.is_set()
+
+    def __call__(self, value: float) -> None:
+        """Report the progress, which is between 0 and 1
+
+        * `value`: the progress
+        """
+        if self.queue is not None:
+            self.queue.put((self.key, value))
+
+
+class Task:
+    """A task submitted to `TaskRunner`"""
+
+    def __init__(
+        self,
+        future: concurrent.futures.Future,
+        reporter: ProgressReporter,
+        *,
+        button: virtual.Widget | None = None,
+        progress: virtual.Widget | None = None,
+        callback: collections.abc.Callable[[typing.Any], typing.Any] | None = None,
+        error: collections.abc.Callable[[BaseException], typing.Any] | None = None,
+    ) -> None:
+        """
+        * `future`: the future of the task
+        * `reporter`: the progress reporter of the task
+        * `button`: the widget that is disabled while the task is running
+        * `progress`: the widget that shows the progress of the task
+        * `callback`: a function that is called with the result of the task
+        * `error`: a function that is called with the exception raised by the task
+        """
+        self.future = future
+        self.reporter = reporter
+        self.button = button
+        self.progress = progress
+        self.callback = callback
+        self.error = error
+        self._cancelled = False
+
+    @property
+    def cancelled(self) -> bool:
+        """Whether the task has been cancelled"""
+        return self._cancelled
+
+    def done(self) -> bool:
+        """Whether the task is finished or cancelled"""
+        return self._cancelled or self.future.done()
+
+    def cancel(self) -> None:
+        """Cancel the task
+
+        A task that has not started is removed from the pool. A running task is asked to stop by
+        `ProgressReporter.cancelled` and its result is ignored. The button is enabled at once.
+        """
+        if self.done():
+            return
+        self._cancelled = True
+        if not self.future.cancel() and self.reporter.event is not None:
+            self.reporter.event.set()
+        if self.button is not None:
+            self.button.disabled(False)
+
+
+class TaskRunner:
+    """Run tasks in a process pool without blocking the Tk thread
+
+    Progress reported by tasks is forwarded to the Tk thread by a background thread, and updates
+    of the same task are merged by the dispatcher of the window, see `DispatchQueue`.
 
     ATTENTION:
 
-    * This function only works when the fontsize is negative number!
+    * Tasks and their arguments must be picklable, so tasks should be functions defined at the
+    top level of a module
     """
-    if family is None:
-        family = configs.Font.family
-    if fontsize is None:
-        fontsize = configs.Font.size
-
-    fontsize = -abs(fontsize)
-    temp_cv = master if master else tkinter.Canvas(configs.Env.default_root)
-    while isinstance(temp_cv, virtual.Widget):
-        temp_cv = temp_cv.master
-    font = tkinter.font.Font(family=family, size=fontsize, **kwargs)
-    item = temp_cv.create_text(-9999, -9999, text=text, font=font)
-    x1, y1, x2, y2 = temp_cv.bbox(item)
-    temp_cv.delete(item)
-    if master is None:
-        temp_cv.destroy()
-    return 2*padding + x2 - x1, 2*padding + y2 - y1
+
+    def __init__(self, master: tkinter.Tk, max_workers: int | None = None) -> None:
+        """
+        * `master`: the main window
+        * `max_workers`: the maximum number of processes, `None` means the number of processors
+        """
+        self.master = master
+        self.max_workers = max_workers
+        self.dispatcher: DispatchQueue = \
+            getattr(master, "dispatcher", None) or DispatchQueue(master)
+        self.tasks: dict[int, Task] = {}
+        self._count = 0
+        self._executor: concurrent.futures.ProcessPoolExecutor | None = None
+        self._manager: typing.Any | None = None
+        self._queue: typing.Any | None = None
+        self._thread: threading.Thread | None = None
+
+    def _start(self) -> None:
+        """Start the process pool and the progress forwarding"""
+        self._executor = concurrent.futures.ProcessPoolExecutor(self.max_workers)
+        self._manager = multiprocessing.Manager()
+        self._queue = self._manager.Queue()
+        self._thread = threading.Thread(target=self._forward, daemon=True)
+        self._thread.start()
+
+    def _forward(self) -> None:
+        """Forward the progress to the Tk thread, it runs in a background thread"""
+        queue = self._queue
+        try:
+            while (item := queue.get()) is not None:
+                key, value = item
+                if (task := self.tasks.get(key)) is not None and task.progress is not None:
+                    self.dispatcher.put(self._report, task, value, key=(id(self), key))
+        except (EOFError, OSError):  # The manager has been shut down
+            pass
+
+    @staticmethod
+    def _report(task: Task, value: float) -> None:
+        """Show the progress of a task"""
+        if not task.done():
+            task.progress.set(value)
+
+    def submit(
+        self,
+        func: collections.abc.Callable[..., typing.Any],
+        *args: typing.Any,
+        button: virtual.Widget | None = None,
+        progress: virtual.Widget | None = None,
+        callback: collections.abc.Callable[[typing.Any], typing.Any] | None = None,
+        error: collections.abc.Callable[[BaseException], typing.Any] | None = None,
+    ) -> Task:
+        """Run a task in the process pool, it is called as `func(reporter, *args)`
+
+        * `func`: the task
+        * `args`: arguments of the task
+        * `button`: the widget that is disabled while the task is running
+        * `progress`: the widget that shows the progress of the task, such as `ProgressBar`
+        * `callback`: a function that is called with the result of the task in the Tk thread
+        * `error`: a function that is called with the exception raised by the task in the Tk
+        thread, `None` means that the exception is printed
+        """
+        if self._executor is None:
+            self._start()
+        self._count += 1
+        reporter = ProgressReporter(
+            self._queue if progress is not None else None, self._count, self._manager.Event())
+        task = Task(self._executor.submit(func, reporter, *args), reporter, button=button,
+                    progress=progress, callback=callback, error=error)
+        self.tasks[self._count] = task
+        if button is not None:
+            button.disabled()
+        task.future.add_done_callback(
+            lambda _, key=self._count: self.dispatcher.put(self._finish, key))
+        return task
+
+    def _finish(self, key: int) -> None:
+        """Handle a finished task in the Tk thread"""
+        task = self.tasks.pop(key)
+        if task.cancelled:
+            return
+        if task.button is not None:
+            task.button.disabled(False)
+        if (exc := task.future.exception()) is not None:
+            if task.error is not None:
+                task.error(exc)
+            else:
+                traceback.print_exception(exc)
+        else:
+            if task.progress is not None:  # The last reports may arrive later
+                task.progress.set(1)
+            if task.callback is not None:
+                task.callback(task.future.result())
+
+    def shutdown(self, *, cancel: bool = True) -> None:
+        """Shut down the process pool
+
+        * `cancel`: whether to cancel unfinished tasks
+        """
+        if cancel:
+            for task in tuple(self.tasks.values()):
+                task.cancel()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=cancel)
+            self._queue.put(None)
+            self._manager.shutdown()
+            self._executor = self._manager = self._queue = self._thread = None